@@ -1,6 +1,11 @@
 # ======================================== IMPORTS ========================================
-from .launcher import run
 from ._version import __version__
 
+# ======================================== LANCEMENT ========================================
+def run():
+    """Lance l'éxécution (le moteur, pygame et pygame_manager ne sont importés qu'ici)"""
+    from .launcher import run as launch
+    launch()
+
 # ======================================== EXPORTS ========================================
 __all__ = ["run"]
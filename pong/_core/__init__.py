@@ -1,6 +1,15 @@
 # ======================================== IMPORTS ========================================
-from .imports import *
 from .utils import *
+from .trail import Trail
+
+_FRAMEWORK = ("ctx", "pygame", "pm", "Optional", "Iterable", "TYPE_CHECKING", "Path", "Real")
+
+def __getattr__(name: str):
+    """Import différé de pygame et pygame_manager : get_path et Trail restent utilisables sans interface"""
+    if name in _FRAMEWORK:
+        from . import imports
+        return getattr(imports, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ======================================== EXPORTS ========================================
 __all__ = [
@@ -15,4 +24,6 @@ __all__ = [
 
     "get_path",
     "get_folder",
+
+    "Trail",
 ]
\ No newline at end of file
@@ -0,0 +1,106 @@
+# ======================================== IMPORTS ========================================
+from __future__ import annotations
+from array import array
+from typing import Iterator
+import math
+
+# ======================================== CONSTANTES ========================================
+MAX_FPS = 240                   # (int): cadence d'affichage maximale prise en compte pour dimensionner les traînées
+
+# ======================================== TRAINEE ========================================
+class Trail:
+    """
+    Traînée d'une balle en tampon circulaire de capacité fixe
+
+    Les points (instant, x, y) sont rangés dans trois tableaux de flottants parallèles entre
+    les indices tail (plus ancien) et head (prochain emplacement) : ajout et expiration en O(1),
+    sans allocation par frame. Au-delà de la capacité, les points les plus anciens sont écrasés.
+    """
+    __slots__ = ("length", "capacity", "times", "xs", "ys", "head", "tail", "count", "timer")
+
+    def __init__(self, length: float, max_fps: int = MAX_FPS):
+        """
+        Args:
+            length (float): durée de la traînée en secondes
+            max_fps (int): cadence maximale (un point par frame)
+        """
+        self.length = length
+        self.capacity = max(2, math.ceil(length * max_fps) + 1)
+        self.times = array("d", bytes(8 * self.capacity))
+        self.xs = array("d", bytes(8 * self.capacity))
+        self.ys = array("d", bytes(8 * self.capacity))
+        self.head = 0
+        self.tail = 0
+        self.count = 0
+        self.timer = 0.0
+
+    # ======================================== ACTUALISATION ========================================
+    def push(self, dt: float, x: float, y: float):
+        """
+        Ajoute la position de la frame et retire les points plus anciens que length
+
+        Args:
+            dt (float): durée de la frame en secondes
+            x, y (float): position du centre de la balle
+        """
+        timer = self.timer = self.timer + dt
+        head, tail, count, capacity = self.head, self.tail, self.count, self.capacity
+        self.times[head] = timer
+        self.xs[head] = x
+        self.ys[head] = y
+        head += 1
+        if head == capacity:
+            head = 0
+        if count == capacity:
+            tail = head
+        else:
+            count += 1
+
+        # Expiration
+        times, length = self.times, self.length
+        while count and timer - times[tail] > length:
+            tail += 1
+            if tail == capacity:
+                tail = 0
+            count -= 1
+        self.head, self.tail, self.count = head, tail, count
+
+    # ======================================== LECTURE ========================================
+    def __len__(self) -> int:
+        """Nombre de points de la traînée"""
+        return self.count
+
+    def __getitem__(self, i: int) -> tuple[float, float]:
+        """Renvoie la position du i-ème point, du plus ancien au plus récent"""
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        i = (self.tail + i) % self.capacity
+        return self.xs[i], self.ys[i]
+
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        """Parcourt les positions du plus ancien au plus récent"""
+        xs, ys, capacity = self.xs, self.ys, self.capacity
+        for i in range(self.tail, self.tail + self.count):
+            i %= capacity
+            yield xs[i], ys[i]
+
+    # ======================================== SERIALISATION ========================================
+    def to_list(self) -> list[tuple[float, float, float]]:
+        """Renvoie les points (instant, x, y) du plus ancien au plus récent"""
+        times, xs, ys, capacity = self.times, self.xs, self.ys, self.capacity
+        return [(times[i % capacity], xs[i % capacity], ys[i % capacity]) for i in range(self.tail, self.tail + self.count)]
+
+    def load(self, points: list):
+        """
+        Remplace la traînée par des points (instant, x, y) reçus
+
+        Args:
+            points (list): points du plus ancien au plus récent (les plus anciens sont ignorés au-delà de la capacité)
+        """
+        points = points[-self.capacity:]
+        for i, (t, x, y) in enumerate(points):
+            self.times[i], self.xs[i], self.ys[i] = t, x, y
+        self.tail = 0
+        self.count = len(points)
+        self.head = self.count % self.capacity
+        self.timer = points[-1][0] if points else 0.0
@@ -1,5 +1,5 @@
 # ======================================== IMPORTS ========================================
-from .imports import *
+from pathlib import Path
 import sys
 
 # ======================================== METHODES GLOBALES ========================================
@@ -1,2 +1,10 @@
-from .state import Game
-__all__ = ["Game"]
\ No newline at end of file
+# ======================================== IMPORTS ========================================
+def __getattr__(name: str):
+    """Import différé de l'état de jeu (pygame) : le cœur _sim reste importable sans interface"""
+    if name == "Game":
+        from .state import Game
+        return Game
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# ======================================== EXPORTS ========================================
+__all__ = ["Game"]
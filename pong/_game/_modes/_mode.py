@@ -1,10 +1,34 @@
 # ======================================== IMPORTS ========================================
 from ..._core import ctx, pm, pygame
 from .._objects import Ball, Paddle
+from .._sim import SimConfig, SimClock, MatchState, reset_round, step
+
+# ======================================== ETAT PARTAGE ========================================
+class _Shared:
+    """Attribut du mode délégué à l'état de simulation (self.state)"""
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        return self if obj is None else getattr(obj.state, self.name)
+
+    def __set__(self, obj, value):
+        setattr(obj.state, self.name, value)
 
 # ======================================== MODE DE JEU ========================================
 class Mode(pm.states.State):
     """Mode de jeu"""
+    frozen = _Shared()          # jeu en gêle
+    paused = _Shared()          # jeu en pause
+    ended = _Shared()           # menu de fin de partie
+    next_round = _Shared()      # en attente du prochain round
+    score_limit = _Shared()     # score à atteindre
+    score_0 = _Shared()         # score côté gauche (None : mur)
+    score_1 = _Shared()         # score côté droit (None : mur)
+    winner = _Shared()          # côté vainqueur
+
+    SIM_RATE = 240              # (int): fréquence de la simulation en Hz, indépendante de l'affichage
+
     def __init__(self, name: str, max_players: int = 2):
         """
         Args:
@@ -21,6 +45,10 @@ class Mode(pm.states.State):
         # Pannel de vue
         self.view: pm.types.Panel = pm.panels["game_view"]
 
+        # État de simulation (balle, raquettes, scores, drapeaux) et horloge à pas fixe
+        self.state: MatchState = MatchState(mode=self.name)
+        self.clock: SimClock = SimClock(rate=self.SIM_RATE)
+
         # Balle
         self.ball: Ball = None
 
@@ -36,17 +64,8 @@ class Mode(pm.states.State):
         self.max_players: int = max_players
 
         # Paramètres dynamiques
-        self.frozen: bool = False           # jeu en gêle
-        self.paused: bool = False           # jeu en pause
-        self.ended: bool = False            # menu de fin de partie
         self.end_done: bool = False         # Fin déjà traitée
-        self.next_round: bool = False       # en attente du prochain round
         self.next_round_done: bool = False # attente du prochain round traitée
-
-        self.score_limit: int = 3
-        self.score_0: int = 0
-        self.score_1: int = 0
-        self.winner: int = None
     
     def __str__(self) -> str:
         """Renvoie le nom du mode"""
@@ -56,26 +75,28 @@ class Mode(pm.states.State):
     def on_enter(self):
         """Lancement d'une partie"""
         # Paramètres
-        self.frozen: bool = False
-        self.paused: bool = False
-        self.ended: bool = False
         self.end_done: bool = False
-        self.next_round: bool = False
 
-        self.score_limit: int = ctx.modifiers["score_limit"]
-        self.score_0: int = 0
-        self.score_1: int = 0
-        self.winner: int = None
+        # État de simulation (scores à zéro, drapeaux levés)
+        config = SimConfig.from_properties(
+            ctx.modifiers.get_by_category("ball", remove_prefix=True),
+            ctx.modifiers.get_by_category("paddle", remove_prefix=True),
+            self.view.width,
+            self.view.height,
+        )
+        self.state = MatchState(config, mode=self.name, p1_side=ctx.modifiers["p1_side"], score_limit=ctx.modifiers["score_limit"])
+        reset_round(self.state)
+        self.clock.reset()
 
         # Balle
         if self.ball is not None: self.ball.kill()
-        self.ball = Ball(self.is_end)
+        self.ball = Ball(self.state)
 
         # Raquettes
         if self.paddle_0 is not None: self.paddle_0.kill()
-        self.paddle_0 = Paddle(side=0)
+        self.paddle_0 = Paddle(self.state, side=0)
         if self.paddle_1 is not None: self.paddle_1.kill()
-        self.paddle_1 = Paddle(side=1)
+        self.paddle_1 = Paddle(self.state, side=1)
 
         # Association
         self.player_1 = getattr(self, f'paddle_{ctx.modifiers["p1_side"]}')
@@ -95,6 +116,8 @@ class Mode(pm.states.State):
     # ======================================== METHODES DYNAMIQUES ========================================
     def reset(self):
         """Prépartion des positions"""
+        reset_round(self.state)
+        self.clock.reset()
         self.ball.reset()
         self.paddle_0.reset()
         self.paddle_1.reset()
@@ -119,16 +142,45 @@ class Mode(pm.states.State):
         if self.paused:
             pass
         elif self.frozen and self.next_round_done:
-            pass
+            self.simulate(pm.time.dt)
         elif self.ended:
             self.end()
         elif self.next_round:
             self.reset()
             self.start()
+        elif self.playing:
+            self.simulate(pm.time.dt)
+
+    def simulate(self, dt: float):
+        """
+        Avance la simulation par pas fixes puis affiche les positions interpolées
+
+        Args:
+            dt (float): durée réelle de la frame en secondes
+        """
+        self.state.authoritative = self.is_authoritative()
+        entities = (self.ball, self.paddle_0, self.paddle_1)
+        inputs = (self.paddle_0.direction, self.paddle_1.direction)
+
+        steps = self.clock.advance(dt)
+        for _ in range(steps):
+            for entity in entities:
+                entity.remember()
+            for event in step(self.state, inputs, self.clock.dt):
+                pm.audio.play_sound(event)
+            if self.state.next_round or self.state.ended:
+                self.clock.reset()
+                break
+
+        # Les directions demandées restent actives jusqu'au prochain pas effectué
+        if steps:
+            self.paddle_0.direction = self.paddle_1.direction = 0
+        for entity in entities:
+            entity.sync(self.clock.alpha)
         
     # ======================================== FIN ========================================
-    def is_end(self):
-        """Vérifie la fin de partie après la collision d'un mur vertical"""
+    def is_authoritative(self) -> bool:
+        """Vérifie que cette instance décide des buts (faux pour un client en ligne connecté)"""
         if ctx.game.current_session.name == "online" and (not ctx.game.current_session._is_host and ctx.game.current_session._connected):
             return False
         return True
@@ -150,7 +202,7 @@ class Mode(pm.states.State):
     @property
     def playing(self):
         """Vérifie que la partie soit en cours"""
-        return not (self.frozen or self.paused or self.ended)
+        return self.state.playing
 
     def p1_move_up(self):
         """Déplacement vers le haut du joueur 1"""
@@ -171,19 +223,19 @@ class Mode(pm.states.State):
     def to_dict(self, *filters) -> dict:
         """Sérialise l'état de la partie"""
         game_dict =  {
-            "ball_x": self.ball.x,
-            "ball_y": self.ball.y,
+            "ball_x": self.state.ball.x,
+            "ball_y": self.state.ball.y,
             "ball_celerity": self.ball.celerity,
             "ball_angle": self.ball.angle,
-            "ball_trail": self.ball.trail,
-            "paddle_0_x": self.paddle_0.x if self.paddle_0 else None,
-            "paddle_0_y": self.paddle_0.y if self.paddle_0 else None,
-            "paddle_1_x": self.paddle_1.x if self.paddle_1 else None,
-            "paddle_1_y": self.paddle_1.y if self.paddle_1 else None,
-            "player_1_x": self.player_1.x if self.player_1 else None,
-            "player_1_y": self.player_1.y if self.player_1 else None,
-            "player_2_x": self.player_2.x if self.player_2 else None,
-            "player_2_y": self.player_2.y if self.player_2 else None,
+            "ball_trail": self.ball.trail.to_list(),
+            "paddle_0_x": self.paddle_0.state.x if self.paddle_0 else None,
+            "paddle_0_y": self.paddle_0.state.y if self.paddle_0 else None,
+            "paddle_1_x": self.paddle_1.state.x if self.paddle_1 else None,
+            "paddle_1_y": self.paddle_1.state.y if self.paddle_1 else None,
+            "player_1_x": self.player_1.state.x if self.player_1 else None,
+            "player_1_y": self.player_1.state.y if self.player_1 else None,
+            "player_2_x": self.player_2.state.x if self.player_2 else None,
+            "player_2_y": self.player_2.state.y if self.player_2 else None,
             "game_score_0": self.score_0,
             "game_score_1": self.score_1,
             "game_winner": self.winner,
@@ -203,26 +255,31 @@ class Mode(pm.states.State):
 
         # Balle
         if self.ball and ball:
-            self.ball.x = data.get("ball_x", self.ball.x)
-            self.ball.y = data.get("ball_y", self.ball.y)
+            self.state.ball.x = data.get("ball_x", self.state.ball.x)
+            self.state.ball.y = data.get("ball_y", self.state.ball.y)
             self.ball.celerity = data.get("ball_celerity", self.ball.celerity)
             self.ball.angle = data.get("ball_angle", self.ball.angle)
-            self.ball.trail = data.get("ball_trail", self.ball.trail)
+            if "ball_trail" in data:
+                self.ball.trail.load(data["ball_trail"])
+            self.ball.sync()
 
         # Paddle 0
         if self.paddle_0 and paddle_0:
-            self.paddle_0.x = data.get("paddle_0_x", self.paddle_0.x)
-            self.paddle_0.y = data.get("paddle_0_y", self.paddle_0.y)
+            self.paddle_0.state.x = data.get("paddle_0_x", self.paddle_0.state.x)
+            self.paddle_0.state.y = data.get("paddle_0_y", self.paddle_0.state.y)
+            self.paddle_0.sync()
 
         # Paddle 1
         if self.paddle_1 and paddle_1:
-            self.paddle_1.x = data.get("paddle_1_x", self.paddle_1.x)
-            self.paddle_1.y = data.get("paddle_1_y", self.paddle_1.y)
+            self.paddle_1.state.x = data.get("paddle_1_x", self.paddle_1.state.x)
+            self.paddle_1.state.y = data.get("paddle_1_y", self.paddle_1.state.y)
+            self.paddle_1.sync()
         
         # Ennemy
         if self.player_2 and ennemy:
-            self.player_2.x = data.get("player_1_x", self.player_2.x)
-            self.player_2.y = data.get("player_1_y", self.player_2.y)
+            self.player_2.state.x = data.get("player_1_x", self.player_2.state.x)
+            self.player_2.state.y = data.get("player_1_y", self.player_2.state.y)
+            self.player_2.sync()
 
         # Partie
         if game:
@@ -25,17 +25,6 @@ class Classic(Mode):
         super().update()
 
     # ======================================== FIN ========================================
-    def is_end(self, side: int):
-        """Vérifie la fin de partie"""
-        if not super().is_end(): return False
-        if side == 0: self.score_1 += 1
-        else: self.score_0 += 1
-        if self.score_0 >= self.score_limit or self.score_1 >= self.score_limit:
-            self.winner = 1 - side
-            self.ended = True
-        self.next_round = True
-        return True
-
     def end(self):
         """Fin de partie"""
         player_winner = getattr(self, f'paddle_{self.winner}', self.paddle_0).get_player()
@@ -19,28 +19,12 @@ class Wall(Mode):
         # Sessions conformes
         self.allowed_sessions = ["solo"]
 
-    # ======================================== LANCEMENT ========================================
-    def on_enter(self):
-        """Activation de l'état"""
-        super().on_enter()
-        setattr(self, f"score_{1 - ctx.modifiers.get('p1_side')}", None)
-
     # ======================================== ACTUALISATION ========================================
     def update(self):
         """Actualisation par frame"""
         super().update()
 
     # ======================================== FIN ========================================
-    def is_end(self, side: int):
-        """Vérifie la fin de partie"""
-        player_side = ctx.modifiers['p1_side']
-        if side == player_side and super().is_end():
-            self.ended = True
-            return True
-        if player_side == 0: self.score_0 += 1
-        else: self.score_1 += 1
-        return False
-
     def end(self):
         """Fin de partie"""
         text = pm.languages("game_results_score", score=getattr(self, f'score_{ctx.modifiers["p1_side"]}', 0))
@@ -1,18 +1,14 @@
 # ======================================== IMPORTS ========================================
 from __future__ import annotations
-from ..._core import ctx, pm, pygame, TYPE_CHECKING
-import math
-import random
-
-if TYPE_CHECKING:
-    from ._paddle import Paddle
+from ..._core import ctx, pm, pygame, Trail
+from .._sim import BallState, MatchState
 
 # ======================================== OBJET ========================================
 class Ball(pm.entities.CircleEntity):
     """
-    Balle
+    Balle (affichage de l'état de simulation de la partie)
     """
-    def __init__(self, check_end: callable):
+    def __init__(self, match: MatchState):
         # Panel de vue
         self.view: pm.typeS.Panel = pm.panels["game_view"]
 
@@ -26,8 +22,9 @@ class Ball(pm.entities.CircleEntity):
         self.border_color: tuple[int, int, int] = (120, 120, 120)
         self.border_around: bool = True
 
-        # Fonction de vérification de fin de partie
-        self.check_end: callable = check_end
+        # État de simulation (position, angle, vitesse)
+        self.match: MatchState = match
+        self.state: BallState = match.ball
 
         # Seconde intialisation
         self.init()
@@ -35,63 +32,42 @@ class Ball(pm.entities.CircleEntity):
     def init(self):
         """Initialisaiton des constantes"""
         # position
-        self.center = self.view.center
         self.radius = self["radius"]
+        self.sync()
 
         # Traînée        
-        self.trail: list[tuple] = []
-        self.trail_timer = 0.0
-
-        # Angle
-        self.disabled_side: str = random.choice(("left", "right")) if ctx.modes.selected != 1 else "right"
-        self.angle: float = math.radians((random.randint(self["angle_min"], self["angle_max"]) if self.disabled_side == "left" else random.randint(180 - self["angle_max"], 180 - self["angle_min"])) * random.choice((-1, 1)))
-        self.angle_min: float = math.radians(self["angle_min"])
-        self.angle_max: float = math.radians(self["angle_max"])
-        self.bouncing_epsilon: float = math.radians(self["bouncing_epsilon"]) # bruit dans le rebond
-
-        # Déplacement
-        self.celerity: float = self["celerity_min"]
+        self.trail: Trail = Trail(self["trail_length"])
 
     # ======================================== ACTUALISATION ========================================
     def update(self) -> None | int:
         """
-        Actualisation de la frame
+        Actualisation de la frame (la physique est avancée par le mode de jeu)
         """
         # Partie en cours
-        mode = pm.states.get_object(pm.states.get_active_by_layer(2))
-        if not mode.playing:
+        if not self.match.playing:
             return
 
-        # Détermination du côté
-        side = int(self.centerx // (0.5 * self.view.width))
-        side_paddle: Paddle = getattr(mode, f'paddle_{side}')
-        if getattr(mode, 'max_players', 2) == 1 and side != ctx.modifiers.get("p1_side"): side_paddle = None
-
         # Trainée
-        self.trail_timer += pm.time.dt
-        self.trail.append((self.trail_timer, self.centerx, self.centery))
-        while len(self.trail) > 0 and self.trail_timer - self.trail[0][0] > self["trail_length"]:
-            self.trail.pop(0)
-
-        # Vitesse croissante
-        self.celerity = min(self.celerity + pm.time.scale_value((self["celerity_max"] - self["celerity_min"]) / self["acceleration_duration"]), self["celerity_max"])
-        celerity = pm.time.scale_value(self.celerity)
-
-        # Déplacement
-        pos_0 = pm.geometry.Point(*self.center)
-        self.centerx += self.dx * celerity
-        self.centery += self.dy * celerity
-        pos_1 = pm.geometry.Point(*self.center)
-
-        # Collision contre les raquettes
-        if side_paddle is not None:
-            self.collidepaddle(side_paddle, pos_0, pos_1)
-
-        # Collision avec les murs horizontaux
-        self.collidehorizontal()
-
-        # Collision avec les murs verticaux
-        self.collidevertical()
+        self.trail.push(pm.time.dt, self.centerx, self.centery)
+
+    def remember(self):
+        """Mémorise la position simulée avant un pas de simulation"""
+        self.previous = (self.state.x, self.state.y)
+
+    def sync(self, alpha: float | None = None):
+        """
+        Recopie la position simulée sur l'entité affichée
+
+        Args:
+            alpha (float | None): fraction de pas écoulée depuis le dernier état simulé (None : sans interpolation)
+        """
+        x, y = self.state.x, self.state.y
+        if alpha is None:
+            self.previous = (x, y)
+        else:
+            x0, y0 = self.previous
+            x, y = x0 + (x - x0) * alpha, y0 + (y - y0) * alpha
+        self.center = (x, y)
     
     def draw_behind(self, surface: pygame.Surface):
         """affichage derrière la balle"""
@@ -106,7 +82,6 @@ class Ball(pm.entities.CircleEntity):
             return
         
         for i, pos in enumerate(self.trail):
-            pos = pos[1:]
             advancement = (i + 1) / len(self.trail)
             color = tuple(int(self["trail_color"][j] * advancement + self.view.background_color[j] * (1 - advancement)) for j in range(3))
             radius = max(1, int(self.radius * (advancement ** 0.75)) * 0.9)
@@ -121,11 +96,11 @@ class Ball(pm.entities.CircleEntity):
         current_pos = (self.centerx, self.centery)
         for i in range(num_segments):
             if i == num_segments - 1:
-                start_pos = self.trail[i][1:]
+                start_pos = self.trail[i]
                 end_pos = current_pos
             else:
-                start_pos = self.trail[i][1:]
-                end_pos = self.trail[i + 1][1:]
+                start_pos = self.trail[i]
+                end_pos = self.trail[i + 1]
 
             subdivisions = 5
             for j in range(subdivisions):
@@ -147,15 +122,35 @@ class Ball(pm.entities.CircleEntity):
             return self.properties[name]
         raise AttributeError(name)
 
+    @property
+    def celerity(self) -> float:
+        """Renvoie la vitesse en px/s"""
+        return self.state.celerity
+
+    @celerity.setter
+    def celerity(self, value: float):
+        """Fixe la vitesse en px/s"""
+        self.state.celerity = value
+
+    @property
+    def angle(self) -> float:
+        """Renvoie l'angle de déplacement en radians"""
+        return self.state.angle
+
+    @angle.setter
+    def angle(self, value: float):
+        """Fixe l'angle de déplacement en radians"""
+        self.state.angle = value
+
     @property
     def dx(self):
         """Renvoie la composante x du vecteur déplacement normalisé"""
-        return math.cos(self.angle)
+        return self.state.dx
     
     @property
     def dy(self):
         """Renvoie la composante y du vecteur déplacement normalisé"""
-        return -math.sin(self.angle)
+        return self.state.dy
     
     def get_vect(self):
         """Renvoie le vecteur déplacement normalisé"""
@@ -163,81 +158,5 @@ class Ball(pm.entities.CircleEntity):
 
     # ======================================== METHODES DYNAMIQUES ========================================
     def reset(self):
-        """Remise à zéro de la position"""
+        """Remise à zéro de l'affichage (la balle est replacée par reset_round)"""
         self.init()
-
-    def bounce(self, normal: pm.types.VectorObject):
-        """
-        Fait rebondir la balle
-
-        Args:
-            normal (pm.types.VectorObject) : vect normal extérieur (radians)
-        """
-        # Réflexion vectorielle
-        vector = self.get_vect()
-        dot = vector @ normal
-        if dot >= 0: return
-        vector -= 2 * (vector @ normal) * normal
-        vector.normalize()
-
-        # Calcul du nouvel angle
-        angle = math.atan2(-vector.y, vector.x)
-        angle = (angle + math.pi) % (2 * math.pi) - math.pi
-
-        # Clamp
-        sign = 1 if angle >= 0 else -1
-        abs_angle = abs(angle)
-        if abs_angle > math.pi / 2: abs_angle = min(math.pi - self.angle_min, max(math.pi - self.angle_max, abs_angle))
-        else: abs_angle = min(self.angle_min, max(self.angle_max, abs_angle))
-        abs_angle += random.uniform(0, self.bouncing_epsilon)
-        self.angle = sign * abs_angle
-
-        # Son
-        pm.audio.play_sound("bounce")
-
-    def collidepaddle(self, paddle: Paddle, p0: pm.types.PointObject, p1: pm.types.PointObject): 
-        """
-        Vérifie si déplacement de la balle rencontre une raquette
-
-        Args:
-            p0 (pm.geometry.Point) : position initiale
-            p1 (pm.geometry.Point) : position finale
-        """
-        if paddle.cooldown > 0:
-            return
-        if abs(self.centerx - self.view.centerx) + self.radius >= abs(paddle.centerx - self.view.centerx) - paddle.width / 2:
-            line = pm.geometry.Line(p0, p1 - p0)
-
-            rect_inflation = 2 * self.radius
-            rect = pm.geometry.Rect(point=(0, 0), width=paddle.width + rect_inflation, height=paddle.height + rect_inflation, border_radius=paddle.border_radius)
-            rect.center = paddle.center
-
-            intersections = rect._line_intersection(line)
-            if intersections:
-                I = min(intersections, key=lambda P: p0.distance(P))
-                self.center = I
-                normal: pm.types.VectorObject = pm.geometry.Circle(I, self.radius).rect_collision_normal(paddle.rect)
-                self.bounce(normal)
-                paddle.collision()
-    
-    def collidehorizontal(self):
-        """Vérifie la collision avec les murs horizontaux"""
-        self.centery = min(max(self.centery, self.radius), self.view.height - self.radius)
-        if self.top <= 0:
-            self.bounce(pm.geometry.Vector(0, 1))
-        elif self.bottom >= self.view.height:
-            self.bounce(pm.geometry.Vector(0, -1))
-    
-    def collidevertical(self):
-        """Vérifie la collision avec les murs verticaux"""
-        self.centerx = min(max(self.centerx, self.radius), self.view.width - self.radius)
-        if self.left <= 0:
-            if not self.check_end(0):
-                self.bounce(pm.geometry.Vector(1, 0))
-            else:
-                pm.audio.play_sound("goal")
-        elif self.right >= self.view.width:
-            if not self.check_end(1):
-                self.bounce(pm.geometry.Vector(-1, 0))
-            else:
-                pm.audio.play_sound("goal")
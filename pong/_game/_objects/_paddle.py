@@ -1,19 +1,23 @@
 # ======================================== IMPORTS ========================================
 from ..._core import ctx, pm
+from .._sim import PaddleState, MatchState
 
 # ======================================== OBJET ========================================
 class Paddle(pm.entities.RectEntity):
     """
-    Raquette d'une joueur
+    Raquette d'une joueur (affichage de l'état de simulation de la partie)
     """
-    OFFSET = 50
-    def __init__(self, side: int = 0, player: int = 1, status: str = None):
+    def __init__(self, match: MatchState, side: int = 0, player: int = 1, status: str = None):
         # Panel de vue
         self.view: pm.types.Panel = pm.panels["game_view"]
 
         # Propriétés
         self.properties: dict = ctx.modifiers.get_by_category("paddle", remove_prefix=True)
 
+        # État de simulation (position, vitesse, délai de renvoi)
+        self.match: MatchState = match
+        self.state: PaddleState = match.paddles[side]
+
         # Statut
         self.available_status = ('player', 'friend', 'ennemy')
         self.side = side
@@ -21,11 +25,7 @@ class Paddle(pm.entities.RectEntity):
         self.status = status
 
         # Initialisation de l'entité
-        super().__init__(0, 0, self["size"] / 6, self["size"], self["border_radius"], zorder=2, panel="game_view")
-        self.sides_center: dict = {
-            0: (self.OFFSET, self.view.centery),
-            1: (self.view.width - self.OFFSET, self.view.centery)
-        }
+        super().__init__(0, 0, self.state.width, self.state.height, self.state.border_radius, zorder=2, panel="game_view")
 
         # Design
         self.border = True
@@ -39,40 +39,46 @@ class Paddle(pm.entities.RectEntity):
     def init(self):
         """Initialisation des constantes"""
         # Position
-        self.center = self.sides_center.get(self.side, self.sides_center[0])
-
-        # Déplacement
-        self.celerity: int = 700
+        self.sync()
 
-        # Paramètres dynamiques
-        self.cooldown: float = 0
+        # Direction demandée pour les prochains pas de simulation (-1 haut, 0, +1 bas)
+        self.direction: int = 0
 
     # ======================================== ACTUALISATION ========================================
     def update(self):
-        """Actualisation de la frame"""
-        mode = pm.states.get_object(pm.states.get_active_by_layer(2))
-        if not mode.playing:
-            return
-
-        # Actualisation du cooldown
-        self.cooldown = max(0, self.cooldown - pm.time.dt)
+        """Actualisation de la frame (le délai de renvoi est décompté par la simulation)"""
+
+    def remember(self):
+        """Mémorise la position simulée avant un pas de simulation"""
+        self.previous = (self.state.x, self.state.y)
+
+    def sync(self, alpha: float | None = None):
+        """
+        Recopie la position simulée sur l'entité affichée
+
+        Args:
+            alpha (float | None): fraction de pas écoulée depuis le dernier état simulé (None : sans interpolation)
+        """
+        x, y = self.state.x, self.state.y
+        if alpha is None:
+            self.previous = (x, y)
+        else:
+            x0, y0 = self.previous
+            x, y = x0 + (x - x0) * alpha, y0 + (y - y0) * alpha
+        self.center = (x, y)
     
     # ======================================== METHODES DYNAMIQUES ========================================
     def reset(self):
-        """Remise à zéro"""
+        """Remise à zéro de l'affichage (la raquette est replacée par reset_round)"""
         self.init()
 
     def move_up(self):
-        """Se dirige vers le haut"""
-        super().move_up(pm.time.scale_value(self.celerity), min=0)
+        """Se dirige vers le haut (appliqué aux prochains pas de simulation)"""
+        self.direction = -1
     
     def move_down(self):
-        """Se dirige vers le bas"""
-        super().move_down(pm.time.scale_value(self.celerity), max=(self.view.height - self.height))
-
-    def collision(self):
-        """Fixe un cooldown avant le prochain rebond"""
-        self.cooldown = 0.1
+        """Se dirige vers le bas (appliqué aux prochains pas de simulation)"""
+        self.direction = 1
 
     # ======================================== GETTERS ========================================
     def __getitem__(self, name: str):
@@ -81,6 +87,11 @@ class Paddle(pm.entities.RectEntity):
             return self.properties[name]
         raise AttributeError(name)
     
+    @property
+    def cooldown(self) -> float:
+        """Renvoie le délai restant avant le prochain renvoi"""
+        return self.state.cooldown
+
     def get_side(self) -> int:
         """Renvoie le côté"""
         return self.side
@@ -97,6 +108,8 @@ class Paddle(pm.entities.RectEntity):
     def set_side(self, side: int):
         """Fixe le côté"""
         self.side = side
+        self.state = self.match.paddles[side]
+        self.sync()
 
     def set_player(self, player: int):
         """Fixe le joueur"""
@@ -1,8 +1,13 @@
 # ======================================== IMPORTS ========================================
-from ._session import Session
-from .solo import Solo
-from .local import Local
-from .online import Online
+from importlib import import_module
+
+_SESSIONS = {"Session": "._session", "Solo": ".solo", "Local": ".local", "Online": ".online"}
+
+def __getattr__(name: str):
+    """Import différé des sessions (pygame) : les modules des bots restent importables sans interface"""
+    if name in _SESSIONS:
+        return getattr(import_module(_SESSIONS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ======================================== IMPORTS ========================================
-__all__ = ["Session", "Solo", "Local", "Online"]
\ No newline at end of file
+__all__ = ["Session", "Solo", "Local", "Online"]
@@ -0,0 +1,184 @@
+# ======================================== IMPORTS ========================================
+from __future__ import annotations
+from typing import Callable
+import queue
+import time
+import numpy as np
+import torch
+import torch.multiprocessing as tmp
+
+# ======================================== POIDS PARTAGES ========================================
+class SharedWeights:
+    """
+    Copie versionnée des poids du learner en mémoire partagée
+
+    Le learner publie périodiquement ses poids, les acteurs les rechargent dès que la version change.
+    """
+    def __init__(self, net: torch.nn.Module, ctx):
+        """
+        Args:
+            net (nn.Module): réseau du learner
+            ctx: contexte multiprocessing
+        """
+        self.tensors = {k: v.detach().cpu().clone().share_memory_() for k, v in net.state_dict().items()}
+        self.version = ctx.Value("q", 0)
+        self.lock = ctx.Lock()
+
+    def publish(self, net: torch.nn.Module):
+        """Copie les poids courants du learner dans la mémoire partagée"""
+        with self.lock:
+            for k, v in net.state_dict().items():
+                self.tensors[k].copy_(v.detach())
+            self.version.value += 1
+
+    def pull(self, net: torch.nn.Module) -> int:
+        """
+        Charge les poids partagés dans le réseau local d'un acteur
+
+        Returns:
+            Version des poids chargés
+        """
+        with self.lock:
+            net.load_state_dict(self.tensors)
+            return self.version.value
+
+    def changed(self, version: int) -> bool:
+        """Vérifie si une version plus récente a été publiée"""
+        return self.version.value != version
+
+# ======================================== TRANSITIONS PARTAGEES ========================================
+class SharedTransitions:
+    """
+    Anneaux de transitions en mémoire partagée, un par acteur
+
+    Chaque anneau n'a qu'un producteur (l'acteur) et qu'un consommateur (le learner).
+    Si le learner prend du retard, les transitions les plus anciennes sont écrasées.
+    """
+    def __init__(self, n_actors: int, slots: int, width: int, ctx):
+        """
+        Args:
+            n_actors (int): nombre d'acteurs
+            slots (int): nombre de lignes par anneau
+            width (int): nombre de flottants par transition
+            ctx: contexte multiprocessing
+        """
+        self.n_actors = n_actors
+        self.slots = slots
+        self.width = width
+        self.data = torch.zeros((n_actors, slots, width), dtype=torch.float32).share_memory_()
+        self.written = ctx.Array("q", n_actors, lock=False)
+        self._read = [0] * n_actors
+        self._view: np.ndarray | None = None
+
+    @property
+    def view(self) -> np.ndarray:
+        """Vue numpy de la mémoire partagée"""
+        if self._view is None:
+            self._view = self.data.numpy()
+        return self._view
+
+    def write(self, actor: int, row: np.ndarray):
+        """
+        Écrit une transition dans l'anneau d'un acteur
+
+        Args:
+            actor (int): indice de l'acteur
+            row (np.ndarray): transition à plat de longueur width
+        """
+        n = self.written[actor]
+        self.view[actor, n % self.slots] = row
+        self.written[actor] = n + 1
+
+    def drain(self) -> np.ndarray:
+        """
+        Récupère toutes les transitions écrites depuis le dernier appel (côté learner)
+
+        Returns:
+            Tableau (n, width) des nouvelles transitions
+        """
+        chunks = []
+        for actor in range(self.n_actors):
+            written = self.written[actor]
+            start = max(self._read[actor], written - self.slots)
+            if written > start:
+                idx = np.arange(start, written) % self.slots
+                chunks.append(self.view[actor, idx])
+            self._read[actor] = written
+        if not chunks:
+            return np.empty((0, self.width), dtype=np.float32)
+        return np.concatenate(chunks)
+
+# ======================================== LEARNER ========================================
+def run_learner(
+    net: torch.nn.Module,
+    actor_fn: Callable,
+    actor_args: tuple,
+    width: int,
+    n_episodes: int,
+    consume: Callable[[np.ndarray], None],
+    learn: Callable[[int], int],
+    on_episode: Callable[[tuple], None],
+    n_actors: int = 4,
+    broadcast_interval: int = 50,
+    slots: int = 65_536,
+):
+    """
+    Boucle du learner : lance les acteurs, récupère leurs transitions et apprend jusqu'à n_episodes
+
+    Chaque acteur est appelé avec (actor_id, weights, transitions, stats, stop, *actor_args)
+    et doit envoyer un tuple de statistiques dans `stats` à la fin de chaque épisode.
+
+    Args:
+        net (nn.Module): réseau du learner dont les poids sont diffusés
+        actor_fn (Callable): fonction de processus acteur (définie au niveau module)
+        actor_args (tuple): arguments supplémentaires transmis aux acteurs
+        width (int): nombre de flottants par transition
+        n_episodes (int): nombre d'épisodes à jouer (tous acteurs confondus)
+        consume (Callable): ajoute un batch de transitions au replay buffer
+        learn (Callable): reçoit le nombre de nouvelles transitions, renvoie le nombre de mises à jour effectuées
+        on_episode (Callable): traite les statistiques d'un épisode terminé
+        n_actors (int): nombre de processus acteurs
+        broadcast_interval (int): nombre de mises à jour entre deux diffusions des poids
+        slots (int): capacité de l'anneau de transitions de chaque acteur
+    """
+    ctx = tmp.get_context("spawn")
+    weights = SharedWeights(net, ctx)
+    transitions = SharedTransitions(n_actors, slots, width, ctx)
+    stats = ctx.Queue()
+    stop = ctx.Event()
+
+    actors = [
+        ctx.Process(target=actor_fn, args=(i, weights, transitions, stats, stop, *actor_args), daemon=True)
+        for i in range(n_actors)
+    ]
+    for actor in actors:
+        actor.start()
+
+    episodes = 0
+    updates = 0
+    published = 0
+    try:
+        while episodes < n_episodes:
+            rows = transitions.drain()
+            if len(rows):
+                consume(rows)
+                updates += learn(len(rows))
+                if updates - published >= broadcast_interval:
+                    weights.publish(net)
+                    published = updates
+            else:
+                time.sleep(0.001)
+
+            while episodes < n_episodes:
+                try:
+                    episode_stats = stats.get_nowait()
+                except queue.Empty:
+                    break
+                episodes += 1
+                on_episode(episode_stats)
+    finally:
+        stop.set()
+        for actor in actors:
+            actor.join(timeout=5.0)
+            if actor.is_alive():
+                actor.terminate()
@@ -0,0 +1,390 @@
+# ======================================== IMPORTS ========================================
+from __future__ import annotations
+from collections import OrderedDict
+from concurrent.futures import Future
+from numbers import Real
+from pathlib import Path
+import threading
+import numpy as np
+
+try:
+    from ._intercept import intercept_y
+    from ._numpy_net import NumpyRegressionNet, load_npz, npz_fingerprint, weights_fingerprint
+except ImportError:  # exécution directe du script d'entraînement
+    from _intercept import intercept_y
+    from _numpy_net import NumpyRegressionNet, load_npz, npz_fingerprint, weights_fingerprint
+
+# ======================================== CACHE ========================================
+class PredictionCache:
+    """
+    Cache LRU des prédictions d'arrivée, indexé par l'état normalisé quantifié sur une grille
+
+    Deux états d'une même cellule de la grille partagent la même prédiction.
+    """
+    def __init__(self, capacity: int, step: float, scale: tuple[float, ...]):
+        """
+        Args:
+            capacity (int): nombre maximal de prédictions conservées
+            step (float): pas de la grille de quantification (en unités normalisées)
+            scale (tuple[float, ...]): facteurs de normalisation de l'état brut
+        """
+        self.capacity = capacity
+        self.step = step
+        self._inv = tuple(1.0 / (s * step) for s in scale)
+        self._entries: OrderedDict[tuple[int, ...], float] = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def key(self, *state: float) -> tuple[int, ...]:
+        """Renvoie la cellule de la grille contenant un état brut"""
+        return tuple(round(v * inv) for v, inv in zip(state, self._inv))
+
+    def get(self, key: tuple[int, ...]) -> float | None:
+        """
+        Cherche une prédiction en cache (et la marque comme récente)
+
+        Returns:
+            Prédiction en cache ou None
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: tuple[int, ...], value: float):
+        """Ajoute une prédiction en évinçant la plus ancienne si le cache est plein"""
+        self._entries[key] = value
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Vide le cache (poids modifiés), les compteurs sont conservés"""
+        self._entries.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        """Proportion de prédictions servies par le cache"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def __len__(self) -> int:
+        """Renvoie le nombre de prédictions en cache"""
+        return len(self._entries)
+
+# ======================================== AGENT ========================================
+class Agent:
+    """
+    Politique de jeu du bot, sans dépendance à torch
+    Suit la position Y d'arrivée prédite de la balle à chaque changement de direction
+    Sans réseau, la prédiction est le calcul analytique exact
+    """
+    HEIGHT = 1080.0                                                         # (float): hauteur du terrain en pixels
+    CENTER = HEIGHT / 2                                                     # (float): centre vertical du terrain
+    DEAD_ZONE = 25.0                                                        # (float): marge d'immobilité autour de la cible en pixels
+    DIR_THRESHOLD = 0.001                                                   # (float): seuil de détection de changement de direction
+    STATE_SCALE = np.array([1440.0, 1080.0, 1.0, 1.0], dtype=np.float32)    # (array): facteurs de normalisation de l'état
+    BALL_RADIUS = 15.0                                                      # (float): rayon de la balle en pixels
+    PADDLE_X = 1390.0                                                       # (float): position X de la face de la raquette
+    BACKENDS = ("net", "analytic")                                          # (tuple): moteurs de prédiction disponibles
+
+    def __init__(self, backend: str = "net", cache_size: int = 0, cache_step: float = 1 / 512):
+        """
+        Args:
+            backend (str): moteur de prédiction en jeu ("net" : réseau, "analytic" : calcul exact sans inférence)
+            cache_size (int): capacité du cache de prédictions (0 : désactivé)
+            cache_step (float): pas de quantification de l'état normalisé pour le cache
+        """
+        self.set_backend(backend)
+        self.cache = PredictionCache(cache_size, cache_step, tuple(self.STATE_SCALE.tolist())) if cache_size > 0 else None
+
+        # Géométrie du calcul analytique (terrain d'entraînement tant que set_field n'est pas appelé)
+        self.field = None
+        self.ball_radius: float = self.BALL_RADIUS
+        self.field_height: float = self.HEIGHT
+        self.paddle_x: float = self.PADDLE_X
+
+        # État interne de jeu
+        self.prev_dx: float = 0.0
+        self.prev_dy: float = 0.0
+        self.target_y: float|None = None
+
+    # ======================================== UTILITAIRES ========================================
+    @classmethod
+    def _normalize(cls, ball_x: float, ball_y: float, ball_dx: float, ball_dy: float) -> np.ndarray:
+        """
+        Normalise l'état brut de la balle
+
+        Args:
+            ball_x (float): position X de la balle
+            ball_y (float): position Y de la balle
+            ball_dx (float): direction X normalisée
+            ball_dy (float): direction Y normalisée
+
+        Returns:
+            Tableau numpy float32 normalisé
+        """
+        return np.array([ball_x, ball_y, ball_dx, ball_dy], dtype=np.float32) / cls.STATE_SCALE
+
+    def _predict(self, ball_x: float, ball_y: float, ball_dx: float, ball_dy: float) -> float:
+        """
+        Prédit la position Y d'arrivée de la balle (calcul analytique, surchargé par les agents à réseau)
+
+        Args:
+            ball_x (float): position X de la balle
+            ball_y (float): position Y de la balle
+            ball_dx (float): direction X normalisée
+            ball_dy (float): direction Y normalisée
+
+        Returns:
+            Position Y prédite en pixels
+        """
+        return self._predict_analytic(ball_x, ball_y, ball_dx, ball_dy)
+
+    def _predict_analytic(self, ball_x: float, ball_y: float, ball_dx: float, ball_dy: float) -> float:
+        """
+        Calcule exactement la position Y d'arrivée de la balle (repliement sur les murs, sans réseau)
+
+        Args:
+            ball_x (float): position X de la balle
+            ball_y (float): position Y de la balle
+            ball_dx (float): direction X normalisée
+            ball_dy (float): direction Y normalisée
+
+        Returns:
+            Position Y d'arrivée en pixels
+        """
+        return intercept_y(ball_x, ball_y, ball_dx, ball_dy, self.ball_radius, self.field_height, self.paddle_x)
+
+    def _predict_cached(self, ball_x: float, ball_y: float, ball_dx: float, ball_dy: float) -> float:
+        """
+        Prédit la position Y d'arrivée de la balle en passant par le cache (inférence évitée en cas de hit)
+
+        Args:
+            ball_x (float): position X de la balle
+            ball_y (float): position Y de la balle
+            ball_dx (float): direction X normalisée
+            ball_dy (float): direction Y normalisée
+
+        Returns:
+            Position Y prédite en pixels
+        """
+        if self.cache is None:
+            return self._predict(ball_x, ball_y, ball_dx, ball_dy)
+        key = self.cache.key(ball_x, ball_y, ball_dx, ball_dy)
+        value = self.cache.get(key)
+        if value is None:
+            value = self._predict(ball_x, ball_y, ball_dx, ball_dy)
+            self.cache.put(key, value)
+        return value
+
+    def invalidate_cache(self):
+        """Vide le cache de prédictions (à appeler dès que les poids changent)"""
+        if self.cache is not None:
+            self.cache.clear()
+
+    def _direction_changed(self, ball_dx: float, ball_dy: float) -> bool:
+        """
+        Détecte un changement de direction de la balle
+
+        Args:
+            ball_dx (float): direction X courante
+            ball_dy (float): direction Y courante
+
+        Returns:
+            True si la direction a changé au-delà du seuil DIR_THRESHOLD
+        """
+        return (abs(ball_dx - self.prev_dx) > self.DIR_THRESHOLD or abs(ball_dy - self.prev_dy) > self.DIR_THRESHOLD)
+
+    def set_field(self, config):
+        """
+        Aligne le calcul analytique sur la géométrie de la partie jouée (raquette droite)
+
+        Args:
+            config (SimConfig): constantes de la partie (rayon de balle, hauteur, position de la raquette)
+        """
+        self.field = config
+        self.ball_radius = float(config.ball_radius)
+        self.field_height = float(config.height)
+        self.paddle_x = float(config.width - config.paddle_offset - config.paddle_width / 2)
+
+    # ======================================== DEPLACEMENT ========================================
+    def set_backend(self, backend: str):
+        """
+        Fixe le moteur de prédiction utilisé par get_move
+
+        Args:
+            backend (str): "net" (réseau de régression) | "analytic" (calcul exact)
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown bot backend {backend!r}")
+        self.backend = backend
+
+    def reset(self):
+        """Réinitialise l'état interne entre deux épisodes"""
+        self.prev_dx  = 0.0
+        self.prev_dy  = 0.0
+        self.target_y = None
+
+    def get_move(self, p2_y: Real, ball_x: Real, ball_y: Real, ball_dx: Real, ball_dy: Real) -> int:
+        """
+        Calcule le mouvement de la raquette pour un frame donné
+
+        Args:
+            p2_y (Real): position Y actuelle de la raquette
+            ball_x (Real): position X de la balle
+            ball_y (Real): position Y de la balle
+            ball_dx (Real): direction X de la balle
+            ball_dy (Real): direction Y de la balle
+
+        Returns:
+            -1 (monter) | 0 (immobile) | 1 (descendre)
+        """
+        if ball_dx < 0:
+            goal = self.field_height / 2
+        else:
+            if self._direction_changed(ball_dx, ball_dy):
+                self.prev_dx = ball_dx
+                self.prev_dy = ball_dy
+                if ball_dx > 0:
+                    predict = self._predict_analytic if self.backend == "analytic" else self._predict_cached
+                    self.target_y = predict(ball_x, ball_y, ball_dx, ball_dy)
+            goal = self.target_y if self.target_y is not None else self.field_height / 2
+        return self._move_towards(p2_y, goal)
+
+    def _move_towards(self, p2_y: float, goal: float) -> int:
+        """
+        Mouvement de la raquette vers une cible, avec zone morte
+
+        Args:
+            p2_y (float): position Y actuelle de la raquette
+            goal (float): position Y visée
+
+        Returns:
+            -1 (monter) | 0 (immobile) | 1 (descendre)
+        """
+        if p2_y < goal - self.DEAD_ZONE:  return  1
+        if p2_y > goal + self.DEAD_ZONE:  return -1
+        return 0
+
+# ======================================== AGENT NUMPY ========================================
+class NumpyAgent(Agent):
+    """
+    Agent servant le réseau de régression exporté en .npz, évalué en numpy pur
+    """
+    def __init__(self, net: NumpyRegressionNet, backend: str = "net", cache_size: int = 0):
+        """
+        Args:
+            net (NumpyRegressionNet): évaluateur numpy des poids exportés
+            backend (str): moteur de prédiction en jeu
+            cache_size (int): capacité du cache de prédictions (0 : désactivé)
+        """
+        super().__init__(backend=backend, cache_size=cache_size)
+        self.net = net
+
+    def _predict(self, ball_x: float, ball_y: float, ball_dx: float, ball_dy: float) -> float:
+        """
+        Prédit la position Y d'arrivée de la balle via l'évaluateur numpy
+
+        Args:
+            ball_x (float): position X de la balle
+            ball_y (float): position Y de la balle
+            ball_dx (float): direction X normalisée
+            ball_dy (float): direction Y normalisée
+
+        Returns:
+            Position Y prédite en pixels
+        """
+        return self.net.predict_one(self._normalize(ball_x, ball_y, ball_dx, ball_dy)) * self.HEIGHT
+
+# ======================================== CREATION ========================================
+def _export_is_current(npz_path: Path, pth_path: Path) -> bool:
+    """
+    Vérifie que l'export numpy provient des poids de la sauvegarde .pth
+
+    Args:
+        npz_path (Path): export numpy
+        pth_path (Path): sauvegarde torch associée
+
+    Returns:
+        False si l'empreinte de l'export diffère de celle des poids sauvegardés (sans torch ni .pth : True)
+    """
+    if not pth_path.exists():
+        return True
+    try:
+        import torch
+    except ImportError:
+        return True
+    ckpt = torch.load(pth_path, map_location="cpu")
+    return npz_fingerprint(npz_path) == weights_fingerprint({k: v.numpy() for k, v in ckpt["net"].items()})
+
+def create_agent(backend: str = "net", runtime: str = "auto", path: str = "_data/bot", cache_size: int = 0) -> Agent:
+    """
+    Crée l'agent de jeu du bot
+
+    Args:
+        backend (str): moteur de prédiction ("net" | "analytic")
+        runtime (str): exécution du réseau
+            - "numpy" : export .npz sans torch
+            - "torch" : Bot complet chargé depuis le .pth
+            - "auto" : numpy si l'export existe et est à jour, torch sinon, calcul analytique si aucun n'est disponible
+        path (str): chemin des sauvegardes sans extension, relatif au package
+        cache_size (int): capacité du cache de prédictions (0 : désactivé)
+
+    Returns:
+        Agent prêt à jouer
+    """
+    from ..._core import get_path
+    npz_path = Path(get_path(f"{path}.npz"))
+
+    if runtime in ("auto", "numpy") and npz_path.exists():
+        net = load_npz(npz_path)
+        if not isinstance(net, NumpyRegressionNet):
+            raise ValueError(f"{npz_path} is a {type(net).__name__} export, the game agent needs a regression net")
+        if _export_is_current(npz_path, npz_path.with_suffix(".pth")):
+            return NumpyAgent(net, backend=backend, cache_size=cache_size)
+        print(f"[Bot] Ignoring stale numpy export {npz_path}")
+    if runtime in ("auto", "torch"):
+        try:
+            import torch
+            from ._bot import Bot
+        except ImportError:
+            pass
+        else:
+            bot = Bot(backend=backend, cache_size=cache_size, pretrained=False)
+            bot.load(f"{path}.pth")
+            # Processus de jeu : l'inférence mono-échantillon est la seule charge torch
+            torch.set_num_threads(bot.inference_threads)
+            return bot
+    print(f"[Bot] No {runtime} model available, falling back to analytic backend")
+    return Agent(backend="analytic")
+
+def load_agent_async(backend: str = "net", runtime: str = "auto", path: str = "_data/bot", cache_size: int = 0) -> Future:
+    """
+    Crée l'agent de jeu du bot sur un thread de fond (import de torch et désérialisation hors du thread principal)
+
+    Args:
+        backend (str): moteur de prédiction ("net" | "analytic")
+        runtime (str): exécution du réseau ("auto" | "numpy" | "torch")
+        path (str): chemin des sauvegardes sans extension, relatif au package
+        cache_size (int): capacité du cache de prédictions (0 : désactivé)
+
+    Returns:
+        Future résolue avec l'agent prêt à jouer (ou l'exception levée au chargement)
+    """
+    future = Future()
+
+    def worker():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            agent = create_agent(backend=backend, runtime=runtime, path=path, cache_size=cache_size)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(agent)
+
+    threading.Thread(target=worker, name="bot-loader", daemon=True).start()
+    return future
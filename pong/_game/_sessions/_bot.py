@@ -1,20 +1,52 @@
 # ======================================== IMPORTS ========================================
 from __future__ import annotations
-from numbers import Real
+from typing import Callable
 import torch
 import torch.nn as nn
-import random
 import math
-import collections
+import os
 import numpy as np
 
+try:
+    from ._agent import Agent
+    from ._numpy_net import export_npz
+    from ._replay import RingBuffer
+    from ._actors import SharedWeights, SharedTransitions, run_learner
+    from ._dataset import ShardWriter, ShardDataset
+    from ._compiled import export_script, load_script
+    from ._quantized import quantize_net, weight_bytes
+    from ._seeding import Seed, as_seed_sequence, with_spawned, torch_seed
+    from ._metrics import MetricsLog, legacy_state, history, curve
+    from ._checkpoint import (Checkpointer, detach, rng_states, restore_rng_states,
+                              snapshot_replay, write_checkpoint, read_replay_dir, restore_replay)
+except ImportError:  # exécution directe du script d'entraînement
+    from _agent import Agent
+    from _numpy_net import export_npz
+    from _replay import RingBuffer
+    from _actors import SharedWeights, SharedTransitions, run_learner
+    from _dataset import ShardWriter, ShardDataset
+    from _compiled import export_script, load_script
+    from _quantized import quantize_net, weight_bytes
+    from _seeding import Seed, as_seed_sequence, with_spawned, torch_seed
+    from _metrics import MetricsLog, legacy_state, history, curve
+    from _checkpoint import (Checkpointer, detach, rng_states, restore_rng_states,
+                             snapshot_replay, write_checkpoint, read_replay_dir, restore_replay)
+
 # ======================================== REPLAY BUFFER ========================================
-class ReplayBuffer:
+class ReplayBuffer(RingBuffer):
     """
     Mémoire de rejeu pour l'entraînement par batch
     """
-    def __init__(self, capacity: int = 10_000):
-        self.buffer = collections.deque(maxlen=capacity)
+    def __init__(self, capacity: int = 10_000, seed: Seed = None):
+        """
+        Args:
+            capacity (int): nombre maximal d'échantillons conservés
+            seed (int | SeedSequence | None): graine du générateur de tirage
+        """
+        super().__init__(capacity, {
+            "state":  ((4,), np.float32),
+            "target": ((),   np.float32),
+        }, seed=seed)
 
     def push(self, state: np.ndarray, target_y: float):
         """
@@ -24,7 +56,7 @@ class ReplayBuffer:
             state (np.ndarray): état normalisé [ball_x, ball_y, ball_dx, ball_dy]
             target_y (float): position Y cible normalisée (entre 0 et 1)
         """
-        self.buffer.append((state, target_y))
+        super().push(state, target_y)
 
     def sample(self, batch_size: int) -> tuple[np.ndarray, np.ndarray]:
         """
@@ -34,15 +66,9 @@ class ReplayBuffer:
             batch_size (int): nombre d'échantillons à tirer
 
         Returns:
-            Tuple (states, targets) sous forme de tableaux numpy float32
+            Tuple (states, targets) sous forme de tableaux numpy float32 contigus
         """
-        batch = random.sample(self.buffer, batch_size)
-        states, targets = zip(*batch)
-        return np.array(states, dtype=np.float32), np.array(targets, dtype=np.float32)
-
-    def __len__(self) -> int:
-        """Renvoie la taille du buffer"""
-        return len(self.buffer)
+        return super().sample(batch_size)
 
 # ======================================== RESEAU ========================================
 class RegressionNet(nn.Module):
@@ -68,17 +94,11 @@ class RegressionNet(nn.Module):
         return self.net(x)
 
 # ======================================== BOT ========================================
-class Bot(nn.Module):
+class Bot(nn.Module, Agent):
     """
     Agent pong basé sur un réseau de régression
     Prédit la position Y d'arrivée de la balle et déplace la raquette en conséquence
     """
-    HEIGHT = 1080.0                                                         # (float): hauteur du terrain en pixels
-    CENTER = HEIGHT / 2                                                     # (float): centre vertical du terrain
-    DEAD_ZONE = 25.0                                                        # (float): marge d'immobilité autour de la cible en pixels
-    DIR_THRESHOLD = 0.001                                                   # (float): seuil de détection de changement de direction
-    STATE_SCALE = np.array([1440.0, 1080.0, 1.0, 1.0], dtype=np.float32)    # (array): facteurs de normalisation de l'état
-
     def __init__(
         self,
         lr: float = 3e-4,
@@ -90,6 +110,18 @@ class Bot(nn.Module):
         plateau_threshold: float = 1.5,
         lr_decay: float = 0.1,
         lr_min: float = 1e-6,
+        backend: str = "net",
+        cache_size: int = 0,
+        cache_step: float = 1 / 512,
+        compiled: bool = True,
+        quantized: bool = False,
+        inference_threads: int = 1,
+        checkpoint_every: int = 0,
+        checkpoint_path: str = "checkpoints/bot.pth",
+        resume: bool = False,
+        pretrained: bool = True,
+        seed: Seed = None,
+        metrics_path: str | None = None,
     ):
         """
         Args:
@@ -102,15 +134,42 @@ class Bot(nn.Module):
             plateau_threshold (float): amélioration minimale pour ne pas déclencher le decay
             lr_decay (float): facteur multiplicatif appliqué au LR à chaque plateau (ex: 0.1 → ÷10)
             lr_min (float): LR plancher en dessous duquel on arrête d'apprendre
+            backend (str): moteur de prédiction en jeu ("net" : réseau, "analytic" : calcul exact sans inférence)
+            cache_size (int): capacité du cache de prédictions (0 : désactivé)
+            cache_step (float): pas de quantification de l'état normalisé pour le cache
+            compiled (bool): utilise l'artefact TorchScript (.pt) pour l'inférence s'il est présent
+            quantized (bool): sert une copie int8 dynamique du réseau (CPU), prioritaire sur l'artefact compilé
+            inference_threads (int): nombre de threads intra-op conseillé pour l'inférence (fixé par le point d'entrée du jeu, jamais au chargement)
+            checkpoint_every (int): point de reprise en arrière-plan tous les checkpoint_every épisodes (0 : désactivé)
+            checkpoint_path (str): destination des points de reprise périodiques, relative au dossier de lancement (jamais le modèle livré)
+            resume (bool): load restaure aussi le replay buffer et les générateurs aléatoires (reprise exacte)
+            pretrained (bool): charge la sauvegarde existante à la création (False : réseau vierge)
+            seed (int | SeedSequence | None): graine racine des flux du replay, des acteurs et de l'initialisation du réseau
+            metrics_path (str | None): journal binaire des métriques par épisode (None : agrégats glissants et historique décimé en mémoire)
         """
         super().__init__()
+        Agent.__init__(self, backend=backend, cache_size=cache_size, cache_step=cache_step)
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         print(f"Device : {self.device}")
 
+        # Flux aléatoires indépendants issus de la graine racine
+        self.seed_seq = as_seed_sequence(seed)
+        replay_seed, init_seed = self.seed_seq.spawn(2)
+
         # Réseau et optimisation
-        self.net = RegressionNet().to(self.device)
+        with torch.random.fork_rng(devices=[], enabled=seed is not None):
+            if seed is not None:
+                torch.manual_seed(torch_seed(init_seed))
+            self.net = RegressionNet().to(self.device)
         self.loss_fn = nn.MSELoss()
         self.optimiser = torch.optim.Adam(self.net.parameters(), lr=lr)
+        self.optimiser.register_step_post_hook(lambda *_: self._on_weights_changed())
+
+        # Réseau d'inférence figé (int8 ou TorchScript), abandonné dès que les poids changent
+        self.use_compiled = compiled
+        self.use_quantized = quantized
+        self.inference_threads = inference_threads
+        self.infer_net = None
 
         # Hyperparamètres
         self.lr_init = lr
@@ -119,43 +178,34 @@ class Bot(nn.Module):
         self.batch_size = batch_size
         self.min_buffer_size = min_buffer_size
         self.grad_steps = grad_steps
-        self.buffer = ReplayBuffer(buffer_capacity)
+        self.buffer = ReplayBuffer(buffer_capacity, seed=replay_seed)
         self.plateau_window = plateau_window
         self.plateau_threshold = plateau_threshold
 
-        # État interne de jeu
-        self.prev_dx: float = 0.0
-        self.prev_dy: float = 0.0
-        self.target_y: float|None = None
-
         # Suivi de l'entraînement
         self.converged_ep: int = 0
         self._decay_cooldown: int = 0
         self.episode_count: int = 0
         self.total_samples: int = 0
-        self.all_losses: list[float] = []
-        self.all_errors: list[float] = []
-        self.all_scores: list[int] = []
+        self.metrics = MetricsLog(
+            ("score", "loss", "error"),
+            self._resolve_path(metrics_path) if metrics_path is not None else None,
+            window=max(50, 2 * plateau_window),
+        )
+
+        # Points de reprise
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_path = os.path.abspath(checkpoint_path)
+        self.resume = resume
+        self.checkpointer = Checkpointer()
+        self.train_env = None
+        self._pending_env_rng = None
 
         # Chargement si sauvegarde existante
-        self.load()
+        if pretrained:
+            self.load()
 
     # ======================================== UTILITAIRES ========================================
-    def _normalize(self, ball_x: float, ball_y: float, ball_dx: float, ball_dy: float) -> np.ndarray:
-        """
-        Normalise l'état brut de la balle
-
-        Args:
-            ball_x (float): position X de la balle
-            ball_y (float): position Y de la balle
-            ball_dx (float): direction X normalisée
-            ball_dy (float): direction Y normalisée
-
-        Returns:
-            Tableau numpy float32 normalisé
-        """
-        return np.array([ball_x, ball_y, ball_dx, ball_dy], dtype=np.float32) / self.STATE_SCALE
-
     def _predict(self, ball_x: float, ball_y: float, ball_dx: float, ball_dy: float) -> float:
         """
         Prédit la position Y d'arrivée de la balle via le réseau
@@ -173,21 +223,14 @@ class Bot(nn.Module):
             self._normalize(ball_x, ball_y, ball_dx, ball_dy),
             dtype=torch.float32, device=self.device
         ).unsqueeze(0)
+        net = self.infer_net if self.infer_net is not None else self.net
         with torch.no_grad():
-            return self.net(t).item() * self.HEIGHT
+            return net(t).item() * self.HEIGHT
 
-    def _direction_changed(self, ball_dx: float, ball_dy: float) -> bool:
-        """
-        Détecte un changement de direction de la balle
-
-        Args:
-            ball_dx (float): direction X courante
-            ball_dy (float): direction Y courante
-
-        Returns:
-            True si la direction a changé au-delà du seuil DIR_THRESHOLD
-        """
-        return (abs(ball_dx - self.prev_dx) > self.DIR_THRESHOLD or abs(ball_dy - self.prev_dy) > self.DIR_THRESHOLD)
+    def _on_weights_changed(self):
+        """Invalide tout ce qui dépend des poids courants (cache de prédictions, module compilé)"""
+        self.invalidate_cache()
+        self.infer_net = None
 
     def _get_lr(self) -> float:
         """Renvoie le taux d'apprentissage courant de l'optimiseur"""
@@ -201,10 +244,11 @@ class Bot(nn.Module):
             True si l'amélioration est inférieure à plateau_threshold
         """
         w = self.plateau_window
-        if len(self.all_errors) < 2 * w:
+        errors = self.metrics.tail("error", 2 * w)
+        if len(errors) < 2 * w:
             return False
-        recent = float(np.mean(self.all_errors[-w:]))
-        before = float(np.mean(self.all_errors[-2*w:-w]))
+        recent = float(np.mean(errors[w:]))
+        before = float(np.mean(errors[:w]))
         return (before - recent) < self.plateau_threshold
 
     def _apply_lr_decay(self) -> float | None:
@@ -228,40 +272,6 @@ class Bot(nn.Module):
         self._decay_cooldown = self.plateau_window  # attend une fenêtre entière avant le prochain decay
         return new_lr
 
-    # ======================================== DEPLACEMENT ========================================
-    def reset(self):
-        """Réinitialise l'état interne entre deux épisodes"""
-        self.prev_dx  = 0.0
-        self.prev_dy  = 0.0
-        self.target_y = None
-
-    def get_move(self, p2_y: Real, ball_x: Real, ball_y: Real, ball_dx: Real, ball_dy: Real) -> int:
-        """
-        Calcule le mouvement de la raquette pour un frame donné
-
-        Args:
-            p2_y (Real): position Y actuelle de la raquette
-            ball_x (Real): position X de la balle
-            ball_y (Real): position Y de la balle
-            ball_dx (Real): direction X de la balle
-            ball_dy (Real): direction Y de la balle
-
-        Returns:
-            -1 (monter) | 0 (immobile) | 1 (descendre)
-        """
-        if ball_dx < 0:
-            goal = self.CENTER
-        else:
-            if self._direction_changed(ball_dx, ball_dy):
-                self.prev_dx = ball_dx
-                self.prev_dy = ball_dy
-                if ball_dx > 0:
-                    self.target_y = self._predict(ball_x, ball_y, ball_dx, ball_dy)
-            goal = self.target_y if self.target_y is not None else self.CENTER
-        if p2_y < goal - self.DEAD_ZONE:  return  1
-        if p2_y > goal + self.DEAD_ZONE:  return -1
-        return 0
-
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         """Passage à travers le réseau"""
         return self.net(x)
@@ -280,16 +290,41 @@ class Bot(nn.Module):
         for _ in range(self.grad_steps):
             bs = min(self.batch_size, len(self.buffer))
             states, targets = self.buffer.sample(bs)
-            states  = torch.tensor(states,  device=self.device)
-            targets = torch.tensor(targets, device=self.device).unsqueeze(1)
-            loss = self.loss_fn(self.net(states), targets)
-            self.optimiser.zero_grad()
-            loss.backward()
-            nn.utils.clip_grad_norm_(self.net.parameters(), max_norm=5.0)
-            self.optimiser.step()
-            losses.append(loss.item())
+            losses.append(self._gradient_step(states, targets))
         return float(np.mean(losses))
 
+    def _gradient_step(self, states: np.ndarray, targets: np.ndarray) -> float:
+        """
+        Effectue une passe de gradient sur un batch
+
+        Args:
+            states (np.ndarray): états normalisés (n, 4)
+            targets (np.ndarray): positions Y d'arrivée normalisées (n,)
+
+        Returns:
+            Perte MSE du batch
+        """
+        states  = torch.from_numpy(states).to(self.device)
+        targets = torch.from_numpy(targets).to(self.device).unsqueeze(1)
+        loss = self.loss_fn(self.net(states), targets)
+        self.optimiser.zero_grad()
+        loss.backward()
+        nn.utils.clip_grad_norm_(self.net.parameters(), max_norm=5.0)
+        self.optimiser.step()
+        return loss.item()
+
+    def _attach_env(self, env):
+        """
+        Mémorise l'environnement d'entraînement, dont le flux aléatoire fait partie des points de reprise
+
+        Args:
+            env (PongEnv): environnement de jeu (reçoit l'état de flux en attente d'une reprise)
+        """
+        self.train_env = env
+        if self._pending_env_rng is not None and hasattr(env, "rng"):
+            env.rng.bit_generator.state = self._pending_env_rng
+            self._pending_env_rng = None
+
     def train_agent(self, env, n_episodes: int = 500):
         """
         Boucle d'entraînement principale
@@ -298,96 +333,179 @@ class Bot(nn.Module):
             env (PongEnv): environnement de jeu
             n_episodes (int) : nombre maximum d'épisodes
         """
-        window = 50
-
+        self._attach_env(env)
         for ep in range(n_episodes):
             self.episode_count += 1
-            raw  = env.reset()
-            done = False
-            score = 0
             ep_losses: list[float] = []
-            ep_errors: list[float] = []
-
-            prev_dx, prev_dy = 0.0, 0.0
-            pending_state    = None
-            pending_pred     = self.CENTER
-
-            while not done:
-                _, ball_x, ball_y, ball_dx, ball_dy = raw
-
-                if (ball_dx, ball_dy) != (prev_dx, prev_dy):
-                    prev_dx, prev_dy = ball_dx, ball_dy
-                    if ball_dx > 0:
-                        pending_state = self._normalize(ball_x, ball_y, ball_dx, ball_dy)
-                        pending_pred  = self._predict(ball_x, ball_y, ball_dx, ball_dy)
-
-                p2_y = raw[0]
-                if p2_y < pending_pred - self.DEAD_ZONE:    action =  1
-                elif p2_y > pending_pred + self.DEAD_ZONE:  action = -1
-                else:                                        action =  0
-
-                raw_next, reward, done = env.step(action)
-
-                if reward >= 1.0 or (done and reward <= -1.0):
-                    if reward >= 1.0:
-                        score += 1
-                    if pending_state is not None:
-                        actual_y = raw_next[2]
-                        ep_errors.append(abs(actual_y - pending_pred))
-                        self.buffer.push(pending_state, actual_y / self.HEIGHT)
-                        self.total_samples += 1
-                        pending_state = None
-                        loss = self._learn_steps()
-                        if loss is not None:
-                            ep_losses.append(loss)
-
-                raw = raw_next
-
-            mean_loss  = float(np.mean(ep_losses)) if ep_losses else 0.0
-            mean_error = float(np.mean(ep_errors)) if ep_errors else 0.0
-            self.all_losses.append(mean_loss)
-            self.all_errors.append(mean_error)
-            self.all_scores.append(score)
-
-            avg_error = float(np.mean(self.all_errors[-window:]))
-            avg_score = float(np.mean(self.all_scores[-window:]))
-
-            new_lr = self._apply_lr_decay()
-            if new_lr is not None:
-                if self.converged_ep == 0:
-                    self.converged_ep = self.episode_count
-                print(f"\n>>> Plateau ep {self.episode_count} "
-                      f"- LR : {self._get_lr() / self.lr_decay:.2e} → {new_lr:.2e} "
-                      f"| score moy: {avg_score:.1f} | err: {avg_error:.1f}px <<<\n")
 
+            def on_sample(state: np.ndarray, target_y: float):
+                self.buffer.push(state, target_y)
+                self.total_samples += 1
+                loss = self._learn_steps()
+                if loss is not None:
+                    ep_losses.append(loss)
+
+            score, ep_errors = play_episode(env, self._predict_cached, on_sample)
+            self._end_episode(ep, n_episodes, score, ep_losses, ep_errors)
+
+    def train_parallel(self, n_episodes: int = 500, n_actors: int = 4, broadcast_interval: int = 50):
+        """
+        Entraînement multiprocessus : plusieurs acteurs jouent des épisodes PongEnv
+        avec une copie du réseau synchronisée périodiquement, ce processus (learner)
+        possède l'optimiseur et le replay buffer
+
+        Args:
+            n_episodes (int): nombre d'épisodes à jouer, tous acteurs confondus
+            n_actors (int): nombre de processus acteurs
+            broadcast_interval (int): nombre de mises à jour entre deux diffusions des poids aux acteurs
+        """
+        ep = 0
+        ep_losses: list[float] = []
+
+        def consume(rows: np.ndarray):
+            self.buffer.push_batch(rows[:, :4], rows[:, 4])
+            self.total_samples += len(rows)
+
+        def learn(n_new: int) -> int:
+            updates = 0
+            for _ in range(n_new):
+                loss = self._learn_steps()
+                if loss is None:
+                    break
+                ep_losses.append(loss)
+                updates += 1
+            return updates
+
+        def on_episode(stats: tuple[int, list[float]]):
+            nonlocal ep
+            score, ep_errors = stats
+            self.episode_count += 1
+            self._end_episode(ep, n_episodes, score, ep_losses, ep_errors)
+            ep_losses.clear()
+            ep += 1
+
+        run_learner(
+            self.net, _regression_actor, (self.seed_seq.spawn(n_actors),), 5, n_episodes,
+            consume, learn, on_episode,
+            n_actors=n_actors, broadcast_interval=broadcast_interval,
+        )
+
+    def train_offline(self, data_dir: str, n_epochs: int = 1, batch_size: int | None = None, seed: int | None = None):
+        """
+        Entraînement supervisé par époques sur un jeu de données hors ligne (voir generate_dataset)
+        Les fragments sont lus en np.memmap et parcourus en mini-batchs mélangés, sans être chargés entièrement
+
+        Args:
+            data_dir (str): dossier des fragments shard_*.npy
+            n_epochs (int): nombre de passages complets sur le jeu de données
+            batch_size (int | None): taille des mini-batchs (batch_size du bot par défaut)
+            seed (int | None): graine du mélange (None : flux dérivé de la graine du bot)
+        """
+        dataset = ShardDataset(data_dir)
+        rng = np.random.default_rng(seed if seed is not None else self.seed_seq.spawn(1)[0])
+        batch_size = batch_size or self.batch_size
+        print(f"[Offline] {len(dataset)} samples | {len(dataset.paths)} shard(s) | batch {batch_size}")
+
+        for epoch in range(n_epochs):
+            total, count = 0.0, 0
+            for batch in dataset.iter_batches(batch_size, rng):
+                total += self._gradient_step(batch[:, :4], batch[:, 4]) * len(batch)
+                count += len(batch)
+            self.total_samples += count
+            print(f"[Offline] Epoch {epoch + 1:>3}/{n_epochs} | Loss: {total / max(count, 1):.5f} | LR: {self._get_lr():.1e}")
+
+    def _end_episode(self, ep: int, n_episodes: int, score: int, ep_losses: list[float], ep_errors: list[float]):
+        """
+        Enregistre les métriques d'un épisode, applique le decay du LR et affiche la progression
+
+        Args:
+            ep (int): indice de l'épisode dans l'entraînement courant
+            n_episodes (int): nombre total d'épisodes de l'entraînement courant
+            score (int): nombre de renvois réussis
+            ep_losses (list[float]): pertes des passes de gradient de l'épisode
+            ep_errors (list[float]): erreurs de prédiction de l'épisode en pixels
+        """
+        window = 50
+
+        mean_loss  = float(np.mean(ep_losses)) if ep_losses else 0.0
+        mean_error = float(np.mean(ep_errors)) if ep_errors else 0.0
+        self.metrics.append(score=score, loss=mean_loss, error=mean_error)
+
+        avg_error = self.metrics.mean("error", window)
+        avg_score = self.metrics.mean("score", window)
+
+        new_lr = self._apply_lr_decay()
+        if new_lr is not None:
+            if self.converged_ep == 0:
+                self.converged_ep = self.episode_count
+            print(f"\n>>> Plateau ep {self.episode_count} "
+                  f"- LR : {self._get_lr() / self.lr_decay:.2e} → {new_lr:.2e} "
+                  f"| score moy: {avg_score:.1f} | err: {avg_error:.1f}px <<<\n")
+
+        if self.metrics.report_due() or ep + 1 == n_episodes:
             lr_str = f"{self._get_lr():.1e}"
             status = "✓" if self.converged_ep > 0 else "~"
             print(f"[{status}] {ep+1:>5}/{n_episodes} | "
                   f"Score: {score:>4} (moy {avg_score:>4.1f}) | "
                   f"Loss: {mean_loss:.5f} | Err: {avg_error:>5.1f}px | LR: {lr_str}")
 
+        if self.checkpoint_every and self.episode_count % self.checkpoint_every == 0:
+            self.checkpoint(self.checkpoint_path)
+
     # ======================================== SAUVEGARDE ========================================
+    @staticmethod
+    def _resolve_path(path: str) -> str:
+        """Résout un chemin de sauvegarde relatif au paquet pong"""
+        if __name__ == "__main__":
+            return f"pong/{path}"
+        from ..._core import get_path
+        return get_path(path)
+
+    def _training_state(self) -> dict:
+        """
+        Renvoie l'état complet de l'entraînement
+
+        Returns:
+            Copies détachées sur CPU, sérialisables depuis un autre thread
+        """
+        return detach({
+            "net":             self.net.state_dict(),
+            "optimiser":       self.optimiser.state_dict(),
+            "episode_count":   self.episode_count,
+            "total_samples":   self.total_samples,
+            "converged_ep":    self.converged_ep,
+            "decay_cooldown":  self._decay_cooldown,
+            "replay_pos":      self.buffer.pos,
+            "seed_children":   self.seed_seq.n_children_spawned,
+            "metrics":         self.metrics.state(),
+            "rng":             rng_states({"replay": self.buffer.rng, "env": getattr(self.train_env, "rng", None)}),
+        })
+
+    def checkpoint(self, path: str | None = None):
+        """
+        Planifie un point de reprise complet écrit en arrière-plan (fichier atomique, replay buffer inclus)
+
+        Args:
+            path (str | None): chemin de destination du fichier (None : checkpoint_path)
+        """
+        self.metrics.flush()
+        self.checkpointer.submit(self._resolve_path(path) if path is not None else self.checkpoint_path, self._training_state(), snapshot_replay(self.buffer))
+
     def save(self, path: str = "_data/bot.pth"):
         """
-        Sauvegarde le modèle et les métadonnées d'entraînement
+        Sauvegarde le modèle, l'état d'entraînement et le replay buffer (après les points de reprise en cours)
 
         Args:
             path (str): chemin de destination du fichier
         """
         try:
-            if __name__ == "__main__":
-                path = f"pong/{path}"
-            else:
-                from ..._core import get_path
-                path = get_path(path)
-            torch.save({
-                "net":           self.net.state_dict(),
-                "optimiser":     self.optimiser.state_dict(),
-                "episode_count": self.episode_count,
-                "total_samples": self.total_samples,
-                "converged_ep":  self.converged_ep,
-            }, path)
+            path = self._resolve_path(path)
+            self.checkpointer.wait()
+            self.metrics.flush()
+            write_checkpoint(path, self._training_state(), snapshot_replay(self.buffer))
             print(f"Sauvegarde -> {path}")
+            print(f"Export numpy -> {export_npz(path)}")
+            print(f"Export TorchScript -> {export_script(self.net, path, 4)}")
         except Exception as e:
             print(f"[Bot] Save error: {e}")
 
@@ -399,22 +517,238 @@ class Bot(nn.Module):
             path (str): chemin du fichier de sauvegarde
         """
         try:
-            if __name__ == "__main__":
-                path = f"pong/{path}"
-            else:
-                from ..._core import get_path
-                path = get_path(path)
+            path = self._resolve_path(path)
             ckpt = torch.load(path, map_location=self.device)
             self.net.load_state_dict(ckpt["net"])
             self.optimiser.load_state_dict(ckpt["optimiser"])
+            self._on_weights_changed()
+            if self.use_quantized and self.device == "cpu":
+                self.infer_net = quantize_net(self.net)
+            elif self.use_compiled:
+                self.infer_net = load_script(path, self.net, 4, self.device)
             self.episode_count = ckpt.get("episode_count", 0)
             self.total_samples = ckpt.get("total_samples", 0)
             self.converged_ep  = ckpt.get("converged_ep",  0)
+            self._decay_cooldown = ckpt.get("decay_cooldown", 0)
+            self.metrics.load_state(ckpt.get("metrics") or legacy_state(ckpt))
+            if self.resume:
+                self._resume(path, ckpt)
             status = f"PLAY (premier plateau ep {self.converged_ep})" if self.converged_ep else "TRAIN"
-            print(f"Charge <- {path} [{status}] | LR: {self._get_lr():.2e}")
+            runtime = "eager" if self.infer_net is None else "int8" if self.use_quantized else "TorchScript"
+            print(f"Charge <- {path} [{status}] | LR: {self._get_lr():.2e} | {runtime}")
         except FileNotFoundError:
             print(f"[Bot] No save found at {path}")
 
+    def _resume(self, path: str, ckpt: dict):
+        """
+        Restaure le replay buffer (instantané memmap) et les générateurs aléatoires d'un point de reprise
+
+        Args:
+            path (str): chemin du fichier de sauvegarde
+            ckpt (dict): contenu chargé
+        """
+        directory = read_replay_dir(path, ckpt)
+        if directory is not None:
+            restore_replay(self.buffer, directory, pos=ckpt.get("replay_pos"))
+        # Flux des acteurs et du mélange hors ligne : pas de réutilisation de ceux d'avant l'interruption
+        self.seed_seq = with_spawned(self.seed_seq, ckpt.get("seed_children", 0))
+        pending = restore_rng_states(ckpt.get("rng", {}), {"replay": self.buffer.rng})
+        self._pending_env_rng = pending.get("env")
+        print(f"Reprise <- {len(self.buffer)} échantillons | {self.metrics.count} épisodes d'historique")
+
+
+# ======================================== EPISODE ========================================
+def play_episode(env: PongEnv, predict: Callable, on_sample: Callable) -> tuple[int, list[float]]:
+    """
+    Joue un épisode complet en suivant la position Y d'arrivée prédite
+
+    Args:
+        env (PongEnv): environnement de jeu
+        predict (Callable): prédicteur (ball_x, ball_y, ball_dx, ball_dy) -> position Y d'arrivée en pixels
+        on_sample (Callable): reçoit (state, target_y) à chaque arrivée de la balle au niveau de la raquette
+
+    Returns:
+        Tuple (score, erreurs de prédiction en pixels)
+    """
+    raw  = env.reset()
+    done = False
+    score = 0
+    ep_errors: list[float] = []
+
+    prev_dx, prev_dy = 0.0, 0.0
+    pending_state    = None
+    pending_pred     = Bot.CENTER
+
+    while not done:
+        _, ball_x, ball_y, ball_dx, ball_dy = raw
+
+        if (ball_dx, ball_dy) != (prev_dx, prev_dy):
+            prev_dx, prev_dy = ball_dx, ball_dy
+            if ball_dx > 0:
+                pending_state = Bot._normalize(ball_x, ball_y, ball_dx, ball_dy)
+                pending_pred  = predict(ball_x, ball_y, ball_dx, ball_dy)
+
+        p2_y = raw[0]
+        if p2_y < pending_pred - Bot.DEAD_ZONE:    action =  1
+        elif p2_y > pending_pred + Bot.DEAD_ZONE:  action = -1
+        else:                                       action =  0
+
+        raw_next, reward, done = env.step(action)
+
+        if reward >= 1.0 or (done and reward <= -1.0):
+            if reward >= 1.0:
+                score += 1
+            if pending_state is not None:
+                actual_y = raw_next[2]
+                ep_errors.append(abs(actual_y - pending_pred))
+                on_sample(pending_state, actual_y / Bot.HEIGHT)
+                pending_state = None
+
+        raw = raw_next
+
+    return score, ep_errors
+
+def check_quantized(bot: Bot, n_episodes: int = 50, seed: int = 0) -> dict:
+    """
+    Compare le réseau flottant et sa copie int8 sur les mêmes épisodes (mêmes graines)
+
+    Args:
+        bot (Bot): agent dont le réseau est évalué
+        n_episodes (int): nombre d'épisodes joués par variante
+        seed (int): graine des épisodes
+
+    Returns:
+        Erreur d'arrivée moyenne (ep_errors), score moyen et taille des poids par variante, et leurs écarts
+    """
+    report = {}
+    nets = {"float": bot.net.cpu().eval(), "int8": quantize_net(bot.net)}
+    for name, net in nets.items():
+        def predict(ball_x: float, ball_y: float, ball_dx: float, ball_dy: float) -> float:
+            t = torch.from_numpy(Bot._normalize(ball_x, ball_y, ball_dx, ball_dy)).unsqueeze(0)
+            with torch.no_grad():
+                return net(t).item() * Bot.HEIGHT
+
+        env = PongEnv(seed=seed)
+        scores, errors = [], []
+        for _ in range(n_episodes):
+            score, ep_errors = play_episode(env, predict, lambda state, target_y: None)
+            scores.append(score)
+            errors.extend(ep_errors)
+        report[name] = {
+            "mean_error_px": float(np.mean(errors)) if errors else 0.0,
+            "mean_score": float(np.mean(scores)),
+            "weight_bytes": weight_bytes(net),
+        }
+    bot.net.to(bot.device)
+
+    report["error_delta_px"] = report["int8"]["mean_error_px"] - report["float"]["mean_error_px"]
+    report["score_delta"] = report["int8"]["mean_score"] - report["float"]["mean_score"]
+    print(
+        f"[Quantization] Err: {report['float']['mean_error_px']:.2f}px -> {report['int8']['mean_error_px']:.2f}px "
+        f"({report['error_delta_px']:+.2f}) | Score: {report['float']['mean_score']:.2f} -> {report['int8']['mean_score']:.2f} "
+        f"({report['score_delta']:+.2f}) | Poids: {report['float']['weight_bytes']} -> {report['int8']['weight_bytes']} octets"
+    )
+    return report
+
+def _regression_actor(actor_id: int, weights: SharedWeights, transitions: SharedTransitions, stats, stop, seeds: list | None = None):
+    """
+    Processus acteur de Bot.train_parallel : joue des épisodes avec une copie locale du réseau
+
+    Args:
+        actor_id (int): indice de l'acteur
+        weights (SharedWeights): poids diffusés par le learner
+        transitions (SharedTransitions): anneaux de transitions vers le learner
+        stats (Queue): statistiques (score, erreurs) de fin d'épisode
+        stop (Event): signal d'arrêt
+        seeds (list | None): SeedSequence de chaque acteur (flux de l'environnement indépendants)
+    """
+    torch.set_num_threads(1)
+    stats.cancel_join_thread()
+    net = RegressionNet()
+    version = weights.pull(net)
+    net.eval()
+    env = PongEnv(seed=seeds[actor_id] if seeds is not None else None)
+    row = np.empty(5, dtype=np.float32)
+
+    def predict(ball_x: float, ball_y: float, ball_dx: float, ball_dy: float) -> float:
+        nonlocal version
+        if weights.changed(version):
+            version = weights.pull(net)
+        t = torch.from_numpy(Bot._normalize(ball_x, ball_y, ball_dx, ball_dy)).unsqueeze(0)
+        with torch.no_grad():
+            return net(t).item() * Bot.HEIGHT
+
+    def on_sample(state: np.ndarray, target_y: float):
+        row[:4] = state
+        row[4]  = target_y
+        transitions.write(actor_id, row)
+
+    while not stop.is_set():
+        stats.put(play_episode(env, predict, on_sample))
+
+# ======================================== DONNEES HORS LIGNE ========================================
+def generate_dataset(
+    out_dir: str,
+    n_samples: int,
+    n_envs: int = 4096,
+    shard_size: int = 1 << 20,
+    seed: int | None = None,
+) -> list[str]:
+    """
+    Simule des trajectoires en masse (physique de PongEnv, bruit de rebond compris) et écrit
+    les couples (état normalisé, Y d'arrivée normalisée) dans des fragments .npy mappés en mémoire
+
+    Les étiquettes sont celles de play_episode : état au dernier changement de direction vers la raquette,
+    position Y de la balle lorsqu'elle atteint la raquette (renvoyée ou perdue).
+    La raquette suit la balle pour prolonger les échanges.
+
+    Args:
+        out_dir (str): dossier des fragments
+        n_samples (int): nombre de couples à générer
+        n_envs (int): nombre d'épisodes simulés en parallèle
+        shard_size (int): nombre maximal de couples par fragment
+        seed (int | None): graine de la simulation
+
+    Returns:
+        Chemins des fragments écrits
+    """
+    env = VecPongEnv(n_envs, seed=seed)
+    writer = ShardWriter(out_dir, n_samples, 5, shard_size)
+    states = env.reset()
+    prev = np.zeros((n_envs, 2))
+    pending = np.zeros((n_envs, 4), dtype=np.float32)
+    has_pending = np.zeros(n_envs, dtype=bool)
+    scale = Bot.STATE_SCALE
+
+    while not writer.full:
+        # Mémorisation de l'état à chaque changement de direction vers la raquette
+        direction = states[:, 3:5]
+        changed = (direction != prev).any(axis=1)
+        prev[changed] = direction[changed]
+        aim = changed & (direction[:, 0] > 0)
+        pending[aim] = states[aim, 1:5] / scale
+        has_pending |= aim
+
+        gap = states[:, 2] - states[:, 0]
+        actions = np.where(gap > Bot.DEAD_ZONE, 1, np.where(gap < -Bot.DEAD_ZONE, -1, 0))
+        states, rewards, dones = env.step(actions)
+
+        # Arrivée de la balle au niveau de la raquette
+        arrived = (rewards != 0.0) & has_pending
+        if arrived.any():
+            arrival_y = np.where(dones, env.final_states[:, 2], states[:, 2])[arrived]
+            rows = np.empty((len(arrival_y), 5), dtype=np.float32)
+            rows[:, :4] = pending[arrived]
+            rows[:, 4] = arrival_y / Bot.HEIGHT
+            writer.write(rows)
+            has_pending[arrived] = False
+
+        # Épisodes réinitialisés
+        has_pending[dones] = False
+        prev[dones] = 0.0
+
+    writer.close()
+    return [str(path) for path in writer.paths]
 
 # ======================================== ENVIRONNEMENT ========================================
 class PongEnv:
@@ -435,12 +769,17 @@ class PongEnv:
     BALL_BOUNCING_EPSILON = 5                                               # (int)  : variation angulaire aléatoire sur les rebonds
     MAX_FRAMES = 3000                                                       # (int)  : durée maximale d'un épisode en frames
 
-    def __init__(self):
+    def __init__(self, seed: Seed = None):
+        """
+        Args:
+            seed (int | SeedSequence | None): graine du flux aléatoire propre à l'environnement
+        """
+        self.rng = np.random.default_rng(seed)
         self.reset()
 
     def _random_angle_rad(self) -> float:
         """Tire un angle de départ aléatoire entre BALL_ANGLE_MIN et BALL_ANGLE_MAX"""
-        return math.radians(random.uniform(self.BALL_ANGLE_MIN, self.BALL_ANGLE_MAX))
+        return math.radians(self.rng.uniform(self.BALL_ANGLE_MIN, self.BALL_ANGLE_MAX))
 
     def reset(self) -> list[float]:
         """
@@ -455,8 +794,8 @@ class PongEnv:
         self.ball_speed = float(self.BALL_SPEED_MIN)
         self.frame      = 0
         angle           = self._random_angle_rad()
-        direction       = random.choice([-1, 1])
-        sign_y          = random.choice([-1, 1])
+        direction       = (-1, 1)[self.rng.integers(2)]
+        sign_y          = (-1, 1)[self.rng.integers(2)]
         self.ball_dx    = direction * math.cos(angle)
         self.ball_dy    = sign_y    * math.sin(angle)
         self.done       = False
@@ -561,51 +900,244 @@ class PongEnv:
         Returns:
             Nouvelle composante Y perturbée
         """
-        eps_rad = math.radians(random.uniform(-self.BALL_BOUNCING_EPSILON, self.BALL_BOUNCING_EPSILON))
+        eps_rad = math.radians(self.rng.uniform(-self.BALL_BOUNCING_EPSILON, self.BALL_BOUNCING_EPSILON))
         sign = math.copysign(1, dy)
         angle = math.asin(max(-1.0, min(1.0, abs(dy))))
         new_angle = max(0.0, angle + eps_rad)
         return sign * math.sin(new_angle)
 
+# ======================================== ENVIRONNEMENT VECTORISE ========================================
+class VecPongEnv:
+    """
+    Environnement de pong vectorisé : avance N épisodes de PongEnv en un seul appel
+
+    L'état est stocké en structure de tableaux (une ligne numpy par grandeur)
+    et chaque step applique les règles de PongEnv par opérations masquées.
+    Les épisodes terminés sont réinitialisés automatiquement, leur dernier état est conservé dans `final_states`.
+    """
+    WIDTH = PongEnv.WIDTH                                                   # (int)  : largeur du terrain en pixels
+    HEIGHT = PongEnv.HEIGHT                                                 # (int)  : hauteur du terrain en pixels
+    PADDLE_H = PongEnv.PADDLE_H                                             # (int)  : hauteur de la raquette en pixels
+    PADDLE_SPEED = PongEnv.PADDLE_SPEED                                     # (float): vitesse de la raquette en pixels/frame
+    PADDLE_X = PongEnv.PADDLE_X                                             # (int)  : position X fixe de la raquette
+    BALL_RADIUS = PongEnv.BALL_RADIUS                                       # (int)  : rayon de la balle en pixels
+    BALL_SPEED_MIN = PongEnv.BALL_SPEED_MIN                                 # (float): vitesse initiale de la balle en pixels/frame
+    BALL_SPEED_MAX = PongEnv.BALL_SPEED_MAX                                 # (float): vitesse maximale de la balle en pixels/frame
+    BALL_ACCEL_FRAMES = PongEnv.BALL_ACCEL_FRAMES                           # (int)  : durée de l'accélération en frames
+    BALL_ANGLE_MIN = PongEnv.BALL_ANGLE_MIN                                 # (int)  : angle minimal de départ en degrés
+    BALL_ANGLE_MAX = PongEnv.BALL_ANGLE_MAX                                 # (int)  : angle maximal de départ en degrés
+    BALL_BOUNCING_EPSILON = PongEnv.BALL_BOUNCING_EPSILON                   # (int)  : variation angulaire aléatoire sur les rebonds
+    MAX_FRAMES = PongEnv.MAX_FRAMES                                         # (int)  : durée maximale d'un épisode en frames
+
+    def __init__(self, n_envs: int, seed: Seed = None):
+        """
+        Args:
+            n_envs (int): nombre d'épisodes simulés en parallèle
+            seed (int | SeedSequence | None): graine du générateur aléatoire
+        """
+        self.n_envs = n_envs
+        self.rng = np.random.default_rng(seed)
+
+        # Structure de tableaux : [p2_y, ball_x, ball_y, ball_dx, ball_dy]
+        self._data = np.empty((5, n_envs), dtype=np.float64)
+        self.p2_y, self.ball_x, self.ball_y, self.ball_dx, self.ball_dy = self._data
+        self.frame = np.zeros(n_envs, dtype=np.int64)
+        self.final_states = np.zeros((n_envs, 5), dtype=np.float64)
+
+        self.reset()
+
+    def __len__(self) -> int:
+        """Renvoie le nombre d'épisodes simulés"""
+        return self.n_envs
+
+    def reset(self) -> np.ndarray:
+        """
+        Réinitialise tous les épisodes
+
+        Returns:
+            États initiaux de forme (n_envs, 5) : [p2_y, ball_x, ball_y, ball_dx, ball_dy]
+        """
+        self._reset_mask(np.ones(self.n_envs, dtype=bool))
+        return self._state()
+
+    def _reset_mask(self, mask: np.ndarray):
+        """
+        Réinitialise les épisodes sélectionnés par un masque
+
+        Args:
+            mask (np.ndarray): masque booléen des épisodes à réinitialiser
+        """
+        n = int(np.count_nonzero(mask))
+        if n == 0:
+            return
+        angle     = np.radians(self.rng.uniform(self.BALL_ANGLE_MIN, self.BALL_ANGLE_MAX, n))
+        direction = self.rng.choice((-1.0, 1.0), n)
+        sign_y    = self.rng.choice((-1.0, 1.0), n)
+        self.p2_y[mask]    = self.HEIGHT / 2
+        self.ball_x[mask]  = self.WIDTH  / 2
+        self.ball_y[mask]  = self.HEIGHT / 2
+        self.ball_dx[mask] = direction * np.cos(angle)
+        self.ball_dy[mask] = sign_y    * np.sin(angle)
+        self.frame[mask]   = 0
+
+    def _state(self) -> np.ndarray:
+        """Renvoie une copie de l'état courant de forme (n_envs, 5)"""
+        return self._data.T.copy()
+
+    def step(self, actions: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Avance tous les épisodes d'un frame
+
+        Args:
+            actions (np.ndarray): actions de forme (n_envs,) dans {-1, 0, 1}
+
+        Returns:
+            Tuple (states, rewards, dones)
+            - states : états suivants, déjà réinitialisés pour les épisodes terminés
+            - rewards : mêmes récompenses que PongEnv.step
+            - dones : épisodes terminés à ce frame (leur dernier état est dans final_states)
+        """
+        r = self.BALL_RADIUS
+        self.frame += 1
+        speed = np.minimum(self.frame / self.BALL_ACCEL_FRAMES, 1.0)
+        speed *= self.BALL_SPEED_MAX - self.BALL_SPEED_MIN
+        speed += self.BALL_SPEED_MIN
+
+        # Déplacement raquette et balle
+        self._move_paddle(actions)
+        self.ball_x += self.ball_dx * speed
+        self.ball_y += self.ball_dy * speed
+
+        rewards = np.zeros(self.n_envs, dtype=np.float64)
+
+        # Rebonds haut / bas
+        top = self.ball_y <= r
+        if top.any():
+            self.ball_y[top]  = r
+            self.ball_dy[top] = self._add_epsilon(np.abs(self.ball_dy[top]))
+        bottom = self.ball_y >= self.HEIGHT - r
+        if bottom.any():
+            self.ball_y[bottom]  = self.HEIGHT - r
+            self.ball_dy[bottom] = -self._add_epsilon(np.abs(self.ball_dy[bottom]))
+
+        # Rebond gauche
+        left = self.ball_x <= r
+        if left.any():
+            self.ball_x[left]  = r
+            self.ball_dx[left] = np.abs(self.ball_dx[left])
+
+        # Collision avec la raquette
+        self._collide_paddle(speed, rewards)
+
+        # Fin d'épisode
+        lost  = self.ball_x > self.WIDTH + r
+        rewards[lost] = -1.0
+        dones = lost | (self.frame >= self.MAX_FRAMES)
+
+        # Réinitialisation automatique
+        if dones.any():
+            self.final_states[dones] = self._data.T[dones]
+            self._reset_mask(dones)
+
+        return self._state(), rewards, dones
+
+    def _move_paddle(self, actions: np.ndarray):
+        """
+        Déplace les raquettes dans les limites du terrain
+
+        Args:
+            actions (np.ndarray): actions de forme (n_envs,) dans {-1, 0, 1}
+        """
+        self.p2_y += np.asarray(actions, dtype=np.float64) * self.PADDLE_SPEED
+        np.clip(self.p2_y, self.PADDLE_H / 2, self.HEIGHT - self.PADDLE_H / 2, out=self.p2_y)
+
+    def _collide_paddle(self, speed: np.ndarray, rewards: np.ndarray):
+        """
+        Renvoie les balles qui atteignent la raquette pendant ce frame (anti-tunneling, angle borné)
+
+        Args:
+            speed (np.ndarray): vitesses des balles pendant ce frame
+            rewards (np.ndarray): récompenses du frame (+1.0 sur les renvois)
+        """
+        r = self.BALL_RADIUS
+        crossed = (self.ball_dx > 0) & (self.ball_x + r >= self.PADDLE_X)
+        crossed &= self.ball_x - self.ball_dx * speed + r < self.PADDLE_X
+        if crossed.any():
+            idx = np.flatnonzero(crossed)
+            s   = speed[idx]
+            x1  = self.ball_x[idx]
+            x0  = x1 - self.ball_dx[idx] * s
+            t   = np.ones_like(x1)
+            moved = x1 != x0
+            t[moved] = (self.PADDLE_X - r - x0[moved]) / (x1[moved] - x0[moved])
+            y_at_impact = self.ball_y[idx] - self.ball_dy[idx] * s * (1 - t)
+            np.clip(y_at_impact, r, self.HEIGHT - r, out=y_at_impact)
+
+            hit = np.abs(y_at_impact - self.p2_y[idx]) <= self.PADDLE_H / 2
+            if hit.any():
+                idx = idx[hit]
+                y   = y_at_impact[hit]
+                dx  = -np.abs(self.ball_dx[idx])
+                dy  = self.ball_dy[idx] + (y - self.p2_y[idx]) / (self.PADDLE_H / 2) * math.sin(math.radians(self.BALL_ANGLE_MAX))
+                dy  = self._add_epsilon(dy)
+
+                norm = np.hypot(dx, dy)
+                nz = norm > 0
+                dx[nz] /= norm[nz]
+                dy[nz] /= norm[nz]
+
+                # Clamp de l'angle
+                angle = np.arcsin(np.minimum(np.abs(dy), 1.0))
+                np.clip(angle, math.radians(self.BALL_ANGLE_MIN), math.radians(self.BALL_ANGLE_MAX), out=angle)
+                self.ball_x[idx]  = self.PADDLE_X - r
+                self.ball_y[idx]  = y
+                self.ball_dx[idx] = np.copysign(np.cos(angle), dx)
+                self.ball_dy[idx] = np.copysign(np.sin(angle), dy)
+                rewards[idx] = 1.0
+
+    def _add_epsilon(self, dy: np.ndarray) -> np.ndarray:
+        """
+        Ajoute une perturbation angulaire aléatoire lors d'un rebond
+
+        Args:
+            dy (np.ndarray): composantes Y des directions courantes
+
+        Returns:
+            Nouvelles composantes Y perturbées
+        """
+        eps_rad = np.radians(self.rng.uniform(-self.BALL_BOUNCING_EPSILON, self.BALL_BOUNCING_EPSILON, dy.shape))
+        angle = np.arcsin(np.minimum(np.abs(dy), 1.0))
+        new_angle = np.maximum(angle + eps_rad, 0.0)
+        return np.copysign(np.sin(new_angle), dy)
+
 # ======================================== VISUALISATION ========================================
 def plot_training(bot: Bot, window: int = 50):
     """
     Affiche les courbes de score, de loss et de précision sur l'ensemble de l'entraînement
+    L'historique est relu depuis le journal de métriques (ou l'historique décimé en mémoire) et sous-échantillonné (LTTB)
 
     Args:
-        bot (Bot): agent entraîné contenant les historiques
+        bot (Bot): agent entraîné (journal de métriques)
         window (int): taille de la fenêtre de moyenne glissante
     """
-    scores = np.array(bot.all_scores, dtype=float)
-    losses = np.array(bot.all_losses)
-    errors = np.array(bot.all_errors)
-    eps = np.arange(1, len(scores) + 1)
-
-    def rolling(arr, w):
-        return np.convolve(arr, np.ones(w) / w, mode="valid")
+    log = history(bot.metrics)
 
     fig, axs = plt.subplots(3, 1, figsize=(12, 10))
     fig.suptitle("Pong — Regression v7", fontsize=14)
 
-    axs[0].plot(eps, scores, alpha=0.25, color="steelblue")
-    if len(scores) >= window:
-        axs[0].plot(eps[window-1:], rolling(scores, window), color="steelblue", lw=2)
-    axs[0].set_ylabel("Renvois"); axs[0].set_title("Score par épisode")
-    axs[0].grid(True, alpha=0.4)
+    for ax, name, color in zip(axs, ("score", "loss", "error"), ("steelblue", "crimson", "darkorange")):
+        raw, avg = curve(log["episode"], log[name], window)
+        ax.plot(*raw, alpha=0.25, color=color)
+        if avg is not None:
+            ax.plot(*avg, color=color, lw=2)
+        ax.grid(True, alpha=0.4)
 
-    axs[1].plot(eps, losses, alpha=0.25, color="crimson")
-    if len(losses) >= window:
-        axs[1].plot(eps[window-1:], rolling(losses, window), color="crimson", lw=2)
+    axs[0].set_ylabel("Renvois"); axs[0].set_title("Score par épisode")
     axs[1].set_ylabel("MSE Loss"); axs[1].set_title("Loss")
-    axs[1].grid(True, alpha=0.4)
-
-    axs[2].plot(eps, errors, alpha=0.25, color="darkorange")
-    if len(errors) >= window:
-        axs[2].plot(eps[window-1:], rolling(errors, window), color="darkorange", lw=2)
     axs[2].axhline(42, color="green",  linestyle="--", lw=1, label="PADDLE_H/2 = 42px")
     axs[2].axhline(25, color="purple", linestyle="--", lw=1, label="DEAD_ZONE = 25px")
     axs[2].set_ylabel("Erreur px"); axs[2].set_title("Précision")
-    axs[2].legend(); axs[2].grid(True, alpha=0.4)
+    axs[2].legend()
 
     if bot.converged_ep > 0:
         for ax in axs:
@@ -630,6 +1162,10 @@ if __name__ == "__main__":
             grad_steps=5,
             plateau_window=100,
             plateau_threshold=1.5,
+            compiled=False,
+            checkpoint_every=100,
+            resume=True,
+            metrics_path="_data/bot.metrics",
         )
         env = PongEnv()
         n_episodes = int(input("Nombre d'épisodes : "))
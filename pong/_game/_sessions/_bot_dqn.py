@@ -1,35 +1,150 @@
 # ======================================== IMPORTS ========================================
 from __future__ import annotations
 from numbers import Real
+from collections import deque
+from typing import Callable
 import torch
 import torch.nn as nn
-import random
 import math
-import collections
 import numpy as np
 import matplotlib.pyplot as plt
 
+try:
+    from ._replay import RingBuffer, PrioritizedRingBuffer
+    from ._actors import SharedWeights, SharedTransitions, run_learner
+    from ._compiled import export_script, load_script
+    from ._quantized import quantize_net, weight_bytes
+    from ._seeding import Seed, as_seed_sequence, with_spawned, torch_seed
+    from ._metrics import MetricsLog, legacy_state, history, curve
+    from ._checkpoint import (Checkpointer, detach, rng_states, restore_rng_states,
+                              snapshot_replay, write_checkpoint, read_replay_dir, restore_replay)
+    from ._bot import VecPongEnv as RegressionVecPongEnv
+except ImportError:  # exécution directe du script d'entraînement
+    from _replay import RingBuffer, PrioritizedRingBuffer
+    from _actors import SharedWeights, SharedTransitions, run_learner
+    from _compiled import export_script, load_script
+    from _quantized import quantize_net, weight_bytes
+    from _seeding import Seed, as_seed_sequence, with_spawned, torch_seed
+    from _metrics import MetricsLog, legacy_state, history, curve
+    from _checkpoint import (Checkpointer, detach, rng_states, restore_rng_states,
+                             snapshot_replay, write_checkpoint, read_replay_dir, restore_replay)
+    from _bot import VecPongEnv as RegressionVecPongEnv
+
 # ======================================== REPLAY BUFFER ========================================
-class ReplayBuffer:
-    def __init__(self, capacity: int = 50_000):
-        self.buffer = collections.deque(maxlen=capacity)
+COLUMNS = {
+    "state":      ((6,), np.float32),
+    "action":     ((),   np.int64),
+    "reward":     ((),   np.float32),
+    "next_state": ((6,), np.float32),
+    "done":       ((),   np.float32),
+}
+
+class ReplayBuffer(RingBuffer):
+    def __init__(self, capacity: int = 50_000, seed: Seed = None):
+        super().__init__(capacity, COLUMNS, seed=seed)
 
     def push(self, state, action, reward, next_state, done):
-        self.buffer.append((state, action, reward, next_state, done))
-
-    def sample(self, batch_size: int):
-        batch = random.sample(self.buffer, batch_size)
-        states, actions, rewards, next_states, dones = zip(*batch)
-        return (
-            np.array(states,      dtype=np.float32),
-            np.array(actions,     dtype=np.int64),
-            np.array(rewards,     dtype=np.float32),
-            np.array(next_states, dtype=np.float32),
-            np.array(dones,       dtype=np.float32),
-        )
+        super().push(state, action, reward, next_state, done)
+
+
+class PrioritizedReplayBuffer(PrioritizedRingBuffer):
+    """Replay buffer à priorités : sample(batch_size, beta) renvoie aussi (idx, poids d'importance)"""
+    def __init__(self, capacity: int = 50_000, alpha: float = 0.6, seed: Seed = None):
+        super().__init__(capacity, COLUMNS, alpha=alpha, seed=seed)
+
+    def push(self, state, action, reward, next_state, done):
+        super().push(state, action, reward, next_state, done)
 
-    def __len__(self):
-        return len(self.buffer)
+
+class NStepAccumulator:
+    """
+    Transforme des transitions 1-pas en transitions n-pas :
+    (s_t, a_t, r_t + γ r_t+1 + ... + γ^(n-1) r_t+n-1, s_t+n, done_t+n).
+    En fin d'épisode les transitions restantes sont émises avec un retour tronqué (done = 1).
+    """
+    def __init__(self, n: int, gamma: float):
+        self.n       = n
+        self.gamma   = gamma
+        self.pending = deque()
+
+    def push(self, state, action, reward, next_state, done) -> list[tuple]:
+        if self.n == 1:
+            return [(state, action, reward, next_state, done)]
+        self.pending.append((state, action, reward))
+        ready = []
+        if len(self.pending) == self.n:
+            ready.append(self._emit(next_state, done))
+        if done:
+            while self.pending:
+                ready.append(self._emit(next_state, done))
+        return ready
+
+    def _emit(self, next_state, done) -> tuple:
+        ret = 0.0
+        for i, (_, _, r) in enumerate(self.pending):
+            ret += (self.gamma ** i) * r
+        state, action, _ = self.pending.popleft()
+        return state, action, ret, next_state, done
+
+    def clear(self):
+        self.pending.clear()
+
+
+class VecNStepAccumulator:
+    """
+    Version vectorisée de NStepAccumulator pour N environnements avancés ensemble :
+    historique circulaire (n, n_envs) commun, longueur en attente propre à chaque env.
+    """
+    def __init__(self, n: int, gamma: float, n_envs: int, state_dim: int = 6):
+        self.n       = n
+        self.gamma   = gamma
+        self.states  = np.zeros((n, n_envs, state_dim), dtype=np.float32)
+        self.actions = np.zeros((n, n_envs), dtype=np.int64)
+        self.rewards = np.zeros((n, n_envs), dtype=np.float64)
+        self.length  = np.zeros(n_envs, dtype=np.int64)
+        self.t       = 0
+
+    def push(self, states, actions, rewards, next_states, dones) -> tuple[np.ndarray, ...]:
+        """Ajoute un step pour tous les envs, renvoie les transitions n-pas prêtes (un tableau par colonne)"""
+        if self.n == 1:
+            return states, actions, rewards, next_states, dones.astype(np.float32)
+
+        n, t = self.n, self.t
+        slot = t % n
+        self.states[slot]  = states
+        self.actions[slot] = actions
+        self.rewards[slot] = rewards
+        self.length += 1
+        out = []
+
+        # Envs dont l'historique est plein : émission de la transition la plus ancienne
+        full = np.flatnonzero((self.length == n) & ~dones)
+        if len(full):
+            oldest = (t + 1) % n
+            ret = sum((self.gamma ** i) * self.rewards[(oldest + i) % n, full] for i in range(n))
+            out.append((self.states[oldest, full], self.actions[oldest, full], ret,
+                        next_states[full], np.zeros(len(full), dtype=np.float32)))
+            self.length[full] -= 1
+
+        # Envs terminés : émission de tout l'historique avec retours tronqués
+        for k in range(n):
+            envs = np.flatnonzero(dones & (self.length > k))
+            if not len(envs):
+                break
+            lengths = self.length[envs]
+            start   = (t - lengths + 1 + k) % n
+            ret = np.zeros(len(envs), dtype=np.float64)
+            for i in range(n):
+                ret += (i < lengths - k) * (self.gamma ** i) * self.rewards[(start + i) % n, envs]
+            out.append((self.states[start, envs], self.actions[start, envs], ret,
+                        next_states[envs], np.ones(len(envs), dtype=np.float32)))
+        self.length[dones] = 0
+        self.t += 1
+
+        if not out:
+            return tuple(np.empty((0, *a.shape[1:]), dtype=a.dtype)
+                         for a in (states, self.actions[0], self.rewards[0], next_states, np.empty(0, np.float32)))
+        return tuple(np.concatenate(cols) for cols in zip(*out))
 
 
 # ======================================== RÉSEAU ========================================
@@ -78,20 +193,73 @@ class Bot(nn.Module):
         min_buffer_size: int    = 1_000,
         oscillation_penalty: float = 0.02,
         alignment_bonus:     float = 0.01,
+        prioritized:         bool  = False,
+        per_alpha:           float = 0.6,
+        per_alpha_final:     float = 0.6,
+        per_beta:            float = 0.4,
+        per_beta_final:      float = 1.0,
+        per_anneal_steps:    int   = 100_000,
+        n_step:              int   = 1,
+        frame_skip:          int   = 1,
+        learn_every:         int   = 1,
+        compiled:            bool  = True,
+        quantized:           bool  = False,
+        inference_threads:   int   = 1,
+        checkpoint_every:    int   = 0,
+        checkpoint_path:     str   = "checkpoints/bot_dqn.pth",
+        resume:              bool  = False,
+        pretrained:          bool  = True,
+        seed:                Seed  = None,
+        metrics_path:        str | None = None,
     ):
+        """
+        prioritized active le replay à priorités (sum-tree) : alpha et beta sont recuits
+        linéairement de per_alpha/per_beta vers leurs valeurs finales en per_anneal_steps mises à jour.
+        n_step : longueur des retours accumulés avant bootstrap (cible r + ... + γ^n Q(s_t+n)).
+        frame_skip : nombre de frames PongEnv pendant lesquelles chaque action est répétée.
+        learn_every : une mise à jour de gradient toutes les learn_every transitions.
+        compiled : get_move utilise l'artefact TorchScript (.pt) s'il est présent.
+        inference_threads : threads intra-op conseillés pour l'inférence (fixés par le point d'entrée du jeu, jamais au chargement).
+        quantized : get_move utilise une copie int8 dynamique du réseau (CPU), prioritaire sur l'artefact compilé.
+        checkpoint_every : point de reprise en arrière-plan tous les checkpoint_every épisodes (0 : désactivé).
+        checkpoint_path : destination des points de reprise périodiques (distincte de la sauvegarde finale).
+        resume : load restaure aussi le replay buffer et les générateurs aléatoires (reprise exacte d'un entraînement).
+        pretrained : charge la sauvegarde existante à la création (False : réseau vierge).
+        seed : graine racine, dont dérivent (SeedSequence.spawn) les flux du replay, de l'exploration,
+        des acteurs et de l'initialisation des réseaux (None : entropie du système, init torch globale).
+        metrics_path : journal binaire des métriques par épisode (None : agrégats glissants et historique décimé en mémoire).
+        """
         super().__init__()
         self.device = "cuda" if torch.cuda.is_available() else "cpu"
         print(f"Device : {self.device}")
 
-        self.net        = DQNNet().to(self.device)
-        self.target_net = DQNNet().to(self.device)
+        # Flux aléatoires indépendants issus de la graine racine
+        self.seed_seq = as_seed_sequence(seed)
+        replay_seed, agent_seed, init_seed = self.seed_seq.spawn(3)
+        self.rng = np.random.default_rng(agent_seed)
+
+        with torch.random.fork_rng(devices=[], enabled=seed is not None):
+            if seed is not None:
+                torch.manual_seed(torch_seed(init_seed))
+            self.net        = DQNNet().to(self.device)
+            self.target_net = DQNNet().to(self.device)
         self.target_net.load_state_dict(self.net.state_dict())
         self.target_net.eval()
 
-        self.loss_fn   = nn.SmoothL1Loss()
+        self.loss_fn   = nn.SmoothL1Loss(reduction="none")
         self.optimiser = torch.optim.Adam(self.net.parameters(), lr=lr)
+        self.optimiser.register_step_post_hook(lambda *_: setattr(self, "infer_net", None))
+
+        self.use_compiled      = compiled
+        self.use_quantized     = quantized
+        self.inference_threads = inference_threads
+        self.infer_net         = None
 
         self.gamma               = gamma
+        self.n_step              = n_step
+        self.gamma_n             = gamma ** n_step
+        self.frame_skip          = frame_skip
+        self.learn_every         = learn_every
         self.epsilon             = epsilon_max
         self.epsilon_min         = epsilon_min
         self.epsilon_decay       = epsilon_decay
@@ -101,34 +269,62 @@ class Bot(nn.Module):
         self.oscillation_penalty = oscillation_penalty
         self.alignment_bonus     = alignment_bonus
 
-        self.buffer = ReplayBuffer(buffer_capacity)
+        self.prioritized      = prioritized
+        self.per_alpha        = (per_alpha, per_alpha_final)
+        self.per_beta         = (per_beta, per_beta_final)
+        self.per_anneal_steps = per_anneal_steps
+        self.updates          = 0
+
+        if prioritized:
+            self.buffer = PrioritizedReplayBuffer(buffer_capacity, alpha=per_alpha, seed=replay_seed)
+        else:
+            self.buffer = ReplayBuffer(buffer_capacity, seed=replay_seed)
 
         self.is_training   = False
         self.total_steps   = 0
         self.episode_count = 0
-        self.all_losses:   list[float] = []
-        self.all_scores:   list[float] = []
+        self.metrics       = MetricsLog(("score", "loss"), metrics_path)
 
-        self.load()
+        self.checkpoint_every = checkpoint_every
+        self.checkpoint_path  = checkpoint_path
+        self.resume           = resume
+        self.checkpointer     = Checkpointer()
+        self.train_env        = None
+        self._pending_env_rng = None
+
+        if pretrained:
+            self.load()
 
     # ------------------------------------------------------------------
-    def _normalize(self, state: list | np.ndarray) -> np.ndarray:
-        return np.array(state, dtype=np.float32) / self.STATE_SCALE
+    @classmethod
+    def _normalize(cls, state: list | np.ndarray) -> np.ndarray:
+        return np.array(state, dtype=np.float32) / cls.STATE_SCALE
 
-    def _build_state(self, p2_y, ball_x, ball_y, ball_dx, ball_dy) -> np.ndarray:
+    @classmethod
+    def _build_state(cls, p2_y, ball_x, ball_y, ball_dx, ball_dy) -> np.ndarray:
         delta_y = ball_y - p2_y
-        return self._normalize([p2_y, ball_x, ball_y, ball_dx, ball_dy, delta_y])
+        return cls._normalize([p2_y, ball_x, ball_y, ball_dx, ball_dy, delta_y])
+
+    @classmethod
+    def _build_states(cls, raw: np.ndarray) -> np.ndarray:
+        """Version batch de _build_state : (n, 5) [p2_y, ball_x, ball_y, ball_dx, ball_dy] → (n, 6)"""
+        states = np.empty((len(raw), 6), dtype=np.float32)
+        states[:, :5] = raw
+        states[:, 5]  = raw[:, 2] - raw[:, 0]
+        states /= cls.STATE_SCALE
+        return states
 
     def get_move(self, p2_y: Real, ball_x: Real, ball_y: Real,
                  ball_dx: Real, ball_dy: Real) -> int:
         """Retourne -1 (monter), 0 (rester), +1 (descendre)"""
         state = self._build_state(p2_y, ball_x, ball_y, ball_dx, ball_dy)
-        if self.is_training and random.random() < self.epsilon:
-            action = random.randint(0, 2)
+        if self.is_training and self.rng.random() < self.epsilon:
+            action = int(self.rng.integers(3))
         else:
-            t = torch.tensor(state, dtype=torch.float32, device=self.device).unsqueeze(0)
+            t   = torch.tensor(state, dtype=torch.float32, device=self.device).unsqueeze(0)
+            net = self.infer_net if self.infer_net is not None else self.net
             with torch.no_grad():
-                action = int(torch.argmax(self.net(t)).item())
+                action = int(torch.argmax(net(t)).item())
         return action - 1   # {0,1,2} → {-1,0,+1}
 
     def forward(self, x: torch.Tensor) -> torch.Tensor:
@@ -139,13 +335,21 @@ class Bot(nn.Module):
         if len(self.buffer) < self.min_buffer_size:
             return None
 
-        states, actions, rewards, next_states, dones = self.buffer.sample(self.batch_size)
+        if self.prioritized:
+            frac  = min(1.0, self.updates / self.per_anneal_steps)
+            alpha = self.per_alpha[0] + frac * (self.per_alpha[1] - self.per_alpha[0])
+            beta  = self.per_beta[0]  + frac * (self.per_beta[1]  - self.per_beta[0])
+            self.buffer.set_alpha(alpha)
+            states, actions, rewards, next_states, dones, idx, weights = self.buffer.sample(self.batch_size, beta)
+        else:
+            states, actions, rewards, next_states, dones = self.buffer.sample(self.batch_size)
+            weights = None
 
-        states      = torch.tensor(states,      device=self.device)
-        next_states = torch.tensor(next_states, device=self.device)
-        actions     = torch.tensor(actions,     device=self.device)
-        rewards     = torch.tensor(rewards,     device=self.device)
-        dones       = torch.tensor(dones,       device=self.device)
+        states      = torch.from_numpy(states).to(self.device)
+        next_states = torch.from_numpy(next_states).to(self.device)
+        actions     = torch.from_numpy(actions).to(self.device)
+        rewards     = torch.from_numpy(rewards).to(self.device)
+        dones       = torch.from_numpy(dones).to(self.device)
 
         q_values = self.net(states)
         q_value  = q_values.gather(1, actions.unsqueeze(1)).squeeze(1)
@@ -153,91 +357,236 @@ class Bot(nn.Module):
         with torch.no_grad():
             best_actions = self.net(next_states).argmax(dim=1, keepdim=True)
             next_q       = self.target_net(next_states).gather(1, best_actions).squeeze(1)
-            target       = rewards + self.gamma * next_q * (1 - dones)
+            target       = rewards + self.gamma_n * next_q * (1 - dones)
 
-        loss = self.loss_fn(q_value, target)
+        # Perte pondérée par l'importance (poids à 1 en tirage uniforme)
+        losses = self.loss_fn(q_value, target)
+        if weights is not None:
+            losses = losses * torch.from_numpy(weights).to(self.device)
+        loss = losses.mean()
         self.optimiser.zero_grad()
         loss.backward()
         nn.utils.clip_grad_norm_(self.net.parameters(), max_norm=10.0)
         self.optimiser.step()
+        self.updates += 1
+
+        # Nouvelles priorités = |erreur TD|
+        if self.prioritized:
+            self.buffer.update_priorities(idx, (target - q_value).detach().abs().cpu().numpy())
         return loss.item()
 
     # ------------------------------------------------------------------
+    def _attach_env(self, env: "PongEnv"):
+        """Mémorise l'environnement d'entraînement : son flux aléatoire fait partie des points de reprise"""
+        self.train_env = env
+        if self._pending_env_rng is not None and hasattr(env, "rng"):
+            env.rng.bit_generator.state = self._pending_env_rng
+            self._pending_env_rng = None
+
     def train_agent(self, env: "PongEnv", n_episodes: int = 1000):
         self.is_training = True
-        window = 50
+        self._attach_env(env)
+
+        if self.frame_skip > 1:
+            env = ActionRepeat(env, self.frame_skip)
+        n_step = NStepAccumulator(self.n_step, self.gamma)
 
         for ep in range(n_episodes):
             self.episode_count += 1
-            raw_state = env.reset()
-            state     = self._build_state(*raw_state)
-            done      = False
-            total_reward  = 0.0
-            ep_losses:    list[float] = []
-            prev_move     = 0
-
-            while not done:
-                p2_y, ball_x, ball_y, ball_dx, ball_dy = raw_state
-                action_move = self.get_move(p2_y, ball_x, ball_y, ball_dx, ball_dy)
-                action_idx  = action_move + 1   # {-1,0,+1} → {0,1,2}
-
-                raw_next, reward, done = env.step(action_move)
-                next_state = self._build_state(*raw_next)
-                _, _, ball_y_next, _, _ = raw_next
-
-                # --- Pénalité d'oscillation ---
-                if prev_move != 0 and action_move != 0 and action_move != prev_move:
-                    reward -= self.oscillation_penalty
-
-                # --- Bonus d'alignement ---
-                delta_y = abs(ball_y - p2_y)
-                if action_move == 0 and delta_y < self.ALIGNED_THRESHOLD:
-                    reward += self.alignment_bonus
-
-                prev_move = action_move
-
-                self.buffer.push(state, action_idx, reward, next_state, done)
+            ep_losses: list[float] = []
+
+            def on_transition(state, action_idx, reward, next_state, done):
+                for transition in n_step.push(state, action_idx, reward, next_state, done):
+                    self.buffer.push(*transition)
                 self.total_steps += 1
 
-                loss = self._learn_step()
-                if loss is not None:
-                    ep_losses.append(loss)
+                if self.total_steps % self.learn_every == 0:
+                    loss = self._learn_step()
+                    if loss is not None:
+                        ep_losses.append(loss)
 
                 if self.total_steps % self.target_update_freq == 0:
                     self.target_net.load_state_dict(self.net.state_dict())
 
-                total_reward += reward
-                state        = next_state
-                raw_state    = raw_next
+            total_reward = play_episode(env, self.get_move, on_transition,
+                                        self.oscillation_penalty, self.alignment_bonus)
+            self.epsilon = max(self.epsilon_min, self.epsilon * self.epsilon_decay)
+            self._end_episode(ep, n_episodes, total_reward, ep_losses)
+
+        self.is_training = False
+
+    def train_parallel(self, n_episodes: int = 1000, n_actors: int = 4, broadcast_interval: int = 200):
+        """
+        Entraînement multiprocessus : les acteurs jouent avec une copie du réseau
+        synchronisée toutes les `broadcast_interval` mises à jour, ce processus
+        (learner) possède l'optimiseur, le réseau cible et le replay buffer.
+        Le réseau cible est synchronisé toutes les `target_update_freq` mises à jour.
+        """
+        shared_epsilon = torch.multiprocessing.get_context("spawn").Value("d", self.epsilon)
+        ep = 0
+        updates = 0
+        unlearned = 0
+        ep_losses: list[float] = []
+
+        def consume(rows: np.ndarray):
+            self.buffer.push_batch(rows[:, 0:6], rows[:, 6].astype(np.int64), rows[:, 7], rows[:, 8:14], rows[:, 14])
+            self.total_steps += len(rows)
+
+        def learn(n_new: int) -> int:
+            nonlocal updates, unlearned
+            unlearned += n_new
+            n_learn    = unlearned // self.learn_every
+            unlearned -= n_learn * self.learn_every
+            done = 0
+            for _ in range(n_learn):
+                loss = self._learn_step()
+                if loss is None:
+                    break
+                ep_losses.append(loss)
+                done    += 1
+                updates += 1
+                if updates % self.target_update_freq == 0:
+                    self.target_net.load_state_dict(self.net.state_dict())
+            return done
 
+        def on_episode(total_reward: float):
+            nonlocal ep
+            self.episode_count += 1
             self.epsilon = max(self.epsilon_min, self.epsilon * self.epsilon_decay)
+            shared_epsilon.value = self.epsilon
+            self._end_episode(ep, n_episodes, total_reward, ep_losses)
+            ep_losses.clear()
+            ep += 1
+
+        run_learner(
+            self.net, _dqn_actor,
+            (shared_epsilon, self.oscillation_penalty, self.alignment_bonus,
+             self.n_step, self.gamma, self.frame_skip, self.seed_seq.spawn(n_actors)), 15, n_episodes,
+            consume, learn, on_episode,
+            n_actors=n_actors, broadcast_interval=broadcast_interval,
+        )
 
-            mean_loss = float(np.mean(ep_losses)) if ep_losses else 0.0
-            self.all_scores.append(total_reward)
-            self.all_losses.append(mean_loss)
+    def train_vectorized(self, n_episodes: int = 1000, n_envs: int = 32, seed: int | None = None):
+        """
+        Entraînement sur n_envs épisodes avancés ensemble (VecPongEnv) : une passe du réseau
+        pour tous les envs, ε-greedy masqué, push du batch de transitions en une fois,
+        pénalité d'oscillation et bonus d'alignement tenus par env dans des tableaux.
+        """
+        self.is_training = True
+        root = as_seed_sequence(seed) if seed is not None else self.seed_seq.spawn(1)[0]
+        env_seed, explore_seed = root.spawn(2)
+        env = VecPongEnv(n_envs, seed=env_seed)
+        if self.frame_skip > 1:
+            env = VecActionRepeat(env, self.frame_skip)
+        n_step = VecNStepAccumulator(self.n_step, self.gamma, n_envs)
+        rng    = np.random.default_rng(explore_seed)
+
+        raw        = env.reset()
+        states     = self._build_states(raw)
+        prev_move  = np.zeros(n_envs, dtype=np.int64)
+        ep_rewards = np.zeros(n_envs, dtype=np.float64)
+        ep_losses: list[float] = []
+        ep = 0
+        unlearned = 0
+
+        while ep < n_episodes:
+            # ε-greedy masqué sur une seule passe du réseau
+            with torch.no_grad():
+                greedy = self.net(torch.from_numpy(states).to(self.device)).argmax(dim=1).cpu().numpy()
+            explore    = rng.random(n_envs) < self.epsilon
+            action_idx = np.where(explore, rng.integers(0, 3, n_envs), greedy)
+            moves      = action_idx - 1
+
+            raw_next, rewards, dones = env.step(moves)
+
+            # --- Pénalité d'oscillation / bonus d'alignement ---
+            rewards -= self.oscillation_penalty * ((prev_move != 0) & (moves != 0) & (moves != prev_move))
+            rewards += self.alignment_bonus * ((moves == 0) & (np.abs(raw[:, 2] - raw[:, 0]) < self.ALIGNED_THRESHOLD))
+            prev_move = np.where(dones, 0, moves)
+
+            next_states = self._build_states(np.where(dones[:, None], env.final_states, raw_next))
+            self.buffer.push_batch(*n_step.push(states, action_idx, rewards, next_states, dones))
+
+            # Apprentissage au ratio learn_every, réseau cible tous les target_update_freq steps
+            prev_steps        = self.total_steps
+            self.total_steps += n_envs
+            unlearned        += n_envs
+            n_learn           = unlearned // self.learn_every
+            unlearned        -= n_learn * self.learn_every
+            for _ in range(n_learn):
+                loss = self._learn_step()
+                if loss is None:
+                    break
+                ep_losses.append(loss)
+            if self.total_steps // self.target_update_freq != prev_steps // self.target_update_freq:
+                self.target_net.load_state_dict(self.net.state_dict())
+
+            # Fins d'épisode
+            ep_rewards += rewards
+            for e in np.flatnonzero(dones):
+                if ep >= n_episodes:
+                    break
+                self.episode_count += 1
+                self.epsilon = max(self.epsilon_min, self.epsilon * self.epsilon_decay)
+                self._end_episode(ep, n_episodes, float(ep_rewards[e]), ep_losses)
+                ep_losses = []
+                ep += 1
+            ep_rewards[dones] = 0.0
+
+            raw    = raw_next
+            states = self._build_states(raw)
+
+        self.is_training = False
 
-            avg_score = float(np.mean(self.all_scores[-window:]))
+    def _end_episode(self, ep: int, n_episodes: int, total_reward: float, ep_losses: list[float]):
+        window = 50
+
+        mean_loss = float(np.mean(ep_losses)) if ep_losses else 0.0
+        self.metrics.append(score=total_reward, loss=mean_loss)
+
+        if self.metrics.report_due() or ep + 1 == n_episodes:
+            avg_score = self.metrics.mean("score", window)
             print(
                 f"Ep {ep+1:>5}/{n_episodes} | "
                 f"Score: {total_reward:>6.1f} | Avg({window}): {avg_score:>6.1f} | "
                 f"ε: {self.epsilon:.4f} | Loss: {mean_loss:.4f} | "
                 f"Buffer: {len(self.buffer):>6}"
             )
-
-        self.is_training = False
+        if self.checkpoint_every and self.episode_count % self.checkpoint_every == 0:
+            self.checkpoint(self.checkpoint_path)
 
     # ------------------------------------------------------------------
+    def _training_state(self) -> dict:
+        """État complet de l'entraînement (copies détachées, sérialisables depuis un autre thread)"""
+        return detach({
+            "net":           self.net.state_dict(),
+            "target_net":    self.target_net.state_dict(),
+            "optimiser":     self.optimiser.state_dict(),
+            "epsilon":       self.epsilon,
+            "episode_count": self.episode_count,
+            "total_steps":   self.total_steps,
+            "updates":       self.updates,
+            "metrics":       self.metrics.state(),
+            "per_alpha":     getattr(self.buffer, "alpha", None),
+            "max_priority":  getattr(self.buffer, "max_priority", None),
+            "replay_pos":    self.buffer.pos,
+            "seed_children": self.seed_seq.n_children_spawned,
+            "rng":           rng_states({"replay": self.buffer.rng, "agent": self.rng,
+                                         "env": getattr(self.train_env, "rng", None)}),
+        })
+
+    def checkpoint(self, path: str | None = None):
+        """Point de reprise complet écrit en arrière-plan (atomique, replay buffer inclus ; None : checkpoint_path)"""
+        self.metrics.flush()
+        self.checkpointer.submit(path or self.checkpoint_path, self._training_state(), snapshot_replay(self.buffer))
+
     def save(self, path: str = "data/bot.pth"):
         try:
-            torch.save({
-                "net":           self.net.state_dict(),
-                "target_net":    self.target_net.state_dict(),
-                "optimiser":     self.optimiser.state_dict(),
-                "epsilon":       self.epsilon,
-                "episode_count": self.episode_count,
-                "total_steps":   self.total_steps,
-            }, path)
+            self.checkpointer.wait()
+            self.metrics.flush()
+            write_checkpoint(path, self._training_state(), snapshot_replay(self.buffer))
             print(f"Modèle sauvegardé → {path}")
+            print(f"Export TorchScript → {export_script(self.net, path, 6)}")
         except Exception as e:
             print(f"[Bot] Save error: {e}")
 
@@ -250,10 +599,143 @@ class Bot(nn.Module):
             self.epsilon        = ckpt["epsilon"]
             self.episode_count  = ckpt["episode_count"]
             self.total_steps    = ckpt["total_steps"]
-            print(f"Modèle chargé ← {path}")
+            self.updates        = ckpt.get("updates", 0)
+            self.metrics.load_state(ckpt.get("metrics") or legacy_state(ckpt))
+            if self.resume:
+                self._resume(path, ckpt)
+            if self.use_quantized and self.device == "cpu":
+                self.infer_net = quantize_net(self.net)
+            elif self.use_compiled:
+                self.infer_net = load_script(path, self.net, 6, self.device)
+            runtime = "eager" if self.infer_net is None else "int8" if self.use_quantized else "TorchScript"
+            print(f"Modèle chargé ← {path} ({runtime})")
         except FileNotFoundError:
             print(f"[Bot] No save found at {path}")
 
+    def _resume(self, path: str, ckpt: dict):
+        """Restaure le replay buffer (instantané memmap) et les générateurs aléatoires d'un point de reprise"""
+        if self.prioritized and ckpt.get("per_alpha") is not None:
+            self.buffer.alpha = ckpt["per_alpha"]
+        directory = read_replay_dir(path, ckpt)
+        if directory is not None:
+            restore_replay(self.buffer, directory, ckpt.get("max_priority") or 1.0, ckpt.get("replay_pos"))
+        # Flux des acteurs et des entraînements vectorisés : pas de réutilisation de ceux d'avant l'interruption
+        self.seed_seq = with_spawned(self.seed_seq, ckpt.get("seed_children", 0))
+        pending = restore_rng_states(ckpt.get("rng", {}), {"replay": self.buffer.rng, "agent": self.rng})
+        self._pending_env_rng = pending.get("env")
+        print(f"Reprise ← {len(self.buffer)} transitions | {self.metrics.count} épisodes d'historique")
+
+
+# ======================================== EPISODE ========================================
+def play_episode(env: "PongEnv", choose: Callable, on_transition: Callable,
+                 oscillation_penalty: float, alignment_bonus: float) -> float:
+    """
+    Joue un épisode : choose(p2_y, ball_x, ball_y, ball_dx, ball_dy) -> {-1,0,+1},
+    on_transition(state, action_idx, reward, next_state, done) reçoit chaque transition
+    avec la pénalité d'oscillation et le bonus d'alignement. Renvoie la récompense totale.
+    """
+    raw_state = env.reset()
+    state     = Bot._build_state(*raw_state)
+    done      = False
+    total_reward = 0.0
+    prev_move    = 0
+
+    while not done:
+        p2_y, ball_x, ball_y, ball_dx, ball_dy = raw_state
+        action_move = choose(p2_y, ball_x, ball_y, ball_dx, ball_dy)
+        action_idx  = action_move + 1   # {-1,0,+1} → {0,1,2}
+
+        raw_next, reward, done = env.step(action_move)
+        next_state = Bot._build_state(*raw_next)
+
+        # --- Pénalité d'oscillation ---
+        if prev_move != 0 and action_move != 0 and action_move != prev_move:
+            reward -= oscillation_penalty
+
+        # --- Bonus d'alignement ---
+        delta_y = abs(ball_y - p2_y)
+        if action_move == 0 and delta_y < Bot.ALIGNED_THRESHOLD:
+            reward += alignment_bonus
+
+        prev_move = action_move
+
+        on_transition(state, action_idx, reward, next_state, done)
+
+        total_reward += reward
+        state        = next_state
+        raw_state    = raw_next
+
+    return total_reward
+
+
+def check_quantized(bot: Bot, n_episodes: int = 20, seed: int = 0, n_states: int = 4096) -> dict:
+    """
+    Compare le réseau flottant et sa copie int8 : récompense moyenne d'épisodes gloutons
+    joués avec les mêmes graines, et accord des actions sur des états aléatoires.
+    """
+    report = {}
+    nets = {"float": bot.net.cpu().eval(), "int8": quantize_net(bot.net)}
+    for name, net in nets.items():
+        def choose(p2_y, ball_x, ball_y, ball_dx, ball_dy) -> int:
+            t = torch.from_numpy(Bot._build_state(p2_y, ball_x, ball_y, ball_dx, ball_dy)).unsqueeze(0)
+            with torch.no_grad():
+                return int(torch.argmax(net(t)).item()) - 1
+
+        env = PongEnv(seed=seed)
+        rewards = [play_episode(env, choose, lambda *_: None, bot.oscillation_penalty, bot.alignment_bonus)
+                   for _ in range(n_episodes)]
+        report[name] = {"mean_score": float(np.mean(rewards)), "weight_bytes": weight_bytes(net)}
+
+    states = torch.from_numpy(np.random.default_rng(seed).random((n_states, 6), dtype=np.float32))
+    with torch.no_grad():
+        agree = (nets["float"](states).argmax(dim=1) == nets["int8"](states).argmax(dim=1)).float().mean().item()
+    bot.net.to(bot.device)
+
+    report["score_delta"]     = report["int8"]["mean_score"] - report["float"]["mean_score"]
+    report["action_agreement"] = agree
+    print(f"[Quantization] Score: {report['float']['mean_score']:.2f} → {report['int8']['mean_score']:.2f} "
+          f"({report['score_delta']:+.2f}) | Accord actions: {agree:.1%} | "
+          f"Poids: {report['float']['weight_bytes']} → {report['int8']['weight_bytes']} octets")
+    return report
+
+
+def _dqn_actor(actor_id: int, weights: SharedWeights, transitions: SharedTransitions, stats, stop,
+               epsilon, oscillation_penalty: float, alignment_bonus: float,
+               n_step: int = 1, gamma: float = 0.99, frame_skip: int = 1, seeds: list | None = None):
+    """Processus acteur de Bot.train_parallel (ε-greedy avec une copie locale du réseau, flux aléatoires propres)"""
+    torch.set_num_threads(1)
+    stats.cancel_join_thread()
+    net = DQNNet()
+    version = weights.pull(net)
+    net.eval()
+    env_seed, explore_seed = as_seed_sequence(seeds[actor_id] if seeds is not None else None).spawn(2)
+    rng = np.random.default_rng(explore_seed)
+    env = PongEnv(seed=env_seed) if frame_skip == 1 else ActionRepeat(PongEnv(seed=env_seed), frame_skip)
+    accumulator = NStepAccumulator(n_step, gamma)
+    row = np.empty(15, dtype=np.float32)
+
+    def choose(p2_y, ball_x, ball_y, ball_dx, ball_dy) -> int:
+        nonlocal version
+        if rng.random() < epsilon.value:
+            return int(rng.integers(3)) - 1
+        if weights.changed(version):
+            version = weights.pull(net)
+        t = torch.from_numpy(Bot._build_state(p2_y, ball_x, ball_y, ball_dx, ball_dy)).unsqueeze(0)
+        with torch.no_grad():
+            return int(torch.argmax(net(t)).item()) - 1
+
+    def on_transition(state, action_idx, reward, next_state, done):
+        for state, action_idx, reward, next_state, done in accumulator.push(state, action_idx, reward, next_state, done):
+            row[0:6]  = state
+            row[6]    = action_idx
+            row[7]    = reward
+            row[8:14] = next_state
+            row[14]   = done
+            transitions.write(actor_id, row)
+
+    while not stop.is_set():
+        stats.put(play_episode(env, choose, on_transition, oscillation_penalty, alignment_bonus))
+
 
 # ======================================== ENVIRONNEMENT ========================================
 class PongEnv:
@@ -275,11 +757,12 @@ class PongEnv:
 
     MAX_FRAMES = 3000
 
-    def __init__(self):
+    def __init__(self, seed: Seed = None):
+        self.rng = np.random.default_rng(seed)
         self.reset()
 
     def _random_angle_rad(self) -> float:
-        return math.radians(random.uniform(self.BALL_ANGLE_MIN, self.BALL_ANGLE_MAX))
+        return math.radians(self.rng.uniform(self.BALL_ANGLE_MIN, self.BALL_ANGLE_MAX))
 
     def reset(self) -> list[float]:
         self.p2_y       = self.HEIGHT / 2
@@ -289,8 +772,8 @@ class PongEnv:
         self.frame      = 0
 
         angle     = self._random_angle_rad()
-        direction = random.choice([-1, 1])
-        sign_y    = random.choice([-1, 1])
+        direction = (-1, 1)[self.rng.integers(2)]
+        sign_y    = (-1, 1)[self.rng.integers(2)]
         self.ball_dx = direction * math.cos(angle)
         self.ball_dy = sign_y    * math.sin(angle)
         self.done = False
@@ -371,7 +854,7 @@ class PongEnv:
         return self._state(), reward, self.done
 
     def _add_epsilon(self, dy: float) -> float:
-        eps_rad   = math.radians(random.uniform(-self.BALL_BOUNCING_EPSILON,
+        eps_rad   = math.radians(self.rng.uniform(-self.BALL_BOUNCING_EPSILON,
                                                  self.BALL_BOUNCING_EPSILON))
         sign      = math.copysign(1, dy)
         angle     = math.asin(max(-1.0, min(1.0, abs(dy))))
@@ -379,30 +862,109 @@ class PongEnv:
         return sign * math.sin(new_angle)
 
 
+class ActionRepeat:
+    """Frame-skip : répète chaque action sur `repeat` frames de PongEnv et somme les récompenses"""
+    def __init__(self, env: PongEnv, repeat: int = 4):
+        self.env    = env
+        self.repeat = repeat
+
+    def reset(self) -> list[float]:
+        return self.env.reset()
+
+    def step(self, action: int) -> tuple[list[float], float, bool]:
+        total = 0.0
+        for _ in range(self.repeat):
+            state, reward, done = self.env.step(action)
+            total += reward
+            if done:
+                break
+        return state, total, done
+
+
+class VecPongEnv(RegressionVecPongEnv):
+    """
+    Jumeau vectorisé de PongEnv : réutilise le VecPongEnv de régression (état, resets, rebonds sur les murs)
+    avec la raquette, la collision simple et les récompenses de proximité de PongEnv.
+    """
+    PADDLE_H     = PongEnv.PADDLE_H
+    PADDLE_SPEED = PongEnv.PADDLE_SPEED
+
+    def _move_paddle(self, actions: np.ndarray):
+        prev_dist = np.abs(self.ball_y - self.p2_y)
+        super()._move_paddle(actions)
+        self._closer = np.abs(self.ball_y - self.p2_y) < prev_dist
+
+    def _collide_paddle(self, speed: np.ndarray, rewards: np.ndarray):
+        r   = self.BALL_RADIUS
+        hit = (self.ball_x + r >= self.PADDLE_X) & (self.ball_dx > 0)
+        hit &= np.abs(self.ball_y - self.p2_y) <= self.PADDLE_H / 2
+        if hit.any():
+            idx = np.flatnonzero(hit)
+            dx  = -np.abs(self.ball_dx[idx])
+            dy  = self.ball_dy[idx] + (self.ball_y[idx] - self.p2_y[idx]) / (self.PADDLE_H / 2) * math.sin(math.radians(self.BALL_ANGLE_MAX))
+            dy  = self._add_epsilon(dy)
+            norm = np.hypot(dx, dy)
+            nz   = norm > 0
+            dx[nz] /= norm[nz]
+            dy[nz] /= norm[nz]
+            self.ball_x[idx]  = self.PADDLE_X - r
+            self.ball_dx[idx] = dx
+            self.ball_dy[idx] = dy
+            rewards[idx] = 1.0
+
+    def step(self, actions: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """actions ∈ {-1, 0, +1} de forme (n_envs,) → (states, rewards, dones)"""
+        states, rewards, dones = super().step(actions)
+
+        # Récompense de proximité + bonus rapprochement (épisodes en cours : états non réinitialisés)
+        alive = ~dones
+        dist_norm = np.abs(states[:, 2] - states[:, 0]) / (self.HEIGHT / 2)
+        rewards += alive * (0.02 * (1.0 - dist_norm) + 0.005 * self._closer)
+        return states, rewards, dones
+
+
+class VecActionRepeat:
+    """Frame-skip vectorisé : les épisodes terminés pendant la répétition repartent avec l'action 0"""
+    def __init__(self, env: VecPongEnv, repeat: int = 4):
+        self.env    = env
+        self.repeat = repeat
+        self.final_states = env.final_states
+
+    def __len__(self) -> int:
+        return len(self.env)
+
+    def reset(self) -> np.ndarray:
+        return self.env.reset()
+
+    def step(self, actions: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        total = np.zeros(len(self.env), dtype=np.float64)
+        done  = np.zeros(len(self.env), dtype=bool)
+        for _ in range(self.repeat):
+            states, rewards, dones = self.env.step(np.where(done, 0, actions))
+            total += np.where(done, 0.0, rewards)
+            done  |= dones
+        return states, total, done
+
+
 # ======================================== VISUALISATION ========================================
 def plot_training(bot: Bot, window: int = 50):
-    scores = np.array(bot.all_scores)
-    losses = np.array(bot.all_losses)
-    eps    = np.arange(1, len(scores) + 1)
-
-    def rolling(arr, w):
-        return np.convolve(arr, np.ones(w) / w, mode="valid")
+    log = history(bot.metrics)
+    scores, score_avg = curve(log["episode"], log["score"], window)
+    losses, loss_avg  = curve(log["episode"], log["loss"], window)
 
     fig, axs = plt.subplots(2, 1, figsize=(12, 8))
     fig.suptitle("Entraînement DQN – Pong v3", fontsize=14)
 
-    axs[0].plot(eps, scores, alpha=0.3, color="steelblue", label="Score brut")
-    if len(scores) >= window:
-        axs[0].plot(eps[window - 1:], rolling(scores, window),
-                    color="steelblue", lw=2, label=f"Moyenne ({window} ep.)")
+    axs[0].plot(*scores, alpha=0.3, color="steelblue", label="Score brut")
+    if score_avg is not None:
+        axs[0].plot(*score_avg, color="steelblue", lw=2, label=f"Moyenne ({window} ep.)")
     axs[0].axhline(0, color="gray", linestyle="--", lw=0.8)
     axs[0].set_ylabel("Score"); axs[0].set_xlabel("Épisode")
     axs[0].set_title("Score par épisode"); axs[0].legend(); axs[0].grid(True, alpha=0.4)
 
-    axs[1].plot(eps, losses, alpha=0.3, color="crimson", label="Loss brute")
-    if len(losses) >= window:
-        axs[1].plot(eps[window - 1:], rolling(losses, window),
-                    color="crimson", lw=2, label=f"Moyenne ({window} ep.)")
+    axs[1].plot(*losses, alpha=0.3, color="crimson", label="Loss brute")
+    if loss_avg is not None:
+        axs[1].plot(*loss_avg, color="crimson", lw=2, label=f"Moyenne ({window} ep.)")
     axs[1].set_ylabel("Huber Loss"); axs[1].set_xlabel("Épisode")
     axs[1].set_title("Loss moyenne par épisode"); axs[1].legend(); axs[1].grid(True, alpha=0.4)
 
@@ -425,6 +987,10 @@ if __name__ == "__main__":
             min_buffer_size=1_000,
             oscillation_penalty=0.02,
             alignment_bonus=0.01,
+            compiled=False,
+            checkpoint_every=100,
+            resume=True,
+            metrics_path="data/bot.metrics",
         )
         env = PongEnv()
         n_episodes = int(input("Nombre d'épisodes : "))
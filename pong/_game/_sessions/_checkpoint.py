@@ -0,0 +1,283 @@
+# ======================================== IMPORTS ========================================
+"""
+Points de reprise complets et atomiques pour les entraînements longs
+
+Un point de reprise se compose :
+    - d'un fichier .pth (réseaux, optimiseur, compteurs, historiques, états des générateurs)
+      écrit dans un fichier temporaire puis renommé (os.replace) : jamais de fichier à moitié écrit ;
+    - d'un dossier <nom>.replay-<génération> contenant une colonne .npy par colonne du replay buffer
+      (écrite par np.lib.format.open_memmap, relue en np.memmap).
+
+Le .pth ne référence le dossier de replay qu'une fois celui-ci complet, et les anciennes générations
+ne sont supprimées qu'après le renommage : un arrêt brutal laisse toujours la reprise précédente intacte.
+"""
+from __future__ import annotations
+from pathlib import Path
+import os
+import random
+import shutil
+import tempfile
+import threading
+import numpy as np
+import torch
+
+try:
+    from ._replay import RingBuffer, PrioritizedRingBuffer
+except ImportError:  # exécution directe du script d'entraînement
+    from _replay import RingBuffer, PrioritizedRingBuffer
+
+# ======================================== COPIES ========================================
+def detach(obj):
+    """
+    Copie profonde d'un state_dict (ou de toute structure imbriquée) avec des tenseurs CPU clonés
+    Le résultat peut être sérialisé dans un autre thread pendant que l'entraînement continue.
+    """
+    if isinstance(obj, torch.Tensor):
+        return obj.detach().to("cpu", copy=True)
+    if isinstance(obj, dict):
+        return {key: detach(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(detach(value) for value in obj)
+    return obj
+
+def rng_states(generators: dict[str, np.random.Generator | None]) -> dict:
+    """
+    Capture l'état des générateurs aléatoires (random, torch, CUDA et flux numpy des composants)
+
+    Args:
+        generators (dict): flux numpy à capturer {nom: générateur | None}
+
+    Returns:
+        Dictionnaire sérialisable par torch.save
+    """
+    states = {
+        "python": random.getstate(),
+        "torch":  torch.get_rng_state(),
+        "generators": {name: rng.bit_generator.state for name, rng in generators.items() if rng is not None},
+    }
+    if torch.cuda.is_available():
+        states["cuda"] = torch.cuda.get_rng_state_all()
+    return states
+
+def restore_rng_states(states: dict, generators: dict[str, np.random.Generator]) -> dict:
+    """
+    Restaure les générateurs capturés par rng_states
+
+    Args:
+        states (dict): états capturés
+        generators (dict): flux numpy à restaurer {nom: générateur}
+
+    Returns:
+        États des flux capturés sans générateur correspondant (à appliquer plus tard, ex: environnement)
+    """
+    if "python" in states:
+        random.setstate(states["python"])
+    if "torch" in states:
+        torch.set_rng_state(states["torch"])
+    if "cuda" in states and torch.cuda.is_available():
+        torch.cuda.set_rng_state_all(states["cuda"])
+    pending = {}
+    for name, state in states.get("generators", {}).items():
+        if name in generators:
+            generators[name].bit_generator.state = state
+        else:
+            pending[name] = state
+    return pending
+
+# ======================================== REPLAY ========================================
+def snapshot_replay(buffer: RingBuffer) -> dict:
+    """
+    Copie le contenu brut du replay buffer (emplacements [0, size), position d'écriture incluse)
+
+    Les indices des transitions sont conservés tels quels : avec la position d'écriture (buffer.pos,
+    enregistrée dans le .pth), la reprise retrouve exactement les mêmes tirages.
+
+    Args:
+        buffer (RingBuffer): buffer à copier
+
+    Returns:
+        Colonnes copiées {nom: tableau (size, ...)} et, pour un buffer à priorités, leurs priorités brutes
+    """
+    columns = {name: array[:buffer.size].copy() for name, array in buffer.columns.items()}
+    if isinstance(buffer, PrioritizedRingBuffer):
+        columns["_priorities"] = buffer.priorities[:buffer.size].copy()
+    return columns
+
+def write_replay(columns: dict[str, np.ndarray], directory: Path):
+    """
+    Écrit un instantané de replay buffer, une colonne .npy mappée en mémoire par colonne
+
+    Args:
+        columns (dict): colonnes renvoyées par snapshot_replay
+        directory (Path): dossier de destination (créé)
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    for name, array in columns.items():
+        out = np.lib.format.open_memmap(directory / f"{name}.npy", mode="w+", dtype=array.dtype, shape=array.shape)
+        out[:] = array
+        out.flush()
+        del out
+
+def restore_replay(buffer: RingBuffer, directory: Path, max_priority: float = 1.0, pos: int | None = None):
+    """
+    Recharge un instantané dans le replay buffer
+
+    À capacité inchangée, les emplacements et la position d'écriture sont restaurés à l'identique.
+    Sinon les transitions sont réinsérées dans l'ordre chronologique (les plus anciennes sont perdues
+    si la capacité a diminué).
+
+    Args:
+        buffer (RingBuffer): buffer à remplir (vidé au préalable)
+        directory (Path): dossier écrit par write_replay
+        max_priority (float): priorité maximale observée (buffer à priorités)
+        pos (int | None): position d'écriture sauvegardée (None : instantané chronologique d'une ancienne sauvegarde)
+    """
+    columns = {name: np.load(directory / f"{name}.npy", mmap_mode="r") for name in buffer.columns}
+    path = directory / "_priorities.npy"
+    priorities = np.load(path, mmap_mode="r") if isinstance(buffer, PrioritizedRingBuffer) and path.exists() else None
+    size = len(next(iter(columns.values())))
+    buffer.clear()
+
+    if pos is not None and size <= buffer.capacity and (size == buffer.capacity or pos == size):
+        # Copie à l'identique : mêmes indices, même position d'écriture
+        for name, array in columns.items():
+            buffer.columns[name][:size] = array
+        buffer.pos, buffer.size = pos % buffer.capacity, size
+        n = size
+    else:
+        # Ordre chronologique (plus ancienne transition en tête), puis réinsertion
+        order = np.r_[pos:size, 0:pos] if pos is not None else np.arange(size)
+        order = order[max(0, size - buffer.capacity):]
+        buffer.push_batch(*(np.asarray(array)[order] for array in columns.values()))
+        if priorities is not None:
+            priorities = np.asarray(priorities)[order]
+        n = len(order)
+
+    if priorities is not None:
+        buffer.priorities[:n] = priorities
+        buffer.max_priority = max_priority
+        buffer.tree.rebuild(buffer.priorities[:n] ** buffer.alpha)
+
+# ======================================== ECRITURE ========================================
+def replay_dir(path: str | Path, generation: int) -> Path:
+    """Renvoie le dossier de replay d'une génération de point de reprise"""
+    path = Path(path)
+    return path.with_name(f"{path.stem}.replay-{generation:06d}")
+
+def _generations(path: Path) -> list[Path]:
+    """Liste les dossiers de replay existants d'un point de reprise"""
+    return sorted(path.parent.glob(f"{path.stem}.replay-*"))
+
+def atomic_save(obj, path: str | Path):
+    """
+    Écrit un objet avec torch.save dans un fichier temporaire du même dossier puis le renomme
+
+    Args:
+        obj: objet à sérialiser
+        path (str | Path): chemin final
+    """
+    path = Path(path)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            torch.save(obj, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+def write_checkpoint(path: str | Path, state: dict, replay: dict[str, np.ndarray] | None = None):
+    """
+    Écrit un point de reprise complet (replay d'abord, puis .pth atomique, puis ménage des anciennes générations)
+
+    Args:
+        path (str | Path): chemin du fichier .pth
+        state (dict): état détaché (voir detach)
+        replay (dict | None): instantané du replay buffer (voir snapshot_replay)
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    previous = _generations(path)
+    if replay is not None:
+        generation = int(previous[-1].name.rsplit("-", 1)[1]) + 1 if previous else 0
+        directory = replay_dir(path, generation)
+        write_replay(replay, directory)
+        state = {**state, "replay_dir": directory.name}
+    atomic_save(state, path)
+    for old in previous:
+        shutil.rmtree(old, ignore_errors=True)
+
+def read_replay_dir(path: str | Path, ckpt: dict) -> Path | None:
+    """
+    Renvoie le dossier de replay référencé par un point de reprise chargé, s'il existe encore
+
+    Args:
+        path (str | Path): chemin du fichier .pth
+        ckpt (dict): contenu chargé
+    """
+    name = ckpt.get("replay_dir")
+    if name is None:
+        return None
+    directory = Path(path).with_name(name)
+    return directory if directory.is_dir() else None
+
+# ======================================== ARRIERE-PLAN ========================================
+class Checkpointer:
+    """
+    Écrit les points de reprise dans un thread de service pendant que l'entraînement continue
+
+    L'appelant fournit des copies détachées (detach, snapshot_replay). Si une écriture est déjà en cours,
+    seule la demande la plus récente est conservée : l'entraînement n'attend jamais le disque.
+    """
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._pending: tuple | None = None
+        self._busy = False
+        self._worker: threading.Thread | None = None
+        self.written: int = 0
+        self.skipped: int = 0
+        self.error: Exception | None = None
+
+    def submit(self, path: str | Path, state: dict, replay: dict[str, np.ndarray] | None = None):
+        """
+        Planifie l'écriture d'un point de reprise
+
+        Args:
+            path (str | Path): chemin du fichier .pth
+            state (dict): état détaché
+            replay (dict | None): instantané du replay buffer
+        """
+        with self._cond:
+            if self._pending is not None:
+                self.skipped += 1
+            self._pending = (path, state, replay)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._serve, name="bot-checkpoint", daemon=True)
+                self._worker.start()
+            self._cond.notify_all()
+
+    def _serve(self):
+        """Boucle du thread de service : écrit la dernière demande reçue"""
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    self._cond.wait()
+                job, self._pending = self._pending, None
+                self._busy = True
+            try:
+                write_checkpoint(*job)
+                self.written += 1
+            except Exception as e:
+                self.error = e
+                print(f"[Bot] Checkpoint error: {e}")
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+
+    def wait(self):
+        """Bloque jusqu'à la fin des écritures planifiées"""
+        with self._cond:
+            while self._pending is not None or self._busy:
+                self._cond.wait()
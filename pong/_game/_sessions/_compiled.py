@@ -0,0 +1,78 @@
+# ======================================== IMPORTS ========================================
+from __future__ import annotations
+from pathlib import Path
+import copy
+import warnings
+import torch
+import torch.nn as nn
+
+try:
+    from ._numpy_net import weights_fingerprint
+except ImportError:  # exécution directe du script d'entraînement
+    from _numpy_net import weights_fingerprint
+
+# ======================================== EXPORT ========================================
+def fingerprint(net: nn.Module) -> str:
+    """Empreinte des poids d'un réseau (associe un artefact compilé à la sauvegarde dont il provient)"""
+    return weights_fingerprint({k: v.detach().cpu().numpy() for k, v in net.state_dict().items()})
+
+def script_path(path: str | Path) -> Path:
+    """Renvoie le chemin de l'artefact TorchScript associé à une sauvegarde .pth"""
+    return Path(path).with_suffix(".pt")
+
+def export_script(net: nn.Module, path: str | Path, in_dim: int) -> str:
+    """
+    Trace un réseau en module TorchScript figé et l'enregistre
+
+    Args:
+        net (nn.Module): réseau à exporter (non modifié)
+        path (str | Path): chemin de la sauvegarde .pth associée ou de l'artefact .pt
+        in_dim (int): dimension d'un état d'entrée
+
+    Returns:
+        Chemin de l'artefact écrit
+    """
+    dst = script_path(path)
+    module = copy.deepcopy(net).cpu().eval()
+    with torch.no_grad(), warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)
+        traced = torch.jit.trace(module, torch.zeros(1, in_dim))
+        torch.jit.save(torch.jit.freeze(traced), str(dst), _extra_files={"fingerprint": fingerprint(net)})
+    return str(dst)
+
+# ======================================== CHARGEMENT ========================================
+def load_script(path: str | Path, net: nn.Module, in_dim: int, device: str = "cpu", warmup: int = 16) -> torch.jit.ScriptModule | None:
+    """
+    Charge l'artefact TorchScript d'une sauvegarde s'il existe et correspond aux poids chargés
+
+    Args:
+        path (str | Path): chemin de la sauvegarde .pth
+        net (nn.Module): réseau eager chargé depuis la sauvegarde (référence des poids)
+        in_dim (int): dimension d'un état d'entrée
+        device (str): périphérique d'exécution
+        warmup (int): nombre de passes d'échauffement (profilage et optimisation du graphe)
+
+    Returns:
+        Module compilé prêt à l'emploi, ou None si aucun artefact utilisable
+    """
+    dst = script_path(path)
+    if not dst.exists():
+        return None
+
+    extra = {"fingerprint": ""}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)
+        module = torch.jit.load(str(dst), map_location=device, _extra_files=extra)
+    stored = extra["fingerprint"]
+    if isinstance(stored, bytes):
+        stored = stored.decode()
+    if stored != fingerprint(net):
+        print(f"[Bot] Ignoring stale compiled model {dst}")
+        return None
+
+    module.eval()
+    example = torch.zeros(1, in_dim, device=device)
+    with torch.no_grad():
+        for _ in range(warmup):
+            module(example)
+    return module
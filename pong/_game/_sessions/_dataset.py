@@ -0,0 +1,128 @@
+# ======================================== IMPORTS ========================================
+from __future__ import annotations
+from pathlib import Path
+from typing import Iterator
+import numpy as np
+
+# ======================================== ECRITURE ========================================
+class ShardWriter:
+    """
+    Écrit un jeu de données de taille connue dans des fragments .npy mappés en mémoire
+
+    Chaque fragment est un tableau (n, width) float32 ouvert avec np.lib.format.open_memmap :
+    les lignes sont écrites directement sur disque, sans jamais tenir tout le jeu en RAM.
+    """
+    PATTERN = "shard_{:05d}.npy"
+
+    def __init__(self, out_dir: str | Path, n_rows: int, width: int, shard_size: int = 1 << 20):
+        """
+        Args:
+            out_dir (str | Path): dossier de destination (créé si absent)
+            n_rows (int): nombre total de lignes à écrire
+            width (int): nombre de flottants par ligne
+            shard_size (int): nombre maximal de lignes par fragment
+        """
+        self.out_dir = Path(out_dir)
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self.n_rows = n_rows
+        self.width = width
+        self.shard_size = shard_size
+        self.paths: list[Path] = []
+        self.written: int = 0
+        self._shard: np.memmap | None = None
+        self._pos: int = 0
+
+    def _open_next(self):
+        """Ferme le fragment courant et ouvre le suivant"""
+        self._close_current()
+        rows = min(self.shard_size, self.n_rows - self.written)
+        path = self.out_dir / self.PATTERN.format(len(self.paths))
+        self._shard = np.lib.format.open_memmap(path, mode="w+", dtype=np.float32, shape=(rows, self.width))
+        self._pos = 0
+        self.paths.append(path)
+
+    def _close_current(self):
+        """Vide le fragment courant sur disque"""
+        if self._shard is not None:
+            self._shard.flush()
+            self._shard = None
+
+    @property
+    def full(self) -> bool:
+        """Indique si toutes les lignes prévues ont été écrites"""
+        return self.written >= self.n_rows
+
+    def write(self, rows: np.ndarray) -> int:
+        """
+        Ajoute des lignes (les lignes au-delà de n_rows sont ignorées)
+
+        Args:
+            rows (np.ndarray): lignes de forme (n, width)
+
+        Returns:
+            Nombre de lignes effectivement écrites
+        """
+        rows = rows[:self.n_rows - self.written]
+        done = 0
+        while done < len(rows):
+            if self._shard is None or self._pos == len(self._shard):
+                self._open_next()
+            n = min(len(rows) - done, len(self._shard) - self._pos)
+            self._shard[self._pos:self._pos + n] = rows[done:done + n]
+            self._pos += n
+            done += n
+        self.written += done
+        if self.full:
+            self._close_current()
+        return done
+
+    def close(self):
+        """Termine l'écriture"""
+        self._close_current()
+
+# ======================================== LECTURE ========================================
+class ShardDataset:
+    """
+    Jeu de données en fragments .npy lus en np.memmap
+
+    Le mélange se fait par blocs : ordre des fragments et des blocs tiré au hasard,
+    puis permutation des lignes à l'intérieur de chaque bloc. Seul un bloc est en RAM à la fois.
+    """
+    def __init__(self, data_dir: str | Path):
+        """
+        Args:
+            data_dir (str | Path): dossier contenant les fragments shard_*.npy
+        """
+        self.paths = sorted(Path(data_dir).glob("shard_*.npy"))
+        if not self.paths:
+            raise FileNotFoundError(f"No shard found in {data_dir}")
+        self.shards = [np.load(path, mmap_mode="r") for path in self.paths]
+        self.width = self.shards[0].shape[1]
+
+    def __len__(self) -> int:
+        """Renvoie le nombre total de lignes"""
+        return sum(len(shard) for shard in self.shards)
+
+    def iter_batches(self, batch_size: int, rng: np.random.Generator, block_size: int = 1 << 16) -> Iterator[np.ndarray]:
+        """
+        Parcourt une époque complète en mini-batchs mélangés
+
+        Args:
+            batch_size (int): taille des mini-batchs (le dernier peut être plus petit)
+            rng (np.random.Generator): générateur du mélange
+            block_size (int): nombre de lignes chargées en RAM à la fois
+
+        Returns:
+            Itérateur de tableaux (batch_size, width) float32
+        """
+        blocks = [
+            (shard, start)
+            for shard in self.shards
+            for start in range(0, len(shard), block_size)
+        ]
+        for i in rng.permutation(len(blocks)):
+            shard, start = blocks[i]
+            block = np.array(shard[start:start + block_size])
+            block = block[rng.permutation(len(block))]
+            for b in range(0, len(block), batch_size):
+                yield block[b:b + batch_size]
@@ -0,0 +1,356 @@
+# ======================================== IMPORTS ========================================
+"""
+Service d'inférence par lots pour de nombreuses raquettes bot dans le même processus
+
+Mode tick (mono-thread, parties sans affichage) :
+    server = serve_dqn(net)
+    agents = [ServedDQNAgent(server) for _ in matches]
+    futures = [agent.get_move_async(*obs) for agent, obs in zip(agents, observations)]
+    server.flush()                                  # un seul passage du réseau pour toutes les parties
+    moves = [f.result() for f in futures]
+
+Mode thread (threaded=True) : chaque session appelle get_move normalement, un thread de service
+regroupe les requêtes arrivées pendant au plus max_latency secondes.
+"""
+from __future__ import annotations
+from collections import deque
+from numbers import Real
+from typing import Callable
+import threading
+import time
+import numpy as np
+
+try:
+    from ._agent import Agent
+    from ._numpy_net import NumpyRegressionNet, NumpyDQNNet
+except ImportError:  # exécution directe du script d'entraînement
+    from _agent import Agent
+    from _numpy_net import NumpyRegressionNet, NumpyDQNNet
+
+# ======================================== FUTURE ========================================
+class InferenceFuture:
+    """
+    Résultat différé d'une requête d'inférence (sans verrou ni événement propre)
+    """
+    __slots__ = ("_server", "_transform", "_value", "_done")
+
+    def __init__(self, server: InferenceServer | None, transform: Callable | None = None):
+        """
+        Args:
+            server (InferenceServer | None): serveur chargé de la requête
+            transform (Callable | None): conversion appliquée à la sortie brute du réseau
+        """
+        self._server = server
+        self._transform = transform
+        self._value = None
+        self._done = False
+
+    @classmethod
+    def resolved(cls, value) -> InferenceFuture:
+        """Crée un résultat déjà disponible (aucune inférence nécessaire)"""
+        future = cls(None)
+        future._value = value
+        future._done = True
+        return future
+
+    def _set(self, output: np.ndarray):
+        """Renseigne le résultat depuis la sortie brute du réseau"""
+        self._value = self._transform(output) if self._transform is not None else output
+        self._done = True
+
+    def done(self) -> bool:
+        """Indique si le résultat est disponible"""
+        return self._done
+
+    def result(self):
+        """
+        Renvoie le résultat, en déclenchant ou en attendant le passage du lot si nécessaire
+
+        Returns:
+            Sortie du réseau convertie par transform
+        """
+        if not self._done:
+            self._server._wait(self)
+        return self._value
+
+# ======================================== SERVEUR ========================================
+class InferenceServer:
+    """
+    Regroupe les requêtes d'inférence en attente et les évalue en un seul passage du réseau
+    """
+    def __init__(
+        self,
+        forward: Callable[[np.ndarray], np.ndarray],
+        in_dim: int,
+        max_batch: int = 1024,
+        max_latency: float = 0.002,
+        threaded: bool = False,
+        history: int = 4096,
+    ):
+        """
+        Args:
+            forward (Callable): évaluation d'un lot (n, in_dim) float32 -> sorties (n, ...)
+            in_dim (int): dimension d'un état
+            max_batch (int): taille maximale d'un lot (un lot plein est évalué immédiatement)
+            max_latency (float): attente maximale en secondes d'une requête avant évaluation de son lot
+            threaded (bool): évalue les lots dans un thread de service plutôt qu'à chaque flush
+            history (int): nombre de lots conservés pour les statistiques
+        """
+        self.forward = forward
+        self.max_batch = max_batch
+        self.max_latency = max_latency
+        self.threaded = threaded
+
+        self._inputs = np.empty((max_batch, in_dim), dtype=np.float32)
+        self._pending: list[InferenceFuture] = []
+        self._first_time: float = 0.0
+        self._cond = threading.Condition()
+
+        # Statistiques
+        self.batches: int = 0
+        self.requests: int = 0
+        self.batch_sizes: deque[int] = deque(maxlen=history)
+        self.waits: deque[float] = deque(maxlen=history)
+
+        self._running = threaded
+        self._worker: threading.Thread | None = None
+        if threaded:
+            self._worker = threading.Thread(target=self._serve, name="bot-inference", daemon=True)
+            self._worker.start()
+
+    # ======================================== REQUETES ========================================
+    def submit(self, state: np.ndarray, transform: Callable | None = None) -> InferenceFuture:
+        """
+        Ajoute une requête au lot courant
+
+        Args:
+            state (np.ndarray): état normalisé (in_dim,)
+            transform (Callable | None): conversion appliquée à la sortie brute de cet état
+
+        Returns:
+            Future résolue au prochain passage du lot
+        """
+        future = InferenceFuture(self, transform)
+        with self._cond:
+            if len(self._pending) == self.max_batch:
+                self._flush_locked()
+            n = len(self._pending)
+            if n == 0:
+                self._first_time = time.perf_counter()
+            self._inputs[n] = state
+            self._pending.append(future)
+            if self.threaded:
+                self._cond.notify_all()
+            elif n + 1 == self.max_batch:
+                self._flush_locked()
+        return future
+
+    def flush(self) -> int:
+        """
+        Évalue immédiatement toutes les requêtes en attente (à appeler une fois par tick)
+
+        Returns:
+            Taille du lot évalué
+        """
+        with self._cond:
+            return self._flush_locked()
+
+    def poll(self) -> int:
+        """
+        Évalue le lot courant si sa plus ancienne requête a dépassé max_latency
+
+        Returns:
+            Taille du lot évalué (0 si rien n'a été évalué)
+        """
+        with self._cond:
+            if self._pending and time.perf_counter() - self._first_time >= self.max_latency:
+                return self._flush_locked()
+        return 0
+
+    def _flush_locked(self) -> int:
+        """Évalue le lot courant (verrou déjà acquis)"""
+        n = len(self._pending)
+        if n == 0:
+            return 0
+        # Copie : forward peut renvoyer un buffer réutilisé au prochain lot de même taille
+        outputs = np.array(self.forward(self._inputs[:n]), copy=True)
+        for future, output in zip(self._pending, outputs):
+            future._set(output)
+        self._pending = []
+
+        self.batches += 1
+        self.requests += n
+        self.batch_sizes.append(n)
+        self.waits.append(time.perf_counter() - self._first_time)
+        self._cond.notify_all()
+        return n
+
+    def _wait(self, future: InferenceFuture):
+        """Bloque jusqu'à la résolution d'une future (évalue le lot directement en mode tick)"""
+        with self._cond:
+            if not self.threaded:
+                self._flush_locked()
+                return
+            while not future._done:
+                self._cond.wait()
+
+    def _serve(self):
+        """Boucle du thread de service : évalue un lot dès qu'il est plein ou que max_latency est atteinte"""
+        with self._cond:
+            while self._running:
+                if not self._pending:
+                    self._cond.wait()
+                    continue
+                remaining = self._first_time + self.max_latency - time.perf_counter()
+                if remaining > 0 and len(self._pending) < self.max_batch:
+                    self._cond.wait(remaining)
+                    continue
+                self._flush_locked()
+
+    def close(self):
+        """Évalue les requêtes restantes et arrête le thread de service"""
+        with self._cond:
+            self._running = False
+            self._flush_locked()
+            self._cond.notify_all()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+
+    # ======================================== STATISTIQUES ========================================
+    def stats(self) -> dict:
+        """
+        Renvoie les statistiques des derniers lots
+
+        Returns:
+            Nombre de lots et de requêtes, tailles de lot (moyenne, p50, max) et attente p99 en ms
+        """
+        sizes = np.fromiter(self.batch_sizes, dtype=np.int64)
+        waits = np.fromiter(self.waits, dtype=np.float64)
+        if not len(sizes):
+            return {"batches": 0, "requests": 0}
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "mean_batch": float(sizes.mean()),
+            "p50_batch": float(np.percentile(sizes, 50)),
+            "max_batch": int(sizes.max()),
+            "p99_wait_ms": float(np.percentile(waits, 99)) * 1e3,
+        }
+
+# ======================================== RESEAUX ========================================
+def _torch_forward(net) -> Callable[[np.ndarray], np.ndarray]:
+    """Adapte un réseau torch en évaluation numpy par lot"""
+    import torch
+
+    device = next(net.parameters()).device
+
+    def forward(x: np.ndarray) -> np.ndarray:
+        with torch.no_grad():
+            return net(torch.from_numpy(x).to(device)).cpu().numpy()
+
+    return forward
+
+def serve_regression(net, **kwargs) -> InferenceServer:
+    """
+    Crée un serveur pour RegressionNet (torch) ou NumpyRegressionNet
+
+    Args:
+        net: réseau de régression
+        **kwargs: options d'InferenceServer
+
+    Returns:
+        Serveur d'états (n, 4) -> Y d'arrivée normalisées (n, 1)
+    """
+    forward = net.forward if isinstance(net, NumpyRegressionNet) else _torch_forward(net)
+    return InferenceServer(forward, 4, **kwargs)
+
+def serve_dqn(net, **kwargs) -> InferenceServer:
+    """
+    Crée un serveur pour DQNNet (torch) ou NumpyDQNNet
+
+    Args:
+        net: réseau DQN dueling
+        **kwargs: options d'InferenceServer
+
+    Returns:
+        Serveur d'états (n, 6) -> Q-valeurs (n, 3)
+    """
+    forward = net.forward if isinstance(net, NumpyDQNNet) else _torch_forward(net)
+    return InferenceServer(forward, 6, **kwargs)
+
+# ======================================== AGENTS ========================================
+class ServedAgent(Agent):
+    """
+    Agent de régression dont les prédictions passent par un serveur d'inférence partagé
+    """
+    def __init__(self, server: InferenceServer, backend: str = "net"):
+        """
+        Args:
+            server (InferenceServer): serveur créé par serve_regression
+            backend (str): moteur de prédiction en jeu
+        """
+        super().__init__(backend=backend)
+        self.server = server
+
+    def get_move_async(self, p2_y: Real, ball_x: Real, ball_y: Real, ball_dx: Real, ball_dy: Real) -> InferenceFuture:
+        """
+        Soumet le calcul du mouvement (une requête n'est émise qu'à un changement de direction vers la raquette)
+
+        Args:
+            p2_y (Real): position Y actuelle de la raquette
+            ball_x (Real): position X de la balle
+            ball_y (Real): position Y de la balle
+            ball_dx (Real): direction X de la balle
+            ball_dy (Real): direction Y de la balle
+
+        Returns:
+            Future du mouvement -1 (monter) | 0 (immobile) | 1 (descendre)
+        """
+        if self.backend == "net" and ball_dx > 0 and self._direction_changed(ball_dx, ball_dy):
+            self.prev_dx = ball_dx
+            self.prev_dy = ball_dy
+
+            def resolve(output: np.ndarray) -> int:
+                self.target_y = float(output[0]) * self.HEIGHT
+                return self._move_towards(p2_y, self.target_y)
+
+            return self.server.submit(self._normalize(ball_x, ball_y, ball_dx, ball_dy), resolve)
+        return InferenceFuture.resolved(super().get_move(p2_y, ball_x, ball_y, ball_dx, ball_dy))
+
+    def get_move(self, p2_y: Real, ball_x: Real, ball_y: Real, ball_dx: Real, ball_dy: Real) -> int:
+        """Calcule le mouvement de la raquette (bloquant)"""
+        return self.get_move_async(p2_y, ball_x, ball_y, ball_dx, ball_dy).result()
+
+class ServedDQNAgent:
+    """
+    Agent DQN glouton dont les Q-valeurs passent par un serveur d'inférence partagé
+    """
+    # [p2_y, ball_x, ball_y, ball_dx, ball_dy, delta_y]
+    STATE_SCALE = np.array([1080.0, 1440.0, 1080.0, 1.0, 1.0, 1080.0], dtype=np.float32)
+
+    def __init__(self, server: InferenceServer):
+        """
+        Args:
+            server (InferenceServer): serveur créé par serve_dqn
+        """
+        self.server = server
+
+    @staticmethod
+    def _action(q_values: np.ndarray) -> int:
+        """Convertit des Q-valeurs en mouvement {-1, 0, 1}"""
+        return int(np.argmax(q_values)) - 1
+
+    def get_move_async(self, p2_y: Real, ball_x: Real, ball_y: Real, ball_dx: Real, ball_dy: Real) -> InferenceFuture:
+        """
+        Soumet le calcul du mouvement
+
+        Returns:
+            Future du mouvement -1 (monter) | 0 (immobile) | 1 (descendre)
+        """
+        state = np.array([p2_y, ball_x, ball_y, ball_dx, ball_dy, ball_y - p2_y], dtype=np.float32) / self.STATE_SCALE
+        return self.server.submit(state, self._action)
+
+    def get_move(self, p2_y: Real, ball_x: Real, ball_y: Real, ball_dx: Real, ball_dy: Real) -> int:
+        """Calcule le mouvement de la raquette (bloquant)"""
+        return self.get_move_async(p2_y, ball_x, ball_y, ball_dx, ball_dy).result()
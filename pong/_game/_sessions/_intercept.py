@@ -0,0 +1,110 @@
+# ======================================== IMPORTS ========================================
+from __future__ import annotations
+import numpy as np
+
+# ======================================== INTERCEPTION ANALYTIQUE ========================================
+def _travel_x(x: float, dx: float, radius: float, paddle_x: float) -> float:
+    """
+    Distance horizontale parcourue par le centre de la balle avant d'atteindre la raquette
+
+    Args:
+        x (float): position X de la balle
+        dx (float): direction X de la balle
+        radius (float): rayon de la balle
+        paddle_x (float): position X de la face de la raquette
+
+    Returns:
+        Distance horizontale en pixels (rebond sur le mur gauche inclus si dx < 0)
+    """
+    contact_x = paddle_x - radius
+    if dx > 0:
+        return max(contact_x - x, 0.0)
+    return (x - radius) + (contact_x - radius)
+
+def intercept_y(x: float, y: float, dx: float, dy: float, radius: float, height: float, paddle_x: float) -> float:
+    """
+    Calcule en O(1) la position Y d'arrivée de la balle sur la raquette
+
+    La trajectoire rectiligne est dépliée puis repliée sur les murs haut et bas (sans bruit de rebond)
+
+    Args:
+        x (float): position X de la balle
+        y (float): position Y de la balle
+        dx (float): direction X normalisée
+        dy (float): direction Y normalisée
+        radius (float): rayon de la balle
+        height (float): hauteur du terrain
+        paddle_x (float): position X de la face de la raquette
+
+    Returns:
+        Position Y d'arrivée en pixels (position courante si dx est nul)
+    """
+    if dx == 0:
+        return float(y)
+    band = height - 2 * radius
+    if band <= 0:
+        return height / 2
+    unfolded = (y - radius) + dy / abs(dx) * _travel_x(x, dx, radius, paddle_x)
+    folded = unfolded % (2 * band)
+    if folded > band:
+        folded = 2 * band - folded
+    return radius + folded
+
+def intercept_y_batch(
+    x: np.ndarray,
+    y: np.ndarray,
+    dx: np.ndarray,
+    dy: np.ndarray,
+    radius: float,
+    height: float,
+    paddle_x: float,
+) -> np.ndarray:
+    """
+    Version vectorisée de `intercept_y`
+
+    Args:
+        x (np.ndarray): positions X des balles
+        y (np.ndarray): positions Y des balles
+        dx (np.ndarray): directions X normalisées
+        dy (np.ndarray): directions Y normalisées
+        radius (float): rayon de la balle
+        height (float): hauteur du terrain
+        paddle_x (float): position X de la face de la raquette
+
+    Returns:
+        Positions Y d'arrivée en pixels
+    """
+    x, y, dx, dy = (np.asarray(a, dtype=np.float64) for a in (x, y, dx, dy))
+    band = height - 2 * radius
+    contact_x = paddle_x - radius
+    travel = np.where(dx > 0, np.maximum(contact_x - x, 0.0), (x - radius) + (contact_x - radius))
+    abs_dx = np.abs(dx)
+    moving = abs_dx > 0
+    slope = np.divide(dy, abs_dx, out=np.zeros_like(dy), where=moving)
+    folded = np.mod((y - radius) + slope * travel, 2 * band)
+    folded = np.where(folded > band, 2 * band - folded, folded)
+    return np.where(moving, radius + folded, y)
+
+def intercept_labels(
+    states: np.ndarray,
+    state_scale: np.ndarray,
+    radius: float,
+    height: float,
+    paddle_x: float,
+) -> np.ndarray:
+    """
+    Génère les cibles de régression exactes pour un batch d'états normalisés
+
+    Args:
+        states (np.ndarray): états normalisés (N, 4) [ball_x, ball_y, ball_dx, ball_dy]
+        state_scale (np.ndarray): facteurs de normalisation des états
+        radius (float): rayon de la balle
+        height (float): hauteur du terrain
+        paddle_x (float): position X de la face de la raquette
+
+    Returns:
+        Positions Y d'arrivée normalisées (entre 0 et 1) en float32
+    """
+    raw = np.asarray(states, dtype=np.float64) * state_scale
+    arrival = intercept_y_batch(raw[:, 0], raw[:, 1], raw[:, 2], raw[:, 3], radius, height, paddle_x)
+    return (arrival / height).astype(np.float32)
@@ -0,0 +1,344 @@
+# ======================================== IMPORTS ========================================
+"""
+Journal de métriques d'entraînement en flux continu
+
+Les enregistrements par épisode sont ajoutés à un fichier binaire append-only (en-tête JSON de
+HEADER_SIZE octets, puis enregistrements numpy de taille fixe) vidé périodiquement sur disque.
+Seules des fenêtres glissantes bornées restent en mémoire : la RAM ne dépend pas de la durée du run.
+Le fichier se relit en np.memmap (read_log) et les courbes sont sous-échantillonnées par LTTB.
+Sans fichier, un historique décimé de HISTORY_SIZE points au plus couvre tout le run.
+"""
+from __future__ import annotations
+from collections import deque
+from pathlib import Path
+import json
+import time
+import numpy as np
+
+# ======================================== JOURNAL ========================================
+class MetricsLog:
+    """
+    Puits de métriques par épisode : journal binaire sur disque et agrégats glissants en mémoire
+    """
+    HEADER_SIZE = 256                                                       # (int)  : taille fixe de l'en-tête JSON en octets
+    MAGIC = "pong-metrics"                                                  # (str)  : identifiant du format
+    REPORT_INTERVAL = 0.5                                                   # (float): intervalle minimal entre deux affichages console en secondes
+    HISTORY_SIZE = 4096                                                     # (int)  : points de l'historique décimé conservé sans fichier journal
+
+    def __init__(
+        self,
+        fields: tuple[str, ...],
+        path: str | Path | None = None,
+        window: int = 50,
+        flush_every: int = 256,
+        flush_interval: float = 5.0,
+    ):
+        """
+        Args:
+            fields (tuple[str, ...]): métriques float32 enregistrées à chaque épisode
+            path (str | Path | None): fichier journal (None : agrégats et historique décimé en mémoire uniquement)
+            window (int): nombre d'épisodes conservés en mémoire pour les agrégats glissants
+            flush_every (int): nombre d'enregistrements en attente déclenchant l'écriture
+            flush_interval (float): délai maximal en secondes avant l'écriture des enregistrements en attente
+        """
+        self.fields = tuple(fields)
+        self.dtype = np.dtype([("episode", "<i8"), *((name, "<f4") for name in self.fields)])
+        self.path = Path(path) if path is not None else None
+        self.window = window
+        self.flush_interval = flush_interval
+
+        self.count: int = 0
+        self.recent: dict[str, deque[float]] = {name: deque(maxlen=window) for name in self.fields}
+
+        self._pending = np.empty(flush_every, dtype=self.dtype)
+        self._n_pending: int = 0
+        self._last_flush = time.perf_counter()
+        self._last_report = float("-inf")
+        self._file = None
+
+        # Historique décimé (sans fichier) : un épisode sur stride, stride doublé quand il est plein
+        self._history = np.empty(self.HISTORY_SIZE, dtype=self.dtype) if self.path is None else None
+        self._n_history: int = 0
+        self._stride: int = 1
+
+    # ======================================== ECRITURE ========================================
+    def append(self, **values: float):
+        """
+        Enregistre les métriques d'un épisode
+
+        Args:
+            **values (float): une valeur par champ déclaré
+        """
+        record = self._pending[self._n_pending]
+        record["episode"] = self.count
+        for name in self.fields:
+            value = values[name]
+            record[name] = value
+            self.recent[name].append(value)
+        self.count += 1
+        self._n_pending += 1
+        if self._history is not None:
+            self._remember(record)
+
+        if self._n_pending == len(self._pending) or time.perf_counter() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def _remember(self, record: np.void):
+        """Ajoute un enregistrement à l'historique décimé s'il tombe sur le pas courant"""
+        if record["episode"] % self._stride:
+            return
+        if self._n_history == len(self._history):
+            # Plein : un point sur deux est conservé et le pas double
+            kept = self._history[:self._n_history:2].copy()
+            self._history[:len(kept)] = kept
+            self._n_history = len(kept)
+            self._stride *= 2
+            if record["episode"] % self._stride:
+                return
+        self._history[self._n_history] = record
+        self._n_history += 1
+
+    def _open(self):
+        """Ouvre le journal en ajout (en-tête écrit si absent, enregistrements au-delà de count tronqués)"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        header = json.dumps({"format": self.MAGIC, "dtype": self.dtype.descr}).encode()
+        if len(header) >= self.HEADER_SIZE:
+            raise ValueError(f"Too many metric fields for a {self.HEADER_SIZE}-byte header")
+        header = header.ljust(self.HEADER_SIZE - 1) + b"\n"
+
+        self._file = open(self.path, "r+b" if self.path.exists() else "w+b")
+        if self._file.read(self.HEADER_SIZE) != header:
+            self._file.seek(0)
+            self._file.truncate()
+            self._file.write(header)
+        # Reprise : les enregistrements postérieurs au point de reprise sont abandonnés
+        end = self.HEADER_SIZE + (self.count - self._n_pending) * self.dtype.itemsize
+        if self._file.seek(0, 2) > end:
+            self._file.truncate(end)
+        self._file.seek(0, 2)
+
+    def flush(self):
+        """Écrit les enregistrements en attente à la fin du journal"""
+        self._last_flush = time.perf_counter()
+        if self.path is None or self._n_pending == 0:
+            self._n_pending = 0
+            return
+        if self._file is None:
+            self._open()
+        self._file.write(self._pending[:self._n_pending].tobytes())
+        self._file.flush()
+        self._n_pending = 0
+
+    def close(self):
+        """Écrit les enregistrements en attente et ferme le journal"""
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # ======================================== AGREGATS ========================================
+    def mean(self, name: str, window: int | None = None) -> float:
+        """
+        Moyenne glissante d'une métrique
+
+        Args:
+            name (str): champ
+            window (int | None): nombre d'épisodes récents (tous ceux en mémoire par défaut)
+
+        Returns:
+            Moyenne (0.0 si aucun épisode)
+        """
+        values = self.tail(name, window or self.window)
+        return float(values.mean()) if len(values) else 0.0
+
+    def tail(self, name: str, n: int) -> np.ndarray:
+        """Renvoie les n dernières valeurs d'une métrique (au plus window)"""
+        recent = self.recent[name]
+        n = min(n, len(recent))
+        return np.fromiter((recent[i] for i in range(len(recent) - n, len(recent))), dtype=np.float64, count=n)
+
+    def report_due(self) -> bool:
+        """Indique si une ligne de progression peut être affichée (au plus une toutes les REPORT_INTERVAL secondes)"""
+        now = time.perf_counter()
+        if now - self._last_report < self.REPORT_INTERVAL:
+            return False
+        self._last_report = now
+        return True
+
+    # ======================================== REPRISE ========================================
+    def state(self) -> dict:
+        """Renvoie l'état à inclure dans un point de reprise (compteur, fenêtres glissantes et historique décimé)"""
+        state = {"count": self.count, "recent": {name: list(values) for name, values in self.recent.items()}}
+        if self._history is not None:
+            kept = self._history[:self._n_history]
+            state["history"] = {"stride": self._stride, "columns": {name: kept[name].tolist() for name in kept.dtype.names}}
+        return state
+
+    def load_state(self, state: dict):
+        """
+        Restaure l'état d'un point de reprise (le journal sera tronqué à count à la prochaine écriture)
+
+        Args:
+            state (dict): état renvoyé par state
+        """
+        self.count = state.get("count", 0)
+        self._n_pending = 0
+        for name, values in state.get("recent", {}).items():
+            if name in self.recent:
+                self.recent[name].clear()
+                self.recent[name].extend(values)
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._history is not None:
+            self._load_history(state.get("history"))
+
+    def _load_history(self, history: dict | None):
+        """Restaure l'historique décimé d'un point de reprise (redécimé s'il dépasse HISTORY_SIZE)"""
+        self._n_history = 0
+        self._stride = 1
+        if not history:
+            return
+        columns = history["columns"]
+        episodes = columns["episode"]
+        self._stride = history.get("stride", 1)
+        record = np.zeros((), dtype=self.dtype)
+        for i, episode in enumerate(episodes):
+            record["episode"] = episode
+            for name in self.fields:
+                values = columns.get(name, ())
+                record[name] = values[i] if i < len(values) else np.nan
+            self._remember(record)
+
+def legacy_state(ckpt: dict) -> dict:
+    """
+    Convertit les historiques en listes des anciennes sauvegardes (all_scores, all_losses, all_errors)
+
+    Args:
+        ckpt (dict): contenu chargé d'une sauvegarde
+
+    Returns:
+        État accepté par MetricsLog.load_state
+    """
+    lists = {"score": ckpt.get("all_scores", []), "loss": ckpt.get("all_losses", []), "error": ckpt.get("all_errors", [])}
+    count = len(lists["score"])
+    return {
+        "count": count,
+        "recent": {name: values for name, values in lists.items() if values},
+        "history": {"stride": 1, "columns": {"episode": list(range(count)), **lists}},
+    }
+
+# ======================================== LECTURE ========================================
+def read_log(path: str | Path) -> np.ndarray:
+    """
+    Ouvre un journal de métriques en lecture
+
+    Args:
+        path (str | Path): fichier journal
+
+    Returns:
+        Tableau structuré (episode, champs...) mappé en mémoire
+    """
+    path = Path(path)
+    with open(path, "rb") as f:
+        meta = json.loads(f.read(MetricsLog.HEADER_SIZE).decode())
+    if meta.get("format") != MetricsLog.MAGIC:
+        raise ValueError(f"{path} is not a metrics log")
+    dtype = np.dtype([tuple(field) for field in meta["dtype"]])
+    n = (path.stat().st_size - MetricsLog.HEADER_SIZE) // dtype.itemsize
+    if n == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=MetricsLog.HEADER_SIZE, shape=(n,))
+
+def rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Moyenne glissante par sommes cumulées
+
+    Args:
+        values (np.ndarray): série complète
+        window (int): taille de la fenêtre
+
+    Returns:
+        Série de longueur len(values) - window + 1
+    """
+    csum = np.cumsum(np.asarray(values, dtype=np.float64))
+    csum[window:] = csum[window:] - csum[:-window]
+    return csum[window - 1:] / window
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sous-échantillonnage Largest-Triangle-Three-Buckets (conserve la forme visuelle d'une courbe)
+
+    Args:
+        x (np.ndarray): abscisses croissantes
+        y (np.ndarray): ordonnées
+        n_out (int): nombre de points conservés (au moins 3)
+
+    Returns:
+        Tuple (x, y) sous-échantillonné
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.asarray(x), np.asarray(y)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # Seaux intérieurs : le premier et le dernier point sont toujours conservés
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    prev = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt_lo, nxt_hi = hi, edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[nxt_lo:nxt_hi].mean()
+        avg_y = y[nxt_lo:nxt_hi].mean()
+        # Aire du triangle (point précédent retenu, candidat, moyenne du seau suivant)
+        area = np.abs((x[prev] - avg_x) * (y[lo:hi] - y[prev]) - (x[prev] - x[lo:hi]) * (avg_y - y[prev]))
+        prev = lo + int(np.argmax(area))
+        keep[i + 1] = prev
+    return x[keep], y[keep]
+
+def history(log: MetricsLog) -> np.ndarray:
+    """
+    Renvoie l'historique complet d'un journal (ou, sans fichier, l'historique décimé en mémoire)
+
+    Args:
+        log (MetricsLog): journal de l'entraînement
+
+    Returns:
+        Tableau structuré (episode, champs...)
+    """
+    log.flush()
+    if log.path is not None and log.path.exists():
+        return read_log(log.path)
+    if log._history is not None:
+        return log._history[:log._n_history].copy()
+    n = min((len(values) for values in log.recent.values()), default=0)
+    out = np.empty(n, dtype=log.dtype)
+    out["episode"] = np.arange(log.count - n, log.count)
+    for name in log.fields:
+        out[name] = log.tail(name, n)
+    return out
+
+def curve(episodes: np.ndarray, values: np.ndarray, window: int, n_points: int = 2000) -> tuple[tuple, tuple | None]:
+    """
+    Prépare une courbe brute et sa moyenne glissante, sous-échantillonnées par LTTB
+
+    Args:
+        episodes (np.ndarray): indices d'épisodes croissants (à partir de 0, éventuellement décimés)
+        values (np.ndarray): valeurs de la métrique
+        window (int): taille de la fenêtre de moyenne glissante en épisodes
+        n_points (int): nombre maximal de points tracés par courbe
+
+    Returns:
+        Tuple ((x, y) brut, (x, y) moyenne glissante ou None si moins de window épisodes)
+    """
+    x = np.asarray(episodes, dtype=np.float64) + 1
+    if len(x) > 1:
+        # Historique décimé : la fenêtre est ramenée en nombre de points
+        window = max(1, round(window * (len(x) - 1) / (x[-1] - x[0])))
+    raw = lttb(x, values, n_points)
+    if len(values) < window:
+        return raw, None
+    return raw, lttb(x[window - 1:], rolling_mean(values, window), n_points)
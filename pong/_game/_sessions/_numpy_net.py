@@ -0,0 +1,202 @@
+# ======================================== IMPORTS ========================================
+from __future__ import annotations
+from pathlib import Path
+import hashlib
+import numpy as np
+
+# ======================================== COUCHES ========================================
+class _DenseChain:
+    """
+    Suite de couches linéaires numpy (matmul + biais + ReLU fusionnés, buffers préalloués par taille de batch)
+    """
+    def __init__(self, weights: dict[str, np.ndarray], names: list[str]):
+        """
+        Args:
+            weights (dict): poids exportés {nom: tableau}
+            names (list[str]): préfixes des couches linéaires dans l'ordre (ex: "net.0")
+        """
+        # Poids transposés en (entrée, sortie) contigus pour x @ W
+        self.layers: list[tuple[np.ndarray, np.ndarray]] = [
+            (np.ascontiguousarray(weights[f"{name}.weight"].T, dtype=np.float32),
+             np.ascontiguousarray(weights[f"{name}.bias"], dtype=np.float32))
+            for name in names
+        ]
+        self.in_dim: int = self.layers[0][0].shape[0]
+        self.out_dim: int = self.layers[-1][0].shape[1]
+        self._buffers: dict[int, list[np.ndarray]] = {}
+
+    def _get_buffers(self, n: int) -> list[np.ndarray]:
+        """Renvoie les buffers d'activation d'un batch de taille n (alloués une seule fois)"""
+        buffers = self._buffers.get(n)
+        if buffers is None:
+            buffers = [np.empty((n, w.shape[1]), dtype=np.float32) for w, _ in self.layers]
+            self._buffers[n] = buffers
+        return buffers
+
+    def __call__(self, x: np.ndarray, relu_last: bool = False) -> np.ndarray:
+        """
+        Passage à travers la chaîne
+
+        Args:
+            x (np.ndarray): entrées (n, in_dim) float32
+            relu_last (bool): applique aussi la ReLU après la dernière couche
+
+        Returns:
+            Activations de la dernière couche (buffer réutilisé au prochain appel de même taille)
+        """
+        buffers = self._get_buffers(x.shape[0])
+        last = len(self.layers) - 1
+        h = x
+        for i, ((w, b), out) in enumerate(zip(self.layers, buffers)):
+            np.matmul(h, w, out=out)
+            out += b
+            if i < last or relu_last:
+                np.maximum(out, 0.0, out=out)
+            h = out
+        return h
+
+# ======================================== RESEAUX ========================================
+class NumpyRegressionNet:
+    """
+    Évaluateur numpy de RegressionNet (mêmes poids, sans torch)
+    """
+    LAYERS = ["net.0", "net.2", "net.4", "net.6"]
+
+    def __init__(self, weights: dict[str, np.ndarray]):
+        """
+        Args:
+            weights (dict): state_dict exporté de RegressionNet
+        """
+        self.chain = _DenseChain(weights, self.LAYERS)
+        self._input = np.empty((1, self.chain.in_dim), dtype=np.float32)
+
+    def forward(self, x: np.ndarray) -> np.ndarray:
+        """
+        Passage d'un batch à travers le réseau
+
+        Args:
+            x (np.ndarray): états normalisés (n, 4)
+
+        Returns:
+            Positions Y d'arrivée normalisées (n, 1)
+        """
+        z = self.chain(np.asarray(x, dtype=np.float32))
+        np.negative(z, out=z)
+        np.exp(z, out=z)
+        z += 1.0
+        np.reciprocal(z, out=z)
+        return z
+
+    def predict_one(self, state: np.ndarray) -> float:
+        """
+        Prédit la position Y d'arrivée normalisée d'un seul état, sans allocation
+
+        Args:
+            state (np.ndarray): état normalisé [ball_x, ball_y, ball_dx, ball_dy]
+
+        Returns:
+            Position Y d'arrivée normalisée (entre 0 et 1)
+        """
+        self._input[0] = state
+        return float(self.forward(self._input)[0, 0])
+
+class NumpyDQNNet:
+    """
+    Évaluateur numpy du DQNNet dueling (mêmes poids, sans torch)
+    """
+    SHARED = ["shared.0", "shared.2"]
+    VALUE = ["value_stream.0", "value_stream.2"]
+    ADVANTAGE = ["advantage_stream.0", "advantage_stream.2"]
+
+    def __init__(self, weights: dict[str, np.ndarray]):
+        """
+        Args:
+            weights (dict): state_dict exporté de DQNNet
+        """
+        self.shared = _DenseChain(weights, self.SHARED)
+        self.value = _DenseChain(weights, self.VALUE)
+        self.advantage = _DenseChain(weights, self.ADVANTAGE)
+        self._input = np.empty((1, self.shared.in_dim), dtype=np.float32)
+
+    def forward(self, x: np.ndarray) -> np.ndarray:
+        """
+        Passage d'un batch à travers le réseau
+
+        Args:
+            x (np.ndarray): états normalisés (n, 6)
+
+        Returns:
+            Q-valeurs (n, 3)
+        """
+        shared = self.shared(np.asarray(x, dtype=np.float32), relu_last=True)
+        value = self.value(shared)
+        advantage = self.advantage(shared)
+        return value + advantage - advantage.mean(axis=1, keepdims=True)
+
+    def act(self, state: np.ndarray) -> int:
+        """
+        Renvoie l'action gloutonne d'un seul état
+
+        Args:
+            state (np.ndarray): état normalisé
+
+        Returns:
+            Indice d'action {0, 1, 2}
+        """
+        self._input[0] = state
+        return int(np.argmax(self.forward(self._input)[0]))
+
+# ======================================== EXPORT / CHARGEMENT ========================================
+def weights_fingerprint(weights: dict[str, np.ndarray]) -> str:
+    """Empreinte d'un state_dict {nom: tableau} dans son ordre (associe un export à la sauvegarde dont il provient)"""
+    digest = hashlib.sha1()
+    for name, array in weights.items():
+        digest.update(name.encode())
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.hexdigest()
+
+def npz_fingerprint(path: str | Path) -> str:
+    """Renvoie l'empreinte des poids enregistrée dans un export .npz (vide pour un export antérieur)"""
+    with np.load(path) as data:
+        return str(data["__fingerprint__"]) if "__fingerprint__" in data.files else ""
+
+def export_npz(src: str | Path, dst: str | Path | None = None) -> str:
+    """
+    Convertit une sauvegarde .pth de Bot en un .npz plat des poids du réseau
+
+    Args:
+        src (str | Path): chemin de la sauvegarde torch
+        dst (str | Path | None): chemin de destination (même nom en .npz par défaut)
+
+    Returns:
+        Chemin du fichier écrit
+    """
+    import torch
+
+    dst = Path(src).with_suffix(".npz") if dst is None else Path(dst)
+    ckpt = torch.load(src, map_location="cpu")
+    state = {k: v.detach().cpu().numpy() for k, v in ckpt["net"].items()}
+    kind = "dqn" if "shared.0.weight" in state else "regression"
+    np.savez(dst, __kind__=np.array(kind), __fingerprint__=np.array(weights_fingerprint(state)), **state)
+    return str(dst)
+
+def load_npz(path: str | Path) -> NumpyRegressionNet | NumpyDQNNet:
+    """
+    Charge un évaluateur numpy depuis un export .npz
+
+    Args:
+        path (str | Path): chemin du fichier .npz
+
+    Returns:
+        NumpyRegressionNet ou NumpyDQNNet selon le réseau exporté
+    """
+    with np.load(path) as data:
+        weights = {k: data[k] for k in data.files if k not in ("__kind__", "__fingerprint__")}
+        kind = str(data["__kind__"])
+    if kind == "dqn":
+        return NumpyDQNNet(weights)
+    return NumpyRegressionNet(weights)
+
+# ======================================== EXPORT DIRECT ========================================
+if __name__ == "__main__":
+    print(f"Export -> {export_npz('pong/_data/bot.pth')}")
@@ -0,0 +1,39 @@
+# ======================================== IMPORTS ========================================
+from __future__ import annotations
+import copy
+import io
+import warnings
+import torch
+import torch.nn as nn
+from torch.ao.quantization import quantize_dynamic
+
+# ======================================== QUANTIFICATION ========================================
+def quantize_net(net: nn.Module) -> nn.Module:
+    """
+    Quantifie dynamiquement en int8 les couches linéaires d'un réseau (poids int8, activations quantifiées à la volée)
+
+    Args:
+        net (nn.Module): réseau flottant (non modifié)
+
+    Returns:
+        Copie quantifiée, en évaluation sur CPU
+    """
+    module = copy.deepcopy(net).cpu().eval()
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        warnings.simplefilter("ignore", FutureWarning)
+        return quantize_dynamic(module, {nn.Linear}, dtype=torch.qint8)
+
+def weight_bytes(net: nn.Module) -> int:
+    """
+    Taille sérialisée des poids d'un réseau
+
+    Args:
+        net (nn.Module): réseau flottant ou quantifié
+
+    Returns:
+        Nombre d'octets du state_dict sérialisé
+    """
+    buffer = io.BytesIO()
+    torch.save(net.state_dict(), buffer)
+    return buffer.getbuffer().nbytes
@@ -0,0 +1,262 @@
+# ======================================== IMPORTS ========================================
+from __future__ import annotations
+import numpy as np
+
+# ======================================== MEMOIRE CIRCULAIRE ========================================
+class RingBuffer:
+    """
+    Mémoire de rejeu circulaire préallouée à colonnes typées
+
+    Chaque colonne est un tableau numpy de taille fixe : l'ajout est en O(1)
+    et le tirage se fait par tableau d'indices, indépendamment de la capacité.
+    """
+    def __init__(self, capacity: int, columns: dict[str, tuple[tuple[int, ...], type]], seed: int | np.random.SeedSequence | None = None):
+        """
+        Args:
+            capacity (int): nombre maximal de transitions conservées
+            columns (dict): colonnes {nom: (forme d'un élément, dtype)}
+            seed (int | SeedSequence | None): graine du générateur de tirage
+        """
+        self.capacity = capacity
+        self.columns: dict[str, np.ndarray] = {
+            name: np.zeros((capacity, *shape), dtype=dtype)
+            for name, (shape, dtype) in columns.items()
+        }
+        self._arrays = tuple(self.columns.values())
+        self.rng = np.random.default_rng(seed)
+        self.pos: int = 0
+        self.size: int = 0
+
+    def push(self, *values):
+        """
+        Ajoute une transition (une valeur par colonne, dans l'ordre de déclaration)
+        """
+        i = self.pos
+        for array, value in zip(self._arrays, values):
+            array[i] = value
+        self.pos = (i + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def push_batch(self, *values):
+        """
+        Ajoute un batch de transitions (un tableau par colonne, de même longueur)
+        """
+        n = len(values[0])
+        if n == 0:
+            return
+        if n > self.capacity:
+            values = tuple(v[-self.capacity:] for v in values)
+            n = self.capacity
+        start = self.pos
+        end = start + n
+        for array, value in zip(self._arrays, values):
+            if end <= self.capacity:
+                array[start:end] = value
+            else:
+                split = self.capacity - start
+                array[start:] = value[:split]
+                array[:end - self.capacity] = value[split:]
+        self.pos = end % self.capacity
+        self.size = min(self.size + n, self.capacity)
+
+    def sample(self, batch_size: int) -> tuple[np.ndarray, ...]:
+        """
+        Tire un batch aléatoire (avec remise) depuis le buffer
+
+        Args:
+            batch_size (int): nombre d'échantillons à tirer
+
+        Returns:
+            Tuple de tableaux contigus, un par colonne
+        """
+        idx = self.rng.integers(0, self.size, batch_size)
+        return tuple(array[idx] for array in self._arrays)
+
+    def clear(self):
+        """Vide le buffer sans libérer la mémoire"""
+        self.pos = 0
+        self.size = 0
+
+    def __len__(self) -> int:
+        """Renvoie le nombre de transitions stockées"""
+        return self.size
+
+# ======================================== ARBRE DE SOMMES ========================================
+class SumTree:
+    """
+    Arbre binaire de sommes stocké dans un tableau (racine en 1, feuilles en [leaves, 2 * leaves))
+
+    Mise à jour et tirage en O(log n) par élément, vectorisés sur un batch d'indices.
+    """
+    def __init__(self, capacity: int):
+        """
+        Args:
+            capacity (int): nombre de feuilles utiles
+        """
+        self.capacity = capacity
+        self.leaves = 1 << max(0, (capacity - 1).bit_length())
+        self.depth = self.leaves.bit_length() - 1
+        self.tree = np.zeros(2 * self.leaves, dtype=np.float64)
+
+    @property
+    def total(self) -> float:
+        """Somme de toutes les feuilles"""
+        return float(self.tree[1])
+
+    def get(self, idx: np.ndarray) -> np.ndarray:
+        """Renvoie la valeur des feuilles idx"""
+        return self.tree[idx + self.leaves]
+
+    def update(self, idx: np.ndarray, values: np.ndarray):
+        """
+        Fixe la valeur de feuilles et propage les sommes vers la racine
+
+        Args:
+            idx (np.ndarray): indices des feuilles
+            values (np.ndarray): nouvelles valeurs
+        """
+        nodes = np.asarray(idx) + self.leaves
+        self.tree[nodes] = values
+        for _ in range(self.depth):
+            nodes = np.unique(nodes >> 1)
+            self.tree[nodes] = self.tree[2 * nodes] + self.tree[2 * nodes + 1]
+
+    def rebuild(self, values: np.ndarray):
+        """
+        Remplace toutes les feuilles et recalcule l'arbre en O(n)
+
+        Args:
+            values (np.ndarray): valeurs des feuilles (les suivantes sont mises à 0)
+        """
+        leaves = self.tree[self.leaves:]
+        leaves[:len(values)] = values
+        leaves[len(values):] = 0.0
+        lo = self.leaves
+        while lo > 1:
+            lo //= 2
+            self.tree[lo:2 * lo] = self.tree[2 * lo:4 * lo:2] + self.tree[2 * lo + 1:4 * lo:2]
+
+    def find(self, values: np.ndarray) -> np.ndarray:
+        """
+        Descend l'arbre pour chaque valeur cumulée
+
+        Args:
+            values (np.ndarray): sommes cumulées dans [0, total)
+
+        Returns:
+            Indices des feuilles correspondantes
+        """
+        values = np.array(values, dtype=np.float64)
+        nodes = np.ones(len(values), dtype=np.int64)
+        for _ in range(self.depth):
+            left = self.tree[2 * nodes]
+            right = values >= left
+            values -= left * right
+            nodes = 2 * nodes + right
+        return nodes - self.leaves
+
+    def clear(self):
+        """Remet toutes les feuilles à 0"""
+        self.tree.fill(0.0)
+
+# ======================================== MEMOIRE PRIORITAIRE ========================================
+class PrioritizedRingBuffer(RingBuffer):
+    """
+    Mémoire de rejeu circulaire à priorités (tirage proportionnel à |erreur TD| ^ alpha)
+
+    Les nouvelles transitions reçoivent la priorité maximale observée pour être rejouées au moins une fois.
+    Les priorités brutes sont conservées pour pouvoir changer alpha sans perdre d'information.
+    """
+    ALPHA_TOLERANCE = 0.01                                                  # (float): écart d'alpha déclenchant la reconstruction de l'arbre
+
+    def __init__(self, capacity: int, columns: dict[str, tuple[tuple[int, ...], type]], alpha: float = 0.6, eps: float = 1e-6, seed: int | np.random.SeedSequence | None = None):
+        """
+        Args:
+            capacity (int): nombre maximal de transitions conservées
+            columns (dict): colonnes {nom: (forme d'un élément, dtype)}
+            alpha (float): exposant des priorités (0 : tirage uniforme)
+            eps (float): priorité minimale ajoutée à |erreur TD|
+            seed (int | SeedSequence | None): graine du générateur de tirage
+        """
+        super().__init__(capacity, columns, seed=seed)
+        self.alpha = alpha
+        self.eps = eps
+        self.tree = SumTree(capacity)
+        self.priorities = np.zeros(capacity, dtype=np.float64)
+        self.max_priority: float = 1.0
+
+    def _set_priorities(self, idx: np.ndarray, priorities: np.ndarray):
+        """Enregistre des priorités brutes et met à jour l'arbre"""
+        self.priorities[idx] = priorities
+        self.tree.update(idx, priorities ** self.alpha)
+
+    def push(self, *values):
+        """
+        Ajoute une transition avec la priorité maximale
+        """
+        i = self.pos
+        super().push(*values)
+        self._set_priorities(np.array([i]), np.array([self.max_priority]))
+
+    def push_batch(self, *values):
+        """
+        Ajoute un batch de transitions avec la priorité maximale
+        """
+        n = min(len(values[0]), self.capacity)
+        if n == 0:
+            return
+        idx = (self.pos + np.arange(n)) % self.capacity
+        super().push_batch(*values)
+        self._set_priorities(idx, np.full(n, self.max_priority))
+
+    def sample(self, batch_size: int, beta: float = 0.4) -> tuple[np.ndarray, ...]:
+        """
+        Tire un batch stratifié proportionnellement aux priorités
+
+        Args:
+            batch_size (int): nombre d'échantillons à tirer
+            beta (float): exposant de correction d'importance (1 : correction complète)
+
+        Returns:
+            Tuple de tableaux (un par colonne), suivi des indices tirés et des poids d'importance float32
+        """
+        total = self.tree.total
+        segment = total / batch_size
+        targets = (np.arange(batch_size) + self.rng.random(batch_size)) * segment
+        idx = np.minimum(self.tree.find(np.minimum(targets, total * (1 - 1e-12))), self.size - 1)
+
+        probs = self.tree.get(idx) / total
+        weights = (self.size * np.maximum(probs, 1e-12)) ** -beta
+        weights /= weights.max()
+        return (*(array[idx] for array in self._arrays), idx, weights.astype(np.float32))
+
+    def update_priorities(self, idx: np.ndarray, td_errors: np.ndarray):
+        """
+        Met à jour les priorités des transitions rejouées
+
+        Args:
+            idx (np.ndarray): indices renvoyés par sample
+            td_errors (np.ndarray): erreurs TD correspondantes
+        """
+        priorities = np.abs(td_errors).astype(np.float64) + self.eps
+        self.max_priority = max(self.max_priority, float(priorities.max()))
+        self._set_priorities(idx, priorities)
+
+    def set_alpha(self, alpha: float):
+        """
+        Change l'exposant des priorités (l'arbre n'est reconstruit qu'au-delà de ALPHA_TOLERANCE)
+
+        Args:
+            alpha (float): nouvel exposant
+        """
+        if abs(alpha - self.alpha) < self.ALPHA_TOLERANCE:
+            return
+        self.alpha = alpha
+        self.tree.rebuild(self.priorities[:self.size] ** alpha)
+
+    def clear(self):
+        """Vide le buffer sans libérer la mémoire"""
+        super().clear()
+        self.tree.clear()
+        self.priorities.fill(0.0)
+        self.max_priority = 1.0
@@ -0,0 +1,58 @@
+# ======================================== IMPORTS ========================================
+"""
+Flux aléatoires indépendants dérivés d'une graine racine
+
+Chaque composant (environnement, replay buffer, exploration, acteur parallèle) reçoit son propre
+np.random.Generator, obtenu par SeedSequence.spawn : les flux ne se chevauchent pas, et une graine
+racine suffit à rejouer un entraînement ou une mesure à l'identique.
+"""
+from __future__ import annotations
+import numpy as np
+
+Seed = int | np.random.SeedSequence | None
+
+# ======================================== GRAINES ========================================
+def as_seed_sequence(seed: Seed) -> np.random.SeedSequence:
+    """
+    Convertit une graine en SeedSequence
+
+    Args:
+        seed (int | SeedSequence | None): graine racine (None : entropie du système)
+
+    Returns:
+        SeedSequence correspondante (renvoyée telle quelle si c'en est déjà une)
+    """
+    return seed if isinstance(seed, np.random.SeedSequence) else np.random.SeedSequence(seed)
+
+def spawn_rngs(seed: Seed, n: int) -> list[np.random.Generator]:
+    """
+    Crée n générateurs indépendants issus d'une même graine
+
+    Args:
+        seed (int | SeedSequence | None): graine racine
+        n (int): nombre de générateurs
+
+    Returns:
+        Liste de np.random.Generator
+    """
+    return [np.random.default_rng(child) for child in as_seed_sequence(seed).spawn(n)]
+
+def with_spawned(seed: np.random.SeedSequence, n_children: int) -> np.random.SeedSequence:
+    """
+    Reconstruit une SeedSequence ayant déjà engendré n_children enfants (reprise d'un entraînement)
+
+    Args:
+        seed (SeedSequence): séquence racine
+        n_children (int): nombre d'enfants déjà engendrés (le compteur n'est jamais diminué)
+
+    Returns:
+        SeedSequence de même entropie dont les prochains spawn ne répètent pas les flux déjà utilisés
+    """
+    return np.random.SeedSequence(
+        seed.entropy, spawn_key=seed.spawn_key, pool_size=seed.pool_size,
+        n_children_spawned=max(seed.n_children_spawned, n_children),
+    )
+
+def torch_seed(seed: np.random.SeedSequence) -> int:
+    """Dérive une graine entière 63 bits pour torch.manual_seed"""
+    return int(seed.generate_state(1, np.uint64)[0] >> np.uint64(1))
@@ -1,7 +1,7 @@
 # ======================================== IMPORTS ========================================
 from ..._core import ctx
 from ._session import Session
-from ._bot import Bot
+from ._agent import Agent, load_agent_async
 
 # ======================================== MODE DE JEU ========================================
 class Solo(Session):
@@ -10,18 +10,41 @@ class Solo(Session):
         # Initialisation de l'état
         super().__init__("solo")
 
-        # Agent
-        self.bot = Bot()
+        # Agent : heuristique analytique immédiate, modèle chargé en arrière-plan
+        self.bot = Agent(backend="analytic")
+        self.backend = "net"
+        self.ready = load_agent_async()
+        self._loaded = False
+
+    # ======================================== AGENT ========================================
+    def _poll_bot(self):
+        """Remplace l'agent de secours par le modèle si son chargement est terminé (entre deux parties)"""
+        if self._loaded or not self.ready.done():
+            return
+        self._loaded = True
+        try:
+            bot = self.ready.result()
+        except Exception as e:
+            print(f"[Bot] Model loading failed ({e}), keeping analytic backend")
+            return
+        bot.set_backend(self.backend)
+        self.bot = bot
 
     # ======================================== LANCEMENT ========================================
     def start(self):
         """Initialisation d'une session"""
         super().start()
         self.current.player_2.set_status("ennemy")
+        self._poll_bot()
+        self.bot.reset()
 
     def on_enter(self):
         """Activation de l'état"""
         ctx.modifiers.set("p2_pseudo", "Bot")
+        self.backend = ctx.modifiers["bot_backend"]
+        self._poll_bot()
+        if self._loaded:
+            self.bot.set_backend(self.backend)
         return super().on_enter()
 
     # ======================================== ACTUALISATION ========================================
@@ -29,9 +52,13 @@ class Solo(Session):
         """Actualisation de la session"""
         if not super().update():
             return
-        p2_y = self.current.player_2.centery
-        ball_x, ball_y = self.current.ball.center
-        ball_dx, ball_dy = self.current.ball.dx, self.current.ball.dy
+        # État simulé (et non la position interpolée affichée)
+        state = self.current.state
+        if self.bot.field is not state.config:
+            self.bot.set_field(state.config)
+        p2_y = self.current.player_2.state.y
+        ball = state.ball
+        ball_x, ball_y, ball_dx, ball_dy = ball.x, ball.y, ball.dx, ball.dy
         move = self.bot.get_move(p2_y, ball_x, ball_y, ball_dx, ball_dy)
         if move == -1:
             self.p2_move_up()
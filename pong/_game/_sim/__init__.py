@@ -0,0 +1,17 @@
+# ======================================== IMPORTS ========================================
+"""
+Cœur de simulation sans pygame : états de partie et pas de simulation
+
+Les entités (Ball, Paddle) et les modes de jeu ne font qu'afficher et piloter ces états :
+une partie peut ainsi être jouée sans fenêtre, panels ni audio (serveur, entraînement, mesures).
+"""
+from ._states import SimConfig, BallState, PaddleState, MatchState
+from ._physics import BOUNCE, GOAL, serve, reset_round, move_paddle, is_end, sweep_paddle, step
+from ._clock import SimClock
+
+# ======================================== EXPORTS ========================================
+__all__ = [
+    "SimConfig", "BallState", "PaddleState", "MatchState",
+    "BOUNCE", "GOAL", "serve", "reset_round", "move_paddle", "is_end", "sweep_paddle", "step",
+    "SimClock",
+]
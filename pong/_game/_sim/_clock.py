@@ -0,0 +1,51 @@
+# ======================================== IMPORTS ========================================
+from __future__ import annotations
+
+# ======================================== HORLOGE ========================================
+class SimClock:
+    """
+    Horloge de simulation à pas fixe
+
+    Le temps réel de chaque frame est accumulé puis consommé par pas de 1 / rate secondes :
+    la physique ne dépend plus de la cadence d'affichage. alpha indique la fraction de pas
+    restante, pour interpoler l'affichage entre les deux derniers états simulés.
+    """
+    __slots__ = ("rate", "dt", "max_steps", "accumulator", "alpha")
+
+    def __init__(self, rate: int = 240, max_steps: int = 16):
+        """
+        Args:
+            rate (int): fréquence de simulation en Hz
+            max_steps (int): nombre maximal de pas par frame (au-delà, le retard est abandonné)
+        """
+        self.rate = rate
+        self.dt = 1 / rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.alpha = 0.0
+
+    def reset(self):
+        """Vide l'accumulateur"""
+        self.accumulator = 0.0
+        self.alpha = 0.0
+
+    def advance(self, frame_dt: float) -> int:
+        """
+        Accumule la durée d'une frame
+
+        Args:
+            frame_dt (float): durée réelle de la frame en secondes
+
+        Returns:
+            Nombre de pas de simulation à exécuter pour cette frame
+        """
+        self.accumulator += frame_dt
+        steps = 0
+        while self.accumulator >= self.dt and steps < self.max_steps:
+            self.accumulator -= self.dt
+            steps += 1
+        # Frame trop longue (chargement, fenêtre déplacée) : le jeu ralentit plutôt que de rattraper
+        if steps == self.max_steps:
+            self.accumulator %= self.dt
+        self.alpha = self.accumulator / self.dt
+        return steps
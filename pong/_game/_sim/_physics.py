@@ -0,0 +1,337 @@
+# ======================================== IMPORTS ========================================
+from __future__ import annotations
+import math
+
+from ._states import PaddleState, MatchState
+
+# ======================================== EVENEMENTS ========================================
+BOUNCE = "bounce"               # (str): rebond de la balle (mur ou raquette)
+GOAL = "goal"                   # (str): balle arrivée dans un but
+
+# ======================================== SERVICE ========================================
+def serve(match: MatchState):
+    """
+    Replace la balle au centre avec sa vitesse initiale et un angle de service aléatoire
+
+    Args:
+        match (MatchState): partie
+    """
+    config, ball, rng = match.config, match.ball, match.rng
+    ball.x = config.width / 2
+    ball.y = config.height / 2
+    ball.celerity = config.celerity_min
+
+    # Côté interdit tiré au sort, puis angle entier en degrés dans l'intervalle autorisé
+    angle_min, angle_max = config.serve_angles
+    disabled_side = ("left", "right")[rng.integers(2)]
+    if disabled_side == "left":
+        degrees = int(rng.integers(angle_min, angle_max + 1))
+    else:
+        degrees = int(rng.integers(180 - angle_max, 180 - angle_min + 1))
+    ball.angle = math.radians(degrees * (-1, 1)[rng.integers(2)])
+
+def reset_paddle(paddle: PaddleState, match: MatchState):
+    """Replace une raquette au centre de son côté"""
+    config = match.config
+    paddle.x = config.paddle_offset if paddle.side == 0 else config.width - config.paddle_offset
+    paddle.y = config.height / 2
+    paddle.cooldown = 0.0
+
+def reset_round(match: MatchState):
+    """
+    Prépare un nouveau point (balle au service, raquettes au centre)
+
+    Args:
+        match (MatchState): partie
+    """
+    serve(match)
+    for paddle in match.paddles:
+        reset_paddle(paddle, match)
+
+# ======================================== RAQUETTES ========================================
+def move_paddle(paddle: PaddleState, direction: int, dt: float, match: MatchState):
+    """
+    Déplace une raquette verticalement sans sortir du terrain
+
+    Args:
+        paddle (PaddleState): raquette
+        direction (int): -1 vers le haut, +1 vers le bas, 0 immobile
+        dt (float): durée écoulée en secondes
+        match (MatchState): partie
+    """
+    if direction == 0:
+        return
+    half = paddle.height / 2
+    paddle.y = min(max(paddle.y + direction * paddle.celerity * dt, half), match.config.height - half)
+
+# ======================================== FIN DE POINT ========================================
+def is_end(match: MatchState, side: int) -> bool:
+    """
+    Applique les règles du mode lorsque la balle touche un mur vertical
+
+    Args:
+        match (MatchState): partie
+        side (int): mur touché (0 : gauche, 1 : droite)
+
+    Returns:
+        True si le point est terminé (but), False si la balle doit rebondir
+    """
+    # Mur : le score augmente à chaque rebond côté adverse, la partie s'arrête côté joueur
+    if match.mode == "wall":
+        player_side = match.p1_side
+        if side == player_side and match.authoritative:
+            match.ended = True
+            return True
+        setattr(match, f"score_{player_side}", getattr(match, f"score_{player_side}") + 1)
+        return False
+
+    # Classique : point pour l'adversaire du mur touché
+    if not match.authoritative:
+        return False
+    if side == 0: match.score_1 += 1
+    else: match.score_0 += 1
+    if match.score_0 >= match.score_limit or match.score_1 >= match.score_limit:
+        match.winner = 1 - side
+        match.ended = True
+    match.next_round = True
+    return True
+
+# ======================================== COLLISIONS ========================================
+def bounce(match: MatchState, nx: float, ny: float) -> bool:
+    """
+    Fait rebondir la balle (réflexion, bornage de l'angle puis bruit aléatoire)
+
+    Args:
+        match (MatchState): partie
+        nx (float): composante x de la normale extérieure unitaire
+        ny (float): composante y de la normale extérieure unitaire
+
+    Returns:
+        True si la balle a rebondi (False si elle s'éloigne déjà de la surface)
+    """
+    ball, config = match.ball, match.config
+
+    # Réflexion vectorielle
+    vx, vy = ball.dx, ball.dy
+    dot = vx * nx + vy * ny
+    if dot >= 0:
+        return False
+    vx -= 2 * dot * nx
+    vy -= 2 * dot * ny
+    norm = math.hypot(vx, vy)
+    vx, vy = vx / norm, vy / norm
+
+    # Clamp sur le vecteur : élévation e au-dessus de l'horizontale (sin e = |dy|)
+    sign = -1.0 if vy > 0 or (vy == 0 and vx < 0) else 1.0
+    leftward = vx < 0
+    if leftward:
+        sin_e = min(max(abs(vy), config.sin_angle_min), config.sin_angle_max)
+        cos_e = math.sqrt(1 - sin_e * sin_e)
+    else:
+        sin_e, cos_e = config.sin_angle_min, config.cos_angle_min
+
+    # Bruit : l'angle absolu augmente (élévation + u vers la droite, - u vers la gauche)
+    u = float(match.rng.uniform(0, config.bouncing_epsilon))
+    cos_u, sin_u = math.cos(u), math.sin(u)
+    if leftward:
+        sin_e, cos_e = sin_e * cos_u - cos_e * sin_u, cos_e * cos_u + sin_e * sin_u
+        ball.dx = -cos_e
+    else:
+        sin_e, cos_e = sin_e * cos_u + cos_e * sin_u, cos_e * cos_u - sin_e * sin_u
+        ball.dx = cos_e
+    ball.dy = -sign * sin_e
+    return True
+
+def sweep_paddle(
+    x0: float, y0: float, x1: float, y1: float, radius: float, paddle: PaddleState,
+) -> tuple[float, float, float, float] | None:
+    """
+    Instant d'impact analytique d'une balle en mouvement contre une raquette
+
+    Le déplacement du centre (x0, y0) -> (x1, y1) est intersecté avec le contour de la raquette
+    gonflé du rayon de la balle (coins arrondis de border_radius) : côtés droits puis quarts de
+    cercle, en coordonnées locales et sur des flottants uniquement. Le premier contact le long du
+    déplacement est retenu, y compris en sortie si le centre part de l'intérieur du contour.
+
+    Args:
+        x0, y0 (float): centre de la balle avant le déplacement
+        x1, y1 (float): centre de la balle après le déplacement
+        radius (float): rayon de la balle
+        paddle (PaddleState): raquette
+
+    Returns:
+        Tuple (x, y, nx, ny) du centre de la balle à l'impact et de la normale unitaire de la raquette
+        (face de moindre pénétration si le centre est dans le rectangle), ou None sans contact
+        ou pendant le délai de renvoi de la raquette
+    """
+    if paddle.cooldown > 0:
+        return None
+    hw, hh = paddle.width / 2, paddle.height / 2
+    half_w, half_h = hw + radius, hh + radius
+    ox, oy = x0 - paddle.x, y0 - paddle.y
+    ex, ey = x1 - x0, y1 - y0
+
+    # Boîte englobante du déplacement disjointe du contour
+    if ox + (ex if ex < 0 else 0) > half_w or ox + (ex if ex > 0 else 0) < -half_w:
+        return None
+    if oy + (ey if ey < 0 else 0) > half_h or oy + (ey if ey > 0 else 0) < -half_h:
+        return None
+
+    corner = min(paddle.border_radius, half_w, half_h)
+    inner_w, inner_h = half_w - corner, half_h - corner
+    best = 2.0
+
+    # Côtés droits
+    if ex != 0:
+        t = (-half_w - ox) / ex
+        if 0 <= t < best and -inner_h <= oy + t * ey <= inner_h:
+            best = t
+        t = (half_w - ox) / ex
+        if 0 <= t < best and -inner_h <= oy + t * ey <= inner_h:
+            best = t
+    if ey != 0:
+        t = (-half_h - oy) / ey
+        if 0 <= t < best and -inner_w <= ox + t * ex <= inner_w:
+            best = t
+        t = (half_h - oy) / ey
+        if 0 <= t < best and -inner_w <= ox + t * ex <= inner_w:
+            best = t
+
+    # Coins arrondis (quart de cercle tourné vers l'extérieur), seulement si le déplacement atteint leur quadrant
+    a = ex * ex + ey * ey
+    if corner > 0 and a > 0:
+        for sx, sy in ((-1, -1), (-1, 1), (1, -1), (1, 1)):
+            if (ox * sx < inner_w and (ox + ex) * sx < inner_w) or (oy * sy < inner_h and (oy + ey) * sy < inner_h):
+                continue
+            fx, fy = ox - sx * inner_w, oy - sy * inner_h
+            b = fx * ex + fy * ey
+            disc = b * b - a * (fx * fx + fy * fy - corner * corner)
+            if disc < 0:
+                continue
+            root = math.sqrt(disc)
+            t = (-b - root) / a
+            if 0 <= t < best and (fx + t * ex) * sx >= 0 and (fy + t * ey) * sy >= 0:
+                best = t
+                continue
+            t = (-b + root) / a
+            if 0 <= t < best and (fx + t * ex) * sx >= 0 and (fy + t * ey) * sy >= 0:
+                best = t
+    if best > 1:
+        return None
+
+    # Normale : du point le plus proche du rectangle de la raquette vers le centre de la balle
+    px, py = ox + best * ex, oy + best * ey
+    nx = px - (hw if px > hw else -hw if px < -hw else px)
+    ny = py - (hh if py > hh else -hh if py < -hh else py)
+    norm = math.sqrt(nx * nx + ny * ny)
+    if norm > 0:
+        nx, ny = nx / norm, ny / norm
+    elif hw - abs(px) <= hh - abs(py):
+        nx, ny = (1.0 if px >= 0 else -1.0), 0.0
+    else:
+        nx, ny = 0.0, (1.0 if py >= 0 else -1.0)
+    return x0 + best * ex, y0 + best * ey, nx, ny
+
+def collide_paddle(match: MatchState, paddle: PaddleState, x0: float, y0: float) -> bool:
+    """
+    Vérifie si le déplacement de la balle rencontre une raquette, et la fait rebondir
+
+    Args:
+        match (MatchState): partie
+        paddle (PaddleState): raquette du côté de la balle
+        x0, y0 (float): position de la balle avant le déplacement
+
+    Returns:
+        True si la balle a rebondi sur la raquette
+    """
+    ball, center, r = match.ball, match.config.width / 2, match.config.ball_radius
+    if abs(ball.x - center) + r < abs(paddle.x - center) - paddle.width / 2:
+        return False
+
+    hit = sweep_paddle(x0, y0, ball.x, ball.y, r, paddle)
+    if hit is None:
+        return False
+    ball.x, ball.y, nx, ny = hit
+    bounced = bounce(match, nx, ny)
+    paddle.cooldown = match.config.paddle_cooldown
+    return bounced
+
+def collide_horizontal(match: MatchState) -> bool:
+    """Vérifie la collision avec les murs horizontaux"""
+    ball, r, height = match.ball, match.config.ball_radius, match.config.height
+    ball.y = min(max(ball.y, r), height - r)
+    if ball.y - r <= 0:
+        return bounce(match, 0.0, 1.0)
+    if ball.y + r >= height:
+        return bounce(match, 0.0, -1.0)
+    return False
+
+def collide_vertical(match: MatchState, events: list[str]):
+    """Vérifie la collision avec les murs verticaux (but ou rebond selon le mode)"""
+    ball, r, width = match.ball, match.config.ball_radius, match.config.width
+    ball.x = min(max(ball.x, r), width - r)
+    for side, touched, normal in ((0, ball.x - r <= 0, 1.0), (1, ball.x + r >= width, -1.0)):
+        if touched:
+            if is_end(match, side):
+                events.append(GOAL)
+            elif bounce(match, normal, 0.0):
+                events.append(BOUNCE)
+            return
+
+# ======================================== PAS DE SIMULATION ========================================
+def advance_ball(match: MatchState, dt: float, events: list[str]):
+    """
+    Accélère et déplace la balle, puis résout les collisions (raquette, murs horizontaux, murs verticaux)
+
+    Args:
+        match (MatchState): partie
+        dt (float): durée du pas en secondes
+        events (list[str]): événements produits (BOUNCE, GOAL)
+    """
+    ball, config = match.ball, match.config
+
+    # Détermination du côté
+    side = min(int(ball.x // (0.5 * config.width)), 1)
+    paddle = match.paddles[side]
+    if match.max_players == 1 and side != match.p1_side:
+        paddle = None
+
+    # Vitesse croissante
+    ball.celerity = min(ball.celerity + config.acceleration * dt, config.celerity_max)
+    distance = ball.celerity * dt
+
+    # Déplacement
+    x0, y0 = ball.x, ball.y
+    ball.x += ball.dx * distance
+    ball.y += ball.dy * distance
+
+    # Collisions
+    if paddle is not None and collide_paddle(match, paddle, x0, y0):
+        events.append(BOUNCE)
+    if collide_horizontal(match):
+        events.append(BOUNCE)
+    collide_vertical(match, events)
+
+def step(match: MatchState, inputs: tuple[int, int] = (0, 0), dt: float = 1 / 240) -> list[str]:
+    """
+    Avance la partie d'un pas de simulation
+
+    Args:
+        match (MatchState): partie (modifiée en place)
+        inputs (tuple[int, int]): direction de chaque raquette par côté (-1 haut, 0, +1 bas)
+        dt (float): durée du pas en secondes
+
+    Returns:
+        Événements du pas (BOUNCE, GOAL), pour le son et l'affichage
+    """
+    events: list[str] = []
+    if match.paused:
+        return events
+    for paddle, direction in zip(match.paddles, inputs):
+        move_paddle(paddle, direction, dt, match)
+    if not match.playing:
+        return events
+    for paddle in match.paddles:
+        paddle.cooldown = max(0.0, paddle.cooldown - dt)
+    advance_ball(match, dt, events)
+    return events
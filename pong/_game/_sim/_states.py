@@ -0,0 +1,208 @@
+# ======================================== IMPORTS ========================================
+from __future__ import annotations
+import math
+import numpy as np
+
+# ======================================== CONFIGURATION ========================================
+class SimConfig:
+    """
+    Constantes d'une partie : terrain, balle et raquettes (valeurs par défaut des modificateurs)
+    """
+    __slots__ = (
+        "width", "height",
+        "ball_radius", "celerity_min", "celerity_max", "acceleration",
+        "angle_min", "angle_max", "sin_angle_min", "cos_angle_min", "sin_angle_max", "serve_angles", "bouncing_epsilon",
+        "paddle_width", "paddle_height", "paddle_border_radius", "paddle_offset", "paddle_celerity", "paddle_cooldown",
+    )
+
+    def __init__(
+        self,
+        width: float = 1440,
+        height: float = 1080,
+        ball_radius: float = 15,
+        celerity_min: float = 600,
+        celerity_max: float = 2400,
+        acceleration_duration: float = 64,
+        angle_min: float = 15,
+        angle_max: float = 30,
+        bouncing_epsilon: float = 5,
+        paddle_size: float = 120,
+        paddle_border_radius: float = 10,
+        paddle_offset: float = 50,
+        paddle_celerity: float = 700,
+        paddle_cooldown: float = 0.1,
+    ):
+        """
+        Args:
+            width (float): largeur du terrain en pixels
+            height (float): hauteur du terrain en pixels
+            ball_radius (float): rayon de la balle
+            celerity_min (float): vitesse initiale de la balle en px/s
+            celerity_max (float): vitesse finale de la balle en px/s
+            acceleration_duration (float): durée d'accélération de la balle en secondes
+            angle_min (float): angle minimal de déplacement de la balle en degrés
+            angle_max (float): angle maximal de déplacement de la balle en degrés
+            bouncing_epsilon (float): aléatoire de l'angle dans les rebonds en degrés
+            paddle_size (float): hauteur de la raquette (largeur : size / 6)
+            paddle_border_radius (float): arrondi des coins de la raquette
+            paddle_offset (float): distance entre le centre de la raquette et son mur
+            paddle_celerity (float): vitesse de la raquette en px/s
+            paddle_cooldown (float): délai en secondes avant qu'une raquette puisse à nouveau renvoyer la balle
+        """
+        self.width = width
+        self.height = height
+        self.ball_radius = ball_radius
+        self.celerity_min = celerity_min
+        self.celerity_max = celerity_max
+        self.acceleration = (celerity_max - celerity_min) / acceleration_duration
+        self.angle_min = math.radians(angle_min)
+        self.angle_max = math.radians(angle_max)
+        self.sin_angle_min = math.sin(self.angle_min)
+        self.cos_angle_min = math.cos(self.angle_min)
+        self.sin_angle_max = math.sin(self.angle_max)
+        self.serve_angles = (int(angle_min), int(angle_max))
+        self.bouncing_epsilon = math.radians(bouncing_epsilon)
+        self.paddle_width = paddle_size / 6
+        self.paddle_height = paddle_size
+        self.paddle_border_radius = paddle_border_radius
+        self.paddle_offset = paddle_offset
+        self.paddle_celerity = paddle_celerity
+        self.paddle_cooldown = paddle_cooldown
+
+    @classmethod
+    def from_properties(cls, ball: dict, paddle: dict, width: float, height: float) -> SimConfig:
+        """
+        Construit la configuration à partir des propriétés des modificateurs
+
+        Args:
+            ball (dict): propriétés de la catégorie "ball" (sans préfixe)
+            paddle (dict): propriétés de la catégorie "paddle" (sans préfixe)
+            width (float): largeur du terrain
+            height (float): hauteur du terrain
+        """
+        return cls(
+            width=width,
+            height=height,
+            ball_radius=ball["radius"],
+            celerity_min=ball["celerity_min"],
+            celerity_max=ball["celerity_max"],
+            acceleration_duration=ball["acceleration_duration"],
+            angle_min=ball["angle_min"],
+            angle_max=ball["angle_max"],
+            bouncing_epsilon=ball["bouncing_epsilon"],
+            paddle_size=paddle["size"],
+            paddle_border_radius=paddle["border_radius"],
+        )
+
+# ======================================== ETATS ========================================
+class BallState:
+    """
+    État de la balle : position du centre, direction unitaire et vitesse
+
+    La direction est stockée en vecteur (dx, dy), lu à chaque pas sans trigonométrie ;
+    l'angle n'est qu'une vue dérivée (service, réseau).
+    """
+    __slots__ = ("x", "y", "dx", "dy", "celerity")
+
+    def __init__(self, x: float = 0.0, y: float = 0.0, angle: float = 0.0, celerity: float = 0.0):
+        """
+        Args:
+            x (float): position X du centre
+            y (float): position Y du centre
+            angle (float): angle de déplacement en radians (0 : vers la droite, positif : vers le haut)
+            celerity (float): vitesse en px/s
+        """
+        self.x = x
+        self.y = y
+        self.angle = angle
+        self.celerity = celerity
+
+    @property
+    def angle(self) -> float:
+        """Angle de déplacement en radians, dérivé du vecteur direction"""
+        return math.atan2(-self.dy, self.dx)
+
+    @angle.setter
+    def angle(self, value: float):
+        """Fixe la direction à partir d'un angle en radians"""
+        self.dx = math.cos(value)
+        self.dy = -math.sin(value)
+
+class PaddleState:
+    """
+    État d'une raquette : position du centre, dimensions et délai avant le prochain renvoi
+    """
+    __slots__ = ("side", "x", "y", "width", "height", "border_radius", "celerity", "cooldown")
+
+    def __init__(self, side: int, config: SimConfig):
+        """
+        Args:
+            side (int): côté de la raquette (0 : gauche, 1 : droite)
+            config (SimConfig): constantes de la partie
+        """
+        self.side = side
+        self.width = config.paddle_width
+        self.height = config.paddle_height
+        self.border_radius = config.paddle_border_radius
+        self.celerity = config.paddle_celerity
+        self.x = config.paddle_offset if side == 0 else config.width - config.paddle_offset
+        self.y = config.height / 2
+        self.cooldown = 0.0
+
+class MatchState:
+    """
+    État complet d'une partie : balle, raquettes, scores et drapeaux de déroulement
+    """
+    __slots__ = (
+        "config", "mode", "p1_side", "score_limit", "authoritative", "rng",
+        "ball", "paddles",
+        "score_0", "score_1", "winner",
+        "frozen", "paused", "ended", "next_round",
+    )
+
+    def __init__(
+        self,
+        config: SimConfig | None = None,
+        mode: str = "classic",
+        p1_side: int = 0,
+        score_limit: int = 3,
+        seed: int | np.random.SeedSequence | None = None,
+    ):
+        """
+        Args:
+            config (SimConfig | None): constantes de la partie (valeurs par défaut si None)
+            mode (str): règles de fin de point ("classic" | "wall")
+            p1_side (int): côté du joueur 1
+            score_limit (int): score à atteindre (mode classique)
+            seed (int | SeedSequence | None): graine du service et du bruit de rebond
+        """
+        self.config = config if config is not None else SimConfig()
+        self.mode = mode
+        self.p1_side = p1_side
+        self.score_limit = score_limit
+        self.authoritative = True       # False : client en ligne, les buts sont décidés par l'hôte
+        self.rng = np.random.default_rng(seed)
+
+        self.ball = BallState()
+        self.paddles = (PaddleState(0, self.config), PaddleState(1, self.config))
+
+        self.score_0: int | None = 0
+        self.score_1: int | None = 0
+        self.winner: int | None = None
+        if mode == "wall":
+            setattr(self, f"score_{1 - p1_side}", None)
+
+        self.frozen = False
+        self.paused = False
+        self.ended = False
+        self.next_round = False
+
+    @property
+    def max_players(self) -> int:
+        """Nombre de joueurs du mode"""
+        return 1 if self.mode == "wall" else 2
+
+    @property
+    def playing(self) -> bool:
+        """Vérifie que la partie soit en cours"""
+        return not (self.frozen or self.paused or self.ended)
@@ -1,6 +1,6 @@
 # ======================================== IMPORTS ========================================
 from __future__ import annotations
-from ...._core import ctx, pm, pygame
+from ...._core import ctx, pm, pygame, Trail
 import math
 import random
 
@@ -29,9 +29,8 @@ class BallObject(pm.entities.CircleEntity):
         self.border_around = True
 
         # Traînée       
-        self.trail = []
-        self.trail_timer = 0.0
         self.trail_length = 0.13
+        self.trail = Trail(self.trail_length)
 
         # Angle
         self.angle_min = math.radians(20)
@@ -48,10 +47,7 @@ class BallObject(pm.entities.CircleEntity):
         Actualisation de la frame
         """
         # Trainée
-        self.trail_timer += pm.time.dt
-        self.trail.append((self.trail_timer, self.centerx, self.centery))
-        while len(self.trail) > 0 and self.trail_timer - self.trail[0][0] > self.trail_length:
-            self.trail.pop(0)
+        self.trail.push(pm.time.dt, self.centerx, self.centery)
 
         # Déplacement
         celerity = pm.time.scale_value(self.celerity)
@@ -77,11 +73,11 @@ class BallObject(pm.entities.CircleEntity):
         current_pos = (self.centerx, self.centery)
         for i in range(num_segments):
             if i == num_segments - 1:
-                start_pos = self.trail[i][1:]
+                start_pos = self.trail[i]
                 end_pos = current_pos
             else:
-                start_pos = self.trail[i][1:]
-                end_pos = self.trail[i + 1][1:]
+                start_pos = self.trail[i]
+                end_pos = self.trail[i + 1]
 
             subdivisions = 5
             for j in range(subdivisions):
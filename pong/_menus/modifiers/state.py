@@ -53,6 +53,9 @@ class Modifiers(pm.states.State):
         self.add("color_ennemy", (183, 49, 44), category="paddle", add_prefix=True)                     # (color): couleur de la raquette d'un ennemi
         self.add("border_color_ennemy", (230, 59, 48), category="paddle", add_prefix=True)              # (color): couleur de la bordure d'un ennemi
 
+        # Catégorie: Bot
+        self.add("backend", "net", category="bot", sessions=["solo"], add_prefix=True, to_save=True)    # (str)  : moteur de prédiction du bot ("net" | "analytic")
+
         # Panel du menu
         self.menu = ModifiersMenuView()
 
@@ -0,0 +1,547 @@
+# ======================================== IMPORTS ========================================
+"""
+Banc de mesure de la pile d'entraînement et d'inférence des bots
+
+Lancement (sans affichage, CPU uniquement) :
+    python -m pong.bench [--out bench.json] [--scale 1.0] [--only env_step predict ...]
+"""
+from __future__ import annotations
+import os
+
+# Sans fenêtre, sans son, sans GPU : à fixer avant les imports de pygame / torch
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("MPLBACKEND", "Agg")
+os.environ["CUDA_VISIBLE_DEVICES"] = ""
+
+from contextlib import redirect_stdout
+from typing import Callable
+import argparse
+import io
+import json
+import math
+import platform
+import random
+import sys
+import tempfile
+import time
+import numpy as np
+import torch
+
+from ._version import __version__
+from ._game._sessions import _bot, _bot_dqn
+from ._game._sessions._numpy_net import NumpyRegressionNet
+from ._game._sessions._compiled import export_script, load_script
+from ._game._sessions._inference import InferenceServer, ServedAgent, ServedDQNAgent, serve_dqn, serve_regression
+from ._game._sim import MatchState, PaddleState, SimConfig, reset_round, step as sim_step, sweep_paddle
+
+# ======================================== CONSTANTES ========================================
+SEED = 0                        # (int): graine commune à toutes les mesures
+WARMUP = 20                     # (int): appels ignorés avant chaque mesure de latence
+
+# ======================================== UTILITAIRES ========================================
+def _seed(seed: int = SEED):
+    """Fixe toutes les graines (random, numpy, torch)"""
+    random.seed(seed)
+    np.random.seed(seed)
+    torch.manual_seed(seed)
+
+def _peak_rss_mb() -> float | None:
+    """
+    Renvoie le pic de mémoire résidente du processus depuis son lancement (cumulé sur toutes les mesures)
+
+    Returns:
+        Pic RSS en Mo, ou None si la plateforme ne l'expose pas
+    """
+    try:
+        import resource
+    except ImportError:
+        pass
+    else:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class _Counters(ctypes.Structure):
+            _fields_ = [
+                ("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t),
+            ]
+
+        counters = _Counters()
+        counters.cb = ctypes.sizeof(counters)
+        process = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+            return counters.PeakWorkingSetSize / (1024 * 1024)
+    except (AttributeError, OSError):
+        pass
+    return None
+
+def _measure(fn: Callable[[], object], calls: int, items: int = 1) -> dict:
+    """
+    Chronomètre chaque appel d'une fonction
+
+    Args:
+        fn (Callable): fonction mesurée
+        calls (int): nombre d'appels mesurés (après WARMUP appels ignorés)
+        items (int): éléments traités par appel (pas, échantillons...)
+
+    Returns:
+        Débit (éléments/s) et latences p50/p99 par appel en microsecondes
+    """
+    for _ in range(WARMUP):
+        fn()
+    latencies = np.empty(calls, dtype=np.float64)
+    clock = time.perf_counter_ns
+    for i in range(calls):
+        t = clock()
+        fn()
+        latencies[i] = clock() - t
+    total = float(latencies.sum()) * 1e-9
+    return {
+        "calls": calls,
+        "items_per_call": items,
+        "total_s": round(total, 6),
+        "items_per_s": round(calls * items / total, 1),
+        "p50_us": round(float(np.percentile(latencies, 50)) * 1e-3, 3),
+        "p99_us": round(float(np.percentile(latencies, 99)) * 1e-3, 3),
+    }
+
+def _quiet(fn: Callable, *args, **kwargs):
+    """Appelle une fonction en masquant ses impressions (chargement, journal d'épisode)"""
+    with redirect_stdout(io.StringIO()):
+        return fn(*args, **kwargs)
+
+def _make_bot(**kwargs) -> _bot.Bot:
+    """Crée un Bot de régression eager au LR initial, quel que soit l'état de la sauvegarde chargée"""
+    kwargs.setdefault("compiled", False)
+    kwargs.setdefault("seed", SEED)
+    bot = _quiet(_bot.Bot, **kwargs)
+    for group in bot.optimiser.param_groups:
+        group["lr"] = bot.lr_init
+    return bot
+
+def _make_dqn(**kwargs) -> _bot_dqn.Bot:
+    """Crée un Bot DQN eager dont les flux aléatoires dérivent de la graine commune"""
+    kwargs.setdefault("compiled", False)
+    kwargs.setdefault("seed", SEED)
+    return _quiet(_bot_dqn.Bot, **kwargs)
+
+def _compile(net: torch.nn.Module, in_dim: int) -> torch.jit.ScriptModule:
+    """Exporte un réseau en TorchScript dans un dossier temporaire et le recharge (avec échauffement)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = f"{tmp}/net.pth"
+        export_script(net, path, in_dim)
+        return load_script(path, net, in_dim)
+
+def _fill_regression(bot: _bot.Bot, n: int):
+    """Remplit le replay buffer de régression avec n échantillons aléatoires"""
+    rng = np.random.default_rng(SEED)
+    bot.buffer.push_batch(rng.random((n, 4), dtype=np.float32), rng.random(n, dtype=np.float32))
+
+def _fill_dqn(bot: _bot_dqn.Bot, n: int):
+    """Remplit le replay buffer DQN avec n transitions aléatoires"""
+    rng = np.random.default_rng(SEED)
+    bot.buffer.push_batch(
+        rng.random((n, 6), dtype=np.float32), rng.integers(0, 3, n),
+        rng.standard_normal(n, dtype=np.float32), rng.random((n, 6), dtype=np.float32),
+        (rng.random(n) < 0.01).astype(np.float32),
+    )
+
+def _reference_paddle_impact(
+    x0: float, y0: float, x1: float, y1: float, radius: float, paddle: PaddleState,
+) -> tuple[float, float, float, float] | None:
+    """Version précédente de sweep_paddle (boucles sur tuples et normale séparée), référence des mesures"""
+    if paddle.cooldown > 0:
+        return None
+    cx, cy = paddle.x, paddle.y
+    hw, hh = paddle.width / 2 + radius, paddle.height / 2 + radius
+    corner = min(paddle.border_radius, hw, hh)
+    ex, ey = x1 - x0, y1 - y0
+    best = None
+    for axis, face, lo, hi in (
+        (0, cx - hw, cy - hh + corner, cy + hh - corner),
+        (0, cx + hw, cy - hh + corner, cy + hh - corner),
+        (1, cy - hh, cx - hw + corner, cx + hw - corner),
+        (1, cy + hh, cx - hw + corner, cx + hw - corner),
+    ):
+        d, o, other_d, other_o = (ex, x0, ey, y0) if axis == 0 else (ey, y0, ex, x0)
+        if d == 0:
+            continue
+        t = (face - o) / d
+        if 0 <= t <= 1 and lo <= other_o + t * other_d <= hi and (best is None or t < best):
+            best = t
+    a = ex * ex + ey * ey
+    if corner > 0 and a > 0:
+        for sx in (-1, 1):
+            for sy in (-1, 1):
+                ox, oy = cx + sx * (hw - corner), cy + sy * (hh - corner)
+                fx, fy = x0 - ox, y0 - oy
+                b = fx * ex + fy * ey
+                disc = b * b - a * (fx * fx + fy * fy - corner * corner)
+                if disc < 0:
+                    continue
+                root = math.sqrt(disc)
+                for t in ((-b - root) / a, (-b + root) / a):
+                    if 0 <= t <= 1 and (best is None or t < best) and (fx + t * ex) * sx >= 0 and (fy + t * ey) * sy >= 0:
+                        best = t
+    if best is None:
+        return None
+    px, py = x0 + best * ex, y0 + best * ey
+    hw, hh = paddle.width / 2, paddle.height / 2
+    qx = min(max(px, cx - hw), cx + hw)
+    qy = min(max(py, cy - hh), cy + hh)
+    nx, ny = px - qx, py - qy
+    norm = math.hypot(nx, ny)
+    if norm > 0:
+        return px, py, nx / norm, ny / norm
+    if hw - abs(px - cx) <= hh - abs(py - cy):
+        return px, py, (1.0 if px >= cx else -1.0), 0.0
+    return px, py, 0.0, (1.0 if py >= cy else -1.0)
+
+def _paddle_segments(n: int) -> tuple[PaddleState, list[tuple[float, ...]]]:
+    """Raquette gauche par défaut et n déplacements de balle d'un pas à 240 Hz autour d'elle (contacts et ratés)"""
+    config = SimConfig()
+    paddle = PaddleState(0, config)
+    rng = np.random.default_rng(SEED)
+    x0 = paddle.x + rng.uniform(-35, 35, n)
+    y0 = paddle.y + rng.uniform(-85, 85, n)
+    angle = rng.uniform(-math.pi, math.pi, n)
+    length = rng.uniform(0, config.celerity_max / 240, n)
+    x1, y1 = x0 + length * np.cos(angle), y0 + length * np.sin(angle)
+    return paddle, list(zip(x0.tolist(), y0.tolist(), x1.tolist(), y1.tolist()))
+
+# ======================================== MESURES ========================================
+def bench_env_step(scale: float) -> dict:
+    """PongEnv.step (régression) avec actions aléatoires et reset en fin d'épisode"""
+    _seed()
+    env = _bot.PongEnv(seed=SEED)
+    env.reset()
+    actions = np.random.default_rng(SEED).integers(0, 3, 1 << 16).tolist()
+    i = 0
+
+    def step():
+        nonlocal i
+        i += 1
+        if env.step(actions[i & 0xFFFF])[2]:
+            env.reset()
+
+    return _measure(step, int(50_000 * scale))
+
+def bench_sim_step(scale: float) -> dict:
+    """Pas de simulation du jeu (_sim.step, 240 Hz) avec raquettes suivant la balle et nouveau point après chaque but"""
+    match = MatchState(seed=SEED)
+    reset_round(match)
+    paddles = match.paddles
+
+    def step():
+        ball_y = match.ball.y
+        inputs = tuple((ball_y > p.y) - (ball_y < p.y) for p in paddles)
+        sim_step(match, inputs, 1 / 240)
+        if match.next_round or match.ended:
+            match.next_round = match.ended = False
+            reset_round(match)
+
+    return _measure(step, int(100_000 * scale))
+
+def bench_paddle_sweep(scale: float, impact: Callable = sweep_paddle, n: int = 1000) -> dict:
+    """sweep_paddle (impact balle / raquette analytique) sur n déplacements, écart maximal à la version précédente"""
+    paddle, segments = _paddle_segments(n)
+    radius = SimConfig().ball_radius
+
+    def sweep():
+        for x0, y0, x1, y1 in segments:
+            impact(x0, y0, x1, y1, radius, paddle)
+
+    result = _measure(sweep, int(2_000 * scale), n)
+    error = 0.0
+    for x0, y0, x1, y1 in segments:
+        hit, ref = impact(x0, y0, x1, y1, radius, paddle), _reference_paddle_impact(x0, y0, x1, y1, radius, paddle)
+        if (hit is None) != (ref is None):
+            error = math.inf
+        elif hit is not None:
+            error = max(error, *(abs(u - v) for u, v in zip(hit, ref)))
+    result["hits"] = sum(_reference_paddle_impact(*segment, radius, paddle) is not None for segment in segments)
+    result["max_error"] = error
+    return result
+
+def bench_paddle_sweep_reference(scale: float) -> dict:
+    """Version précédente de sweep_paddle sur les mêmes déplacements (référence de bench_paddle_sweep)"""
+    return bench_paddle_sweep(scale, _reference_paddle_impact)
+
+def bench_vec_env_step(scale: float, n_envs: int = 1024) -> dict:
+    """VecPongEnv.step sur n_envs épisodes par appel"""
+    _seed()
+    env = _bot.VecPongEnv(n_envs, seed=SEED)
+    env.reset()
+    actions = np.random.default_rng(SEED).integers(0, 3, (64, n_envs))
+    i = 0
+
+    def step():
+        nonlocal i
+        i += 1
+        env.step(actions[i & 63])
+
+    return _measure(step, int(2_000 * scale), items=n_envs)
+
+def bench_replay_sample(scale: float) -> dict:
+    """ReplayBuffer.sample (régression) sur un buffer plein"""
+    _seed()
+    bot = _make_bot()
+    _fill_regression(bot, bot.buffer.capacity)
+    return _measure(lambda: bot.buffer.sample(bot.batch_size), int(20_000 * scale), items=bot.batch_size)
+
+def bench_dqn_replay_sample(scale: float) -> dict:
+    """ReplayBuffer.sample (DQN) sur un buffer plein"""
+    _seed()
+    bot = _make_dqn()
+    _fill_dqn(bot, bot.buffer.capacity)
+    return _measure(lambda: bot.buffer.sample(bot.batch_size), int(20_000 * scale), items=bot.batch_size)
+
+def bench_learn_steps(scale: float) -> dict:
+    """Bot._learn_steps (grad_steps passes de gradient) sur un buffer plein"""
+    _seed()
+    bot = _make_bot()
+    _fill_regression(bot, bot.buffer.capacity)
+    return _measure(bot._learn_steps, int(500 * scale), items=bot.grad_steps * bot.batch_size)
+
+def bench_predict(scale: float) -> dict:
+    """Bot._predict (réseau torch, un état)"""
+    _seed()
+    bot = _make_bot()
+    states = np.random.default_rng(SEED).random((256, 4)) * (1440.0, 1080.0, 1.0, 1.0)
+    states = states.tolist()
+    i = 0
+
+    def predict():
+        nonlocal i
+        i += 1
+        bot._predict(*states[i & 255])
+
+    return _measure(predict, int(5_000 * scale))
+
+def bench_predict_script(scale: float) -> dict:
+    """Bot._predict avec le module TorchScript figé (mêmes poids que bench_predict)"""
+    _seed()
+    bot = _make_bot()
+    bot.infer_net = _compile(bot.net, 4)
+    states = np.random.default_rng(SEED).random((256, 4)) * (1440.0, 1080.0, 1.0, 1.0)
+    states = states.tolist()
+    i = 0
+
+    def predict():
+        nonlocal i
+        i += 1
+        bot._predict(*states[i & 255])
+
+    return _measure(predict, int(5_000 * scale))
+
+def _bench_dqn_move(scale: float, compiled: bool) -> dict:
+    """Bot.get_move (DQN glouton), eager ou compilé"""
+    _seed()
+    bot = _make_dqn()
+    if compiled:
+        bot.infer_net = _compile(bot.net, 6)
+    states = np.random.default_rng(SEED).random((256, 5)) * (1080.0, 1440.0, 1080.0, 1.0, 1.0)
+    states = states.tolist()
+    i = 0
+
+    def move():
+        nonlocal i
+        i += 1
+        bot.get_move(*states[i & 255])
+
+    return _measure(move, int(5_000 * scale))
+
+def bench_dqn_move(scale: float) -> dict:
+    """Bot.get_move (DQN, réseau eager)"""
+    return _bench_dqn_move(scale, compiled=False)
+
+def bench_dqn_move_script(scale: float) -> dict:
+    """Bot.get_move (DQN, module TorchScript figé)"""
+    return _bench_dqn_move(scale, compiled=True)
+
+def bench_predict_numpy(scale: float) -> dict:
+    """NumpyRegressionNet.predict_one (mêmes poids que bench_predict, sans torch)"""
+    _seed()
+    bot = _make_bot()
+    net = NumpyRegressionNet({k: v.detach().cpu().numpy() for k, v in bot.net.state_dict().items()})
+    states = (np.random.default_rng(SEED).random((256, 4)) * bot.STATE_SCALE).astype(np.float32)
+    normalized = [bot._normalize(*s) for s in states]
+    i = 0
+
+    def predict():
+        nonlocal i
+        i += 1
+        net.predict_one(normalized[i & 255])
+
+    return _measure(predict, int(20_000 * scale))
+
+def _served_matches(scale: float, server: InferenceServer, agent_type: Callable, n_matches: int) -> dict:
+    """
+    Joue n_matches parties headless en parallèle, raquettes droites servies par un même serveur d'inférence
+
+    Args:
+        scale (float): facteur appliqué au nombre de ticks
+        server (InferenceServer): serveur partagé (mode tick, un flush par tick)
+        agent_type (Callable): agent servi créé pour chaque partie (ServedAgent | ServedDQNAgent)
+        n_matches (int): nombre de parties simultanées
+
+    Returns:
+        Mesure par tick (pas de toutes les parties) et statistiques du serveur
+    """
+    matches = [MatchState(seed=SEED + i) for i in range(n_matches)]
+    for match in matches:
+        reset_round(match)
+    agents = [agent_type(server) for _ in matches]
+
+    def tick():
+        futures = []
+        for match, agent in zip(matches, agents):
+            ball, right = match.ball, match.paddles[1]
+            futures.append(agent.get_move_async(right.y, ball.x, ball.y, ball.dx, ball.dy))
+        server.flush()
+        for match, future in zip(matches, futures):
+            ball_y, left = match.ball.y, match.paddles[0]
+            sim_step(match, ((ball_y > left.y) - (ball_y < left.y), future.result()), 1 / 240)
+            if match.next_round or match.ended:
+                match.next_round = match.ended = False
+                reset_round(match)
+
+    result = _measure(tick, int(2_000 * scale), items=n_matches)
+    result["server"] = server.stats()
+    return result
+
+def bench_served_matches(scale: float, n_matches: int = 64) -> dict:
+    """Parties headless dont le bot de régression passe par un InferenceServer partagé (ServedAgent)"""
+    _seed()
+    return _served_matches(scale, serve_regression(_make_bot().net), ServedAgent, n_matches)
+
+def bench_served_dqn_matches(scale: float, n_matches: int = 64) -> dict:
+    """Parties headless dont le bot DQN passe par un InferenceServer partagé (ServedDQNAgent)"""
+    _seed()
+    return _served_matches(scale, serve_dqn(_make_dqn().net), ServedDQNAgent, n_matches)
+
+def bench_dqn_learn_step(scale: float) -> dict:
+    """Bot._learn_step (DQN) sur un buffer plein"""
+    _seed()
+    bot = _make_dqn()
+    _fill_dqn(bot, bot.buffer.capacity)
+    return _measure(bot._learn_step, int(1_000 * scale), items=bot.batch_size)
+
+def bench_train_regression(scale: float) -> dict:
+    """Bout en bout : Bot.train_agent sur PongEnv"""
+    _seed()
+    bot = _make_bot()
+    n_episodes = max(1, int(5 * scale))
+    samples = bot.total_samples
+    t = time.perf_counter()
+    _quiet(bot.train_agent, _bot.PongEnv(seed=SEED), n_episodes)
+    elapsed = time.perf_counter() - t
+    return {
+        "episodes": n_episodes,
+        "total_s": round(elapsed, 6),
+        "episodes_per_s": round(n_episodes / elapsed, 3),
+        "samples_per_s": round((bot.total_samples - samples) / elapsed, 1),
+    }
+
+def bench_train_dqn(scale: float) -> dict:
+    """Bout en bout : Bot.train_agent (DQN) sur PongEnv"""
+    _seed()
+    bot = _make_dqn()
+    n_episodes = max(1, int(2 * scale))
+    steps = bot.total_steps
+    t = time.perf_counter()
+    _quiet(bot.train_agent, _bot_dqn.PongEnv(seed=SEED), n_episodes)
+    elapsed = time.perf_counter() - t
+    return {
+        "episodes": n_episodes,
+        "total_s": round(elapsed, 6),
+        "episodes_per_s": round(n_episodes / elapsed, 3),
+        "steps_per_s": round((bot.total_steps - steps) / elapsed, 1),
+    }
+
+BENCHES: dict[str, Callable[[float], dict]] = {
+    "env_step": bench_env_step,
+    "sim_step": bench_sim_step,
+    "paddle_sweep": bench_paddle_sweep,
+    "paddle_sweep_reference": bench_paddle_sweep_reference,
+    "vec_env_step": bench_vec_env_step,
+    "replay_sample": bench_replay_sample,
+    "dqn_replay_sample": bench_dqn_replay_sample,
+    "learn_steps": bench_learn_steps,
+    "predict": bench_predict,
+    "predict_script": bench_predict_script,
+    "predict_numpy": bench_predict_numpy,
+    "served_matches": bench_served_matches,
+    "served_dqn_matches": bench_served_dqn_matches,
+    "dqn_move": bench_dqn_move,
+    "dqn_move_script": bench_dqn_move_script,
+    "dqn_learn_step": bench_dqn_learn_step,
+    "train_regression": bench_train_regression,
+    "train_dqn": bench_train_dqn,
+}
+
+# ======================================== LANCEMENT ========================================
+def run(names: list[str] | None = None, scale: float = 1.0, threads: int = 1) -> dict:
+    """
+    Exécute les mesures demandées
+
+    Args:
+        names (list[str] | None): mesures à lancer (toutes par défaut)
+        scale (float): facteur appliqué au nombre d'appels de chaque mesure
+        threads (int): nombre de threads torch
+
+    Returns:
+        Rapport sérialisable en JSON
+    """
+    torch.set_num_threads(threads)
+    names = list(BENCHES) if not names else names
+    unknown = [name for name in names if name not in BENCHES]
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)}")
+
+    results = {}
+    for name in names:
+        result = BENCHES[name](scale)
+        results[name] = result
+        rate = result.get("items_per_s", result.get("episodes_per_s"))
+        latency = f" | p50 {result['p50_us']:>9.1f}us | p99 {result['p99_us']:>9.1f}us" if "p50_us" in result else ""
+        print(f"{name:<18} | {rate:>14,.1f}/s{latency}")
+
+    return {
+        "meta": {
+            "version": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "torch": torch.__version__,
+            "threads": threads,
+            "seed": SEED,
+            "scale": scale,
+        },
+        "results": results,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+def main(argv: list[str] | None = None):
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(prog="python -m pong.bench", description="Bot training / inference benchmarks")
+    parser.add_argument("--out", default="bench.json", help="JSON report path")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplier applied to every benchmark's call count")
+    parser.add_argument("--threads", type=int, default=1, help="torch intra-op threads")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHES), help="subset of benchmarks to run")
+    args = parser.parse_args(argv)
+
+    report = run(args.only, args.scale, args.threads)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+    print(f"Rapport -> {args.out}")
+
+if __name__ == "__main__":
+    main()
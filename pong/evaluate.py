@@ -0,0 +1,256 @@
+# ======================================== IMPORTS ========================================
+"""
+Évaluation parallèle de points de reprise sur une suite d'épisodes fixe et graînée
+
+Chaque sauvegarde est chargée en mode évaluation (réseau eager, sans exploration ni apprentissage)
+puis joue les mêmes épisodes PongEnv : l'épisode i utilise le i-ème enfant de SeedSequence(seed),
+quel que soit le découpage entre processus. Les résultats sont donc comparables d'une sauvegarde à l'autre.
+
+Lancement (sans affichage, CPU uniquement) :
+    python -m pong.evaluate pong/_data/bot.pth runs/bot_ep2000.pth --bot regression --episodes 2000
+    python -m pong.evaluate data/bot.pth --bot dqn --episodes 1000 --workers 4 --out eval.csv
+"""
+from __future__ import annotations
+import os
+
+# Sans fenêtre, sans son, sans GPU : à fixer avant les imports de pygame / torch
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("MPLBACKEND", "Agg")
+os.environ["CUDA_VISIBLE_DEVICES"] = ""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+import argparse
+import math
+import multiprocessing as mp
+import time
+import numpy as np
+
+from .sweep import BOTS, format_table, write_csv, init_worker
+
+# ======================================== CONSTANTES ========================================
+Z_95 = 1.959964                 # (float): quantile normal des intervalles de confiance à 95 %
+CHUNK = 50                      # (int): nombre d'épisodes par tâche de l'exécuteur
+
+# ======================================== STATISTIQUES ========================================
+def wilson_interval(successes: int, trials: int, z: float = Z_95) -> tuple[float, float]:
+    """
+    Intervalle de confiance de Wilson d'une proportion
+
+    Args:
+        successes (int): nombre de succès
+        trials (int): nombre d'essais
+        z (float): quantile normal
+
+    Returns:
+        Bornes (basse, haute) de l'intervalle
+    """
+    if trials == 0:
+        return 0.0, 1.0
+    p = successes / trials
+    denom = 1 + z * z / trials
+    center = (p + z * z / (2 * trials)) / denom
+    half = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denom
+    return center - half, center + half
+
+def mean_interval(values: np.ndarray, z: float = Z_95) -> tuple[float, float, float]:
+    """
+    Moyenne et intervalle de confiance normal (erreur standard de la moyenne)
+
+    Args:
+        values (np.ndarray): observations
+        z (float): quantile normal
+
+    Returns:
+        Tuple (moyenne, borne basse, borne haute)
+    """
+    if len(values) == 0:
+        return math.nan, math.nan, math.nan
+    mean = float(np.mean(values))
+    if len(values) < 2:
+        return mean, mean, mean
+    half = z * float(np.std(values, ddof=1)) / math.sqrt(len(values))
+    return mean, mean - half, mean + half
+
+# ======================================== EPISODES ========================================
+_BOTS: dict[tuple[str, str], object] = {}
+
+def _load(kind: str, path: str):
+    """Charge une sauvegarde en mode évaluation (une fois par processus)"""
+    key = (kind, path)
+    if key not in _BOTS:
+        bot_cls, _ = BOTS[kind]
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            bot = bot_cls(compiled=False, pretrained=False, seed=0)
+            bot.load(path)
+        bot.eval()
+        bot.is_training = False
+        _BOTS[key] = bot
+    return _BOTS[key]
+
+def play_eval_episode(bot, env) -> tuple[int, int, list[float], list[float], int]:
+    """
+    Joue un épisode glouton et relève chaque arrivée de la balle au niveau de la raquette
+
+    Args:
+        bot: Bot de régression ou DQN (get_move)
+        env (PongEnv): environnement déjà graîné
+
+    Returns:
+        Tuple (renvois, balles perdues, écarts raquette/balle à l'arrivée en px,
+        erreurs de prédiction en px (régression uniquement), frames jouées)
+    """
+    if hasattr(bot, "reset"):
+        bot.reset()
+    raw = env.reset()
+    done = False
+    hits, misses, frames = 0, 0, 0
+    arrival_errors: list[float] = []
+    prediction_errors: list[float] = []
+
+    while not done:
+        raw, reward, done = env.step(bot.get_move(*raw))
+        frames += 1
+        hit = reward >= 1.0
+        if hit or (done and reward <= -1.0):
+            hits += hit
+            misses += not hit
+            arrival_errors.append(abs(raw[2] - raw[0]))
+            target_y = getattr(bot, "target_y", None)
+            if target_y is not None:
+                prediction_errors.append(abs(raw[2] - target_y))
+    return hits, misses, arrival_errors, prediction_errors, frames
+
+def run_chunk(kind: str, path: str, seeds: list[np.random.SeedSequence]) -> dict:
+    """
+    Joue un lot d'épisodes de la suite (à exécuter dans un processus de l'exécuteur)
+
+    Args:
+        kind (str): "regression" | "dqn"
+        path (str): chemin absolu de la sauvegarde
+        seeds (list[SeedSequence]): graines des épisodes du lot
+
+    Returns:
+        Compteurs et observations brutes du lot
+    """
+    bot = _load(kind, path)
+    _, env_cls = BOTS[kind]
+    out = {"hits": 0, "misses": 0, "frames": 0, "scores": [], "arrival": [], "prediction": []}
+    start = time.perf_counter()
+    for seed in seeds:
+        hits, misses, arrival, prediction, frames = play_eval_episode(bot, env_cls(seed=seed))
+        out["hits"] += hits
+        out["misses"] += misses
+        out["frames"] += frames
+        out["scores"].append(hits)
+        out["arrival"].extend(arrival)
+        out["prediction"].extend(prediction)
+    out["seconds"] = time.perf_counter() - start
+    return out
+
+def summarize(path: str, chunks: list[dict], wall: float) -> dict:
+    """
+    Agrège les lots d'une sauvegarde en une ligne de résultats
+
+    Args:
+        path (str): sauvegarde évaluée
+        chunks (list[dict]): lots renvoyés par run_chunk
+        wall (float): durée réelle de l'évaluation de la sauvegarde en secondes
+
+    Returns:
+        Taux de renvoi, score par épisode, erreurs d'arrivée et de prédiction (avec IC 95 %), débit
+    """
+    hits = sum(c["hits"] for c in chunks)
+    misses = sum(c["misses"] for c in chunks)
+    scores = np.concatenate([np.asarray(c["scores"], dtype=np.float64) for c in chunks])
+    arrival = np.concatenate([np.asarray(c["arrival"], dtype=np.float64) for c in chunks])
+    prediction = np.concatenate([np.asarray(c["prediction"], dtype=np.float64) for c in chunks])
+
+    rate_lo, rate_hi = wilson_interval(hits, hits + misses)
+    score, score_lo, score_hi = mean_interval(scores)
+    arr, arr_lo, arr_hi = mean_interval(arrival)
+    pred, pred_lo, pred_hi = mean_interval(prediction)
+    return {
+        "checkpoint":       path,
+        "episodes":         len(scores),
+        "return_rate":      round(hits / max(hits + misses, 1), 4),
+        "return_rate_ci":   f"[{rate_lo:.4f}, {rate_hi:.4f}]",
+        "score":            round(score, 3),
+        "score_ci":         f"[{score_lo:.3f}, {score_hi:.3f}]",
+        "arrival_err_px":   round(arr, 2),
+        "arrival_err_ci":   f"[{arr_lo:.2f}, {arr_hi:.2f}]",
+        "pred_err_px":      round(pred, 2) if len(prediction) else None,
+        "pred_err_ci":      f"[{pred_lo:.2f}, {pred_hi:.2f}]" if len(prediction) else None,
+        "episodes_per_s":   round(len(scores) / wall, 1),
+        "frames_per_s":     round(sum(c["frames"] for c in chunks) / sum(c["seconds"] for c in chunks), 1),
+    }
+
+# ======================================== EVALUATION ========================================
+def evaluate(
+    kind: str,
+    paths: list[str],
+    n_episodes: int = 2000,
+    seed: int = 0,
+    workers: int | None = None,
+    threads: int = 1,
+    chunk: int = CHUNK,
+) -> list[dict]:
+    """
+    Évalue des sauvegardes sur la même suite d'épisodes, en parallèle
+
+    Args:
+        kind (str): "regression" | "dqn"
+        paths (list[str]): sauvegardes .pth à évaluer
+        n_episodes (int): nombre d'épisodes de la suite
+        seed (int): graine racine de la suite
+        workers (int | None): nombre de processus (nombre de cœurs par défaut)
+        threads (int): threads torch par processus
+        chunk (int): nombre d'épisodes par tâche
+
+    Returns:
+        Une ligne de résultats par sauvegarde, triées par taux de renvoi décroissant
+    """
+    paths = [os.path.abspath(path) for path in paths]
+    for path in paths:
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No checkpoint found at {path}")
+    suite = np.random.SeedSequence(seed).spawn(n_episodes)
+    batches = [suite[i:i + chunk] for i in range(0, n_episodes, chunk)]
+
+    ctx = mp.get_context("spawn")
+    workers = workers or max(1, (os.cpu_count() or 1) // threads)
+    results = []
+    with ProcessPoolExecutor(workers, mp_context=ctx, initializer=init_worker, initargs=(threads,)) as pool:
+        for path in paths:
+            start = time.perf_counter()
+            futures = [pool.submit(run_chunk, kind, path, batch) for batch in batches]
+            chunks = [future.result() for future in as_completed(futures)]
+            row = summarize(path, chunks, time.perf_counter() - start)
+            results.append(row)
+            print(f"[Eval] {os.path.basename(path)} | Return rate: {row['return_rate']:.2%} {row['return_rate_ci']} | "
+                  f"Arrival err: {row['arrival_err_px']:.1f}px | {row['episodes_per_s']:.0f} ep/s")
+    return sorted(results, key=lambda row: row["return_rate"], reverse=True)
+
+# ======================================== MAIN ========================================
+def main(argv: list[str] | None = None):
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(prog="python -m pong.evaluate", description="Evaluate bot checkpoints on a seeded episode suite")
+    parser.add_argument("checkpoints", nargs="+", help="checkpoint .pth files")
+    parser.add_argument("--bot", choices=list(BOTS), default="regression", help="bot type of the checkpoints")
+    parser.add_argument("--episodes", type=int, default=2000, help="episodes in the suite")
+    parser.add_argument("--seed", type=int, default=0, help="root seed of the suite")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count / threads)")
+    parser.add_argument("--threads", type=int, default=1, help="torch intra-op threads per worker")
+    parser.add_argument("--chunk", type=int, default=CHUNK, help="episodes per worker task")
+    parser.add_argument("--out", default="eval.csv", help="CSV results path")
+    args = parser.parse_args(argv)
+
+    print(f"[Eval] {args.bot} | {len(args.checkpoints)} checkpoint(s) | {args.episodes} episodes | seed {args.seed}")
+    results = evaluate(args.bot, args.checkpoints, args.episodes, args.seed, args.workers, args.threads, args.chunk)
+    print(format_table(results))
+    write_csv(results, args.out)
+    print(f"Résultats -> {args.out}")
+
+if __name__ == "__main__":
+    main()
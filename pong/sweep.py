@@ -0,0 +1,322 @@
+# ======================================== IMPORTS ========================================
+"""
+Recherche d'hyperparamètres parallèle pour l'entraînement des bots
+
+Chaque essai est un court train_agent sur un bot vierge, exécuté dans un processus d'un
+ProcessPoolExecutor dont les threads torch sont fixés. Les essais publient leur score à chaque
+palier (report_every épisodes) et s'arrêtent d'eux-mêmes s'ils sont nettement derrière les autres.
+
+Lancement (sans affichage, CPU uniquement) :
+    python -m pong.sweep --bot regression --search random --trials 16 --episodes 200 --workers 4
+    python -m pong.sweep --bot dqn --search grid --episodes 100 --out sweep.csv
+"""
+from __future__ import annotations
+import os
+
+# Sans fenêtre, sans son, sans GPU : à fixer avant les imports de pygame / torch
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("MPLBACKEND", "Agg")
+os.environ["CUDA_VISIBLE_DEVICES"] = ""
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout
+import argparse
+import csv
+import itertools
+import multiprocessing as mp
+import time
+import numpy as np
+import torch
+
+from ._game._sessions import _bot, _bot_dqn
+
+# ======================================== CONSTANTES ========================================
+WINDOW = 50                     # (int): nombre d'épisodes de la moyenne glissante du score final
+GRID_POINTS = 3                 # (int): nombre de valeurs d'un intervalle continu en recherche par grille
+
+# Espaces de recherche : liste = valeurs discrètes, tuple (min, max[, "log"]) = intervalle continu
+SPACES = {
+    "regression": {
+        "lr":             (1e-4, 3e-3, "log"),
+        "batch_size":     [32, 64, 128],
+        "grad_steps":     [1, 3, 5, 8],
+        "plateau_window": [50, 100, 200],
+    },
+    "dqn": {
+        "lr":                 (1e-4, 3e-3, "log"),
+        "batch_size":         [32, 64, 128],
+        "gamma":              [0.95, 0.98, 0.99, 0.995],
+        "target_update_freq": [250, 500, 1000],
+    },
+}
+
+BOTS = {
+    "regression": (_bot.Bot,     _bot.PongEnv),
+    "dqn":        (_bot_dqn.Bot, _bot_dqn.PongEnv),
+}
+
+# ======================================== ESPACE DE RECHERCHE ========================================
+def _grid_values(spec) -> list:
+    """Valeurs d'un paramètre en recherche par grille (intervalle continu découpé en GRID_POINTS)"""
+    if isinstance(spec, list):
+        return spec
+    lo, hi, *scale = spec
+    values = np.geomspace(lo, hi, GRID_POINTS) if scale == ["log"] else np.linspace(lo, hi, GRID_POINTS)
+    return [float(v) for v in values]
+
+def expand_grid(space: dict) -> list[dict]:
+    """
+    Produit cartésien de toutes les valeurs de l'espace
+
+    Args:
+        space (dict): espace de recherche {paramètre: valeurs | (min, max[, "log"])}
+
+    Returns:
+        Liste des combinaisons de paramètres
+    """
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(_grid_values(space[n]) for n in names))]
+
+def sample_random(space: dict, n_trials: int, seed: int = 0) -> list[dict]:
+    """
+    Tire des combinaisons au hasard (choix uniforme parmi une liste, uniforme ou log-uniforme sur un intervalle)
+
+    Args:
+        space (dict): espace de recherche
+        n_trials (int): nombre de combinaisons
+        seed (int): graine du tirage
+
+    Returns:
+        Liste des combinaisons de paramètres
+    """
+    rng = np.random.default_rng(seed)
+    trials = []
+    for _ in range(n_trials):
+        params = {}
+        for name, spec in space.items():
+            if isinstance(spec, list):
+                params[name] = spec[rng.integers(len(spec))]
+            else:
+                lo, hi, *scale = spec
+                if scale == ["log"]:
+                    params[name] = float(np.exp(rng.uniform(np.log(lo), np.log(hi))))
+                else:
+                    params[name] = float(rng.uniform(lo, hi))
+        trials.append(params)
+    return trials
+
+# ======================================== ESSAI ========================================
+class _FrameCounter:
+    """Enveloppe d'environnement qui compte les frames simulées"""
+    def __init__(self, env):
+        self.env = env
+        self.frames = 0
+
+    def __getattr__(self, name):
+        return getattr(self.env, name)
+
+    def reset(self):
+        return self.env.reset()
+
+    def step(self, action):
+        self.frames += 1
+        return self.env.step(action)
+
+def init_worker(threads: int):
+    """Initialisation d'un processus de l'exécuteur : threads torch fixés (pas de sursouscription)"""
+    torch.set_num_threads(threads)
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass
+
+def _should_prune(rungs, trial: int, rung: int, score: float, quantile: float, min_peers: int) -> bool:
+    """
+    Publie le score d'un essai à un palier et indique s'il est nettement derrière les autres
+
+    Args:
+        rungs: liste partagée des (essai, palier, score) publiés
+        trial (int): identifiant de l'essai
+        rung (int): indice du palier
+        score (float): score glissant de l'essai au palier
+        quantile (float): un essai sous ce quantile des scores des autres essais au même palier est arrêté
+        min_peers (int): nombre minimal d'autres essais au palier avant de pouvoir arrêter
+
+    Returns:
+        True si l'essai doit s'arrêter
+    """
+    rungs.append((trial, rung, score))
+    peers = [s for t, r, s in list(rungs) if r == rung and t != trial]
+    return len(peers) >= min_peers and score < float(np.quantile(peers, quantile))
+
+def run_trial(
+    kind: str,
+    trial: int,
+    params: dict,
+    n_episodes: int,
+    report_every: int,
+    seed: np.random.SeedSequence,
+    rungs=None,
+    prune_quantile: float = 0.25,
+    min_peers: int = 3,
+) -> dict:
+    """
+    Entraîne un bot vierge avec une combinaison de paramètres (à exécuter dans un processus de l'exécuteur)
+
+    Args:
+        kind (str): "regression" | "dqn"
+        trial (int): identifiant de l'essai
+        params (dict): hyperparamètres passés au constructeur du bot
+        n_episodes (int): nombre maximal d'épisodes
+        report_every (int): nombre d'épisodes entre deux paliers d'arrêt anticipé
+        seed (SeedSequence): graine de l'essai (flux du bot et de l'environnement dérivés par spawn)
+        rungs: liste partagée des paliers (None : pas d'arrêt anticipé)
+        prune_quantile (float): quantile sous lequel un essai est arrêté
+        min_peers (int): nombre minimal d'autres essais au palier avant de pouvoir arrêter
+
+    Returns:
+        Ligne de résultats (paramètres, statut, épisodes, score, erreur, frames/s, durée)
+    """
+    bot_cls, env_cls = BOTS[kind]
+    bot_seed, env_seed = seed.spawn(2)
+
+    status = "done"
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        bot = bot_cls(**params, compiled=False, pretrained=False, seed=bot_seed)
+        env = _FrameCounter(env_cls(seed=env_seed))
+        rung = 0
+        while bot.metrics.count < n_episodes:
+            bot.train_agent(env, min(report_every, n_episodes - bot.metrics.count))
+            score = bot.metrics.mean("score", WINDOW)
+            if rungs is not None and bot.metrics.count < n_episodes:
+                if _should_prune(rungs, trial, rung, score, prune_quantile, min_peers):
+                    status = "pruned"
+                    break
+            rung += 1
+    elapsed = time.perf_counter() - start
+
+    has_error = "error" in bot.metrics.fields
+    return {
+        "trial":        trial,
+        **params,
+        "status":       status,
+        "episodes":     bot.metrics.count,
+        "score":        round(bot.metrics.mean("score", WINDOW), 3),
+        "error_px":     round(bot.metrics.mean("error", WINDOW), 2) if has_error else None,
+        "frames_per_s": round(env.frames / elapsed, 1),
+        "seconds":      round(elapsed, 1),
+    }
+
+# ======================================== RECHERCHE ========================================
+def sweep(
+    kind: str,
+    trials: list[dict],
+    n_episodes: int = 200,
+    report_every: int = 25,
+    workers: int | None = None,
+    threads: int = 1,
+    seed: int = 0,
+    prune: bool = True,
+    prune_quantile: float = 0.25,
+    min_peers: int = 3,
+) -> list[dict]:
+    """
+    Exécute tous les essais en parallèle
+
+    Args:
+        kind (str): "regression" | "dqn"
+        trials (list[dict]): combinaisons de paramètres (expand_grid ou sample_random)
+        n_episodes (int): nombre maximal d'épisodes par essai
+        report_every (int): nombre d'épisodes entre deux paliers d'arrêt anticipé
+        workers (int | None): nombre de processus (nombre de cœurs par défaut)
+        threads (int): threads torch par processus
+        seed (int): graine racine (essai i : i-ème enfant de SeedSequence(seed))
+        prune (bool): active l'arrêt anticipé des essais nettement perdants
+        prune_quantile (float): quantile sous lequel un essai est arrêté à un palier
+        min_peers (int): nombre minimal d'autres essais au palier avant de pouvoir arrêter
+
+    Returns:
+        Lignes de résultats triées par score décroissant
+    """
+    ctx = mp.get_context("spawn")
+    workers = workers or max(1, (os.cpu_count() or 1) // threads)
+    results = []
+    with ctx.Manager() as manager, ProcessPoolExecutor(workers, mp_context=ctx, initializer=init_worker, initargs=(threads,)) as pool:
+        rungs = manager.list() if prune else None
+        futures = [
+            pool.submit(run_trial, kind, i, params, n_episodes, report_every, trial_seed, rungs, prune_quantile, min_peers)
+            for (i, params), trial_seed in zip(enumerate(trials), np.random.SeedSequence(seed).spawn(len(trials)))
+        ]
+        for future in as_completed(futures):
+            row = future.result()
+            results.append(row)
+            print(f"[{len(results):>3}/{len(trials)}] trial {row['trial']:>3} {row['status']:<6} | "
+                  f"Score: {row['score']:>7.2f} | {row['episodes']:>4} ep | {row['frames_per_s']:>8.0f} frames/s")
+    return sorted(results, key=lambda row: row["score"], reverse=True)
+
+def format_table(results: list[dict]) -> str:
+    """
+    Met en forme les résultats en tableau texte aligné
+
+    Args:
+        results (list[dict]): lignes renvoyées par sweep
+
+    Returns:
+        Tableau (une ligne d'en-tête puis une ligne par essai)
+    """
+    if not results:
+        return ""
+    columns = list(results[0])
+    cells = [[_fmt(row.get(col)) for col in columns] for row in results]
+    widths = [max(len(col), *(len(line[i]) for line in cells)) for i, col in enumerate(columns)]
+    lines = ["  ".join(col.rjust(w) for col, w in zip(columns, widths))]
+    lines += ["  ".join(cell.rjust(w) for cell, w in zip(line, widths)) for line in cells]
+    return "\n".join(lines)
+
+def _fmt(value) -> str:
+    """Formate une cellule du tableau"""
+    if value is None:
+        return "-"
+    if isinstance(value, float):
+        return f"{value:.0f}" if abs(value) >= 1e4 else f"{value:.4g}"
+    return str(value)
+
+def write_csv(results: list[dict], path: str):
+    """Écrit les résultats au format CSV"""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0]))
+        writer.writeheader()
+        writer.writerows(results)
+
+# ======================================== MAIN ========================================
+def main(argv: list[str] | None = None):
+    """Point d'entrée en ligne de commande"""
+    parser = argparse.ArgumentParser(prog="python -m pong.sweep", description="Parallel hyperparameter sweep for bot training")
+    parser.add_argument("--bot", choices=list(BOTS), default="regression", help="bot to tune")
+    parser.add_argument("--search", choices=["grid", "random"], default="random", help="search strategy")
+    parser.add_argument("--trials", type=int, default=16, help="number of random trials")
+    parser.add_argument("--episodes", type=int, default=200, help="maximum episodes per trial")
+    parser.add_argument("--report-every", type=int, default=25, help="episodes between early-termination checks")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count / threads)")
+    parser.add_argument("--threads", type=int, default=1, help="torch intra-op threads per worker")
+    parser.add_argument("--seed", type=int, default=0, help="base seed")
+    parser.add_argument("--no-prune", action="store_true", help="run every trial to completion")
+    parser.add_argument("--out", default="sweep.csv", help="CSV results path")
+    args = parser.parse_args(argv)
+
+    space = SPACES[args.bot]
+    trials = expand_grid(space) if args.search == "grid" else sample_random(space, args.trials, args.seed)
+    print(f"[Sweep] {args.bot} | {args.search} | {len(trials)} trial(s) | {args.episodes} ep max")
+
+    results = sweep(
+        args.bot, trials, args.episodes, args.report_every,
+        workers=args.workers, threads=args.threads, seed=args.seed, prune=not args.no_prune,
+    )
+    print(format_table(results))
+    write_csv(results, args.out)
+    print(f"Résultats -> {args.out}")
+
+if __name__ == "__main__":
+    main()
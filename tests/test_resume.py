@@ -0,0 +1,39 @@
+# ======================================== IMPORTS ========================================
+import pytest
+import torch
+
+from pong._game._sessions import _bot, _bot_dqn
+
+# ======================================== CONFIGURATIONS ========================================
+CASES = {
+    "regression": (_bot, dict(buffer_capacity=3, min_buffer_size=2)),
+    "dqn": (_bot_dqn, dict(buffer_capacity=300, min_buffer_size=64)),
+    "dqn_per": (_bot_dqn, dict(buffer_capacity=300, min_buffer_size=64, prioritized=True)),
+    "dqn_nstep": (_bot_dqn, dict(buffer_capacity=300, min_buffer_size=64, n_step=3, frame_skip=2)),
+}
+
+# ======================================== REPRISE EXACTE ========================================
+@pytest.mark.parametrize("case", list(CASES))
+def test_resume_matches_uninterrupted_run(case, tmp_path):
+    """N épisodes, sauvegarde, reprise puis M épisodes : mêmes poids que N + M épisodes d'affilée"""
+    module, kwargs = CASES[case]
+    path = str(tmp_path / "bot.pth")
+
+    def make(resume: bool = False):
+        return module.Bot(compiled=False, pretrained=False, resume=resume, seed=5, **kwargs)
+
+    uninterrupted = make()
+    env = module.PongEnv(seed=7)
+    uninterrupted.train_agent(env, 4)
+    uninterrupted.save(path)
+    # Le replay buffer a fait le tour : la reprise doit restaurer son ordre, pas seulement son contenu
+    assert uninterrupted.buffer.size == uninterrupted.buffer.capacity and uninterrupted.buffer.pos != 0
+    uninterrupted.train_agent(env, 3)
+
+    resumed = make(resume=True)
+    resumed.load(path)
+    resumed.train_agent(module.PongEnv(seed=123), 3)
+
+    assert resumed.episode_count == uninterrupted.episode_count
+    for name, tensor in uninterrupted.net.state_dict().items():
+        assert torch.equal(tensor, resumed.net.state_dict()[name]), name
@@ -0,0 +1,47 @@
+# ======================================== IMPORTS ========================================
+import numpy as np
+import pytest
+
+from pong._game._sessions import _bot, _bot_dqn
+
+# ======================================== CONSTANTES ========================================
+N_ENVS = 16                     # (int): épisodes simulés en parallèle
+N_STEPS = 50_000 // N_ENVS      # (int): steps vectorisés (environ 50k transitions au total)
+
+# ======================================== UTILITAIRES ========================================
+def _sync(env, state: np.ndarray):
+    """Réinitialise un PongEnv puis lui impose l'état initial tiré par VecPongEnv"""
+    env.reset()
+    env.p2_y, env.ball_x, env.ball_y, env.ball_dx, env.ball_dy = state.tolist()
+
+# ======================================== PARITE ========================================
+@pytest.mark.parametrize("module", [_bot, _bot_dqn], ids=["regression", "dqn"])
+def test_vec_env_matches_scalar_env(module):
+    """VecPongEnv reproduit PongEnv pas à pas (états, récompenses, fins d'épisode), bruit de rebond désactivé"""
+    class Env(module.PongEnv):
+        BALL_BOUNCING_EPSILON = 0
+
+    class VecEnv(module.VecPongEnv):
+        BALL_BOUNCING_EPSILON = 0
+
+    vec = VecEnv(N_ENVS, seed=0)
+    states = vec.reset()
+    envs = [Env(seed=i) for i in range(N_ENVS)]
+    for env, state in zip(envs, states):
+        _sync(env, state)
+
+    actions = np.random.default_rng(0).integers(-1, 2, (N_STEPS, N_ENVS))
+    n_done = 0
+    for step_actions in actions:
+        states, rewards, dones = vec.step(step_actions)
+        for i, (env, action) in enumerate(zip(envs, step_actions.tolist())):
+            state, reward, done = env.step(action)
+            assert done == dones[i]
+            assert reward == pytest.approx(rewards[i], abs=1e-9)
+            expected = vec.final_states[i] if done else states[i]
+            np.testing.assert_allclose(state, expected, rtol=1e-9, atol=1e-6)
+            if done:
+                n_done += 1
+                _sync(env, states[i])
+    # Les fins d'épisode (balle perdue) sont bien couvertes
+    assert n_done > N_ENVS